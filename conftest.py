@@ -24,6 +24,7 @@ pytest_plugins = [
     'pytest_plugins.video_cleanup',
     'pytest_plugins.jira_comments',
     'pytest_plugins.capsule_n-minus',
+    'pytest_plugins.duration_scheduler',
     # Fixtures
     'pytest_fixtures.core.broker',
     'pytest_fixtures.core.sat_cap_factory',
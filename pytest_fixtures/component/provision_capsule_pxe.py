@@ -228,13 +228,7 @@ def capsule_provisioning_rhel_content(
                 rh_repos.append(rh_repo)
                 content_view.repository.append(rh_repo)
                 content_view.update(['repository'])
-    for task in tasks:
-        sat.wait_for_tasks(
-            search_query=(f'id = {task["id"]}'),
-            poll_timeout=2500,
-        )
-        task_status = sat.api.ForemanTask(id=task['id']).poll()
-        assert task_status['result'] == 'success'
+    sat.task_watcher.wait(tasks, timeout=2500)
     rhel_xy = Version(
         constants.REPOS['kickstart'][f'rhel{rhel_ver}']['version']
         if rhel_ver == 7
@@ -199,7 +199,15 @@ def repos_collection(request, target_sat):
 
 
 @pytest.fixture(scope='module')
-def module_repos_collection_with_setup(request, module_target_sat, module_org, module_lce):
+def module_content_setup_runs(module_target_sat):
+    """Pipelined content setups shared by the identical repository collections of a module"""
+    return module_target_sat.cli_factory.ContentSetupRuns()
+
+
+@pytest.fixture(scope='module')
+def module_repos_collection_with_setup(
+    request, module_target_sat, module_org, module_lce, module_content_setup_runs
+):
     """This fixture and its usage is very similar to repos_collection fixture above with extra
     setup_content capabilities using module_org and module_lce fixtures
 
@@ -218,13 +226,15 @@ def module_repos_collection_with_setup(request, module_target_sat, module_org, m
             for repo_name, repo_params in repo.items()
         ],
     )
-    _repos_collection.setup_content(module_org.id, module_lce.id)
+    _repos_collection.setup_content(
+        module_org.id, module_lce.id, shared_runs=module_content_setup_runs
+    )
     return _repos_collection
 
 
 @pytest.fixture(scope='module')
 def module_repos_collection_with_manifest(
-    request, module_target_sat, module_sca_manifest_org, module_lce
+    request, module_target_sat, module_sca_manifest_org, module_lce, module_content_setup_runs
 ):
     """This fixture and its usage is very similar to repos_collection fixture above with extra
     setup_content and uploaded manifest capabilities using module_org and module_lce fixtures
@@ -243,7 +253,9 @@ def module_repos_collection_with_manifest(
             for repo_name, repo_params in repo.items()
         ],
     )
-    _repos_collection.setup_content(module_sca_manifest_org.id, module_lce.id)
+    _repos_collection.setup_content(
+        module_sca_manifest_org.id, module_lce.id, shared_runs=module_content_setup_runs
+    )
     return _repos_collection
 
 
@@ -5,36 +5,218 @@ The functions in this module are read in the pytest_plugins/fixture_markers.py m
 All functions in this module will be treated as fixtures that apply the contenthost mark
 """
 
+from contextlib import contextmanager
+from functools import partial
+import math
+import os
+
 from broker import Broker
 import pytest
 
 from robottelo import constants
 from robottelo.config import settings
 from robottelo.hosts import ContentHost, Satellite
+from robottelo.logging import logger
+from robottelo.utils.host_pool import HostPool
+
+# the fixtures parametrized by pytest_plugins.fixture_markers served by the content host pools,
+# with the number of hosts they check out and whether they always use VMs
+POOLED_FIXTURES = {
+    'rhel_contenthost': (1, False),
+    'module_rhel_contenthost': (1, False),
+    'content_hosts': (2, False),
+    'rex_contenthost': (1, True),
+    'rex_contenthosts': (2, True),
+}
+# the HostPool of each (distro, rhel_version, 'container' or 'vm') key
+contenthost_pools = {}
+# the number of tests each reusable content host was given to, and its state before the first one
+contenthost_reuses = {}
+
+
+def _deploy_conf(distro, rhel_version, no_containers):
+    """Return the kind of host, container or vm, and the Broker arguments to deploy it"""
+    confs = settings.content_host.get(f'{distro}{rhel_version}').to_dict()
+    # if we're not using containers or a container isn't available, use a VM
+    if not no_containers and confs.get('container'):
+        return 'container', confs['container']
+    return 'vm', confs.get('vm', {})
 
 
-def host_conf(request):
-    """A function that returns arguments for Broker host deployment"""
-    conf = params = {}
-    if hasattr(request, 'param'):
-        params = request.param
+def _requested_host(params, no_containers):
+    """Return the pool key and the Broker arguments of a host requested with ``params``"""
     distro = params.get('distro', 'rhel')
-    _rhelver = f"{distro}{params.get('rhel_version', settings.content_host.default_rhel_version)}"
+    rhel_version = params.get('rhel_version', settings.content_host.default_rhel_version)
+    kind, deploy_kwargs = _deploy_conf(
+        distro, rhel_version, no_containers or params.get('no_containers')
+    )
+    return (distro, str(rhel_version), kind), dict(deploy_kwargs)
+
+
+def _fixture_host(request):
+    """Return the pool key and the Broker arguments of the host requested by a fixture"""
     # check to see if no-containers is passed as an argument to pytest
-    deploy_kwargs = {}
-    if not any(
+    no_containers = any(
         [
             request.config.getoption('no_containers'),
-            params.get('no_containers'),
             request.node.get_closest_marker('no_containers'),
         ]
+    )
+    return _requested_host(getattr(request, 'param', {}), no_containers)
+
+
+def host_conf(request):
+    """A function that returns arguments for Broker host deployment"""
+    return _fixture_host(request)[1]
+
+
+def _checkout(deploy_kwargs):
+    return Broker(**deploy_kwargs, host_class=ContentHost).checkout()
+
+
+def _checkin(host):
+    Broker(hosts=[host]).checkin()
+
+
+def _reuse_requested(request):
+    """Whether the test of a fixture lets its content hosts be reset and given to another test"""
+    return (
+        settings.performance.contenthost_max_reuses > 0
+        and request.scope == 'function'
+        and request.node.get_closest_marker('reuse_contenthost') is not None
+    )
+
+
+def _reusable(request):
+    """Whether the hosts of a fixture can be reset and given to another test"""
+    return (
+        _reuse_requested(request)
+        and getattr(request.node, 'report_setup', None) is not None
+        and request.node.report_setup.passed
+        and getattr(request.node, 'report_call', None) is not None
+        and request.node.report_call.passed
+    )
+
+
+def _recycle(host, pool):
+    """Reset a torn down host and give it back to the pool, return whether it was"""
+    reuse = contenthost_reuses.get(host.hostname)
+    if reuse is None or reuse['uses'] > settings.performance.contenthost_max_reuses:
+        return False
+    try:
+        host.reset(reuse['state'])
+    except Exception as err:
+        logger.warning(f'Not reusing content host {host.hostname}: {err}')
+        return False
+    pool.put(host)
+    return True
+
+
+@contextmanager
+def _contenthost(request, **broker_args):
+    """Check content hosts out like ``Broker(**host_conf(request), **broker_args)``
+
+    The hosts are taken from the content host pool of the requested host when there is one.
+    With ``performance.contenthost_max_reuses``, the hosts of a passed test marked with
+    ``reuse_contenthost`` are reset and given back to the pool instead of being checked in.
+    """
+    key, deploy_kwargs = _fixture_host(request)
+    pool = contenthost_pools.get(key)
+    if (
+        pool is None
+        and settings.performance.contenthost_max_reuses
+        and not set(broker_args) - {'_count'}
     ):
-        deploy_kwargs = settings.content_host.get(_rhelver).to_dict().get('container', {})
-    # if we're not using containers or a container isn't available, use a VM
-    if not deploy_kwargs:
-        deploy_kwargs = settings.content_host.get(_rhelver).to_dict().get('vm', {})
-    conf.update(deploy_kwargs)
-    return conf
+        pool = contenthost_pools[key] = HostPool(
+            partial(_checkout, deploy_kwargs),
+            _checkin,
+            0,
+            settings.performance.contenthost_pool_size,
+        )
+    if pool is None or set(broker_args) - {'_count'}:
+        with Broker(**deploy_kwargs, host_class=ContentHost, **broker_args) as hosts:
+            yield hosts
+        return
+    hosts = []
+    try:
+        for _ in range(broker_args.get('_count', 1)):
+            host = pool.get()
+            hosts.append(host)
+            host.setup()
+            if _reuse_requested(request):
+                reuse = contenthost_reuses.setdefault(host.hostname, {'uses': 0})
+                reuse['uses'] += 1
+                if 'state' not in reuse:
+                    reuse['state'] = host.save_system_state()
+        yield hosts if '_count' in broker_args else hosts[0]
+    finally:
+        reusable = _reusable(request)
+        used = []
+        for host in hosts:
+            try:
+                host.teardown()
+            except Exception as err:
+                logger.warning(f'Failed to tear down {host.hostname}: {err}')
+                used.append(host)
+                continue
+            if not (reusable and _recycle(host, pool)):
+                used.append(host)
+        for host in used:
+            contenthost_reuses.pop(host.hostname, None)
+        if used:
+            Broker(hosts=used).checkin()
+
+
+def _contenthost_demand(items, config):
+    """Return the number of hosts of each pool key the collected tests are expected to use
+
+    Tests sharing a module scoped fixture share its hosts. Under xdist, each worker is expected
+    to run its share of the tests.
+    """
+    demands = {}
+    for item in items:
+        params = getattr(getattr(item, 'callspec', None), 'params', {})
+        for name, (count, vm_only) in POOLED_FIXTURES.items():
+            if not isinstance(params.get(name), dict):
+                continue
+            no_containers = vm_only or any(
+                [config.getoption('no_containers'), item.get_closest_marker('no_containers')]
+            )
+            try:
+                key = _requested_host(params[name], no_containers)[0]
+            except AttributeError:
+                # no content_host settings for this version, the fixture fails on its own
+                continue
+            scope = item._fixtureinfo.name2fixturedefs[name][-1].scope
+            user = item.nodeid.split('::')[0] if scope == 'module' else item.nodeid
+            demands.setdefault(key, {})[(name, user)] = count
+    workers = int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 1))
+    return {key: math.ceil(sum(users.values()) / workers) for key, users in demands.items()}
+
+
+def pytest_collection_finish(session):
+    """Start checking out the content hosts of the collected tests, see contenthost_pool_size"""
+    size = settings.performance.contenthost_pool_size
+    if not size or session.config.option.collectonly:
+        return
+    for key, demand in _contenthost_demand(session.items, session.config).items():
+        distro, rhel_version, kind = key
+        deploy_kwargs = _deploy_conf(distro, rhel_version, kind == 'vm')[1]
+        logger.info(f'Checking out up to {size} of {demand} {key} content hosts ahead')
+        contenthost_pools[key] = HostPool(
+            partial(_checkout, deploy_kwargs),
+            _checkin,
+            demand,
+            size,
+        )
+
+
+def pytest_sessionfinish(session):
+    """Check the unused content hosts in and report the waits of the content host pools"""
+    while contenthost_pools:
+        key, pool = contenthost_pools.popitem()
+        pool.close()
+        logger.info(f'Content host pool {key}: {pool.stats()}')
 
 
 @pytest.fixture
@@ -42,7 +224,7 @@ def rhel_contenthost(request):
     """A function-level fixture that provides a content host object parametrized"""
     # Request should be parametrized through pytest_fixtures.fixture_markers
     # unpack params dict
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         yield host
 
 
@@ -51,63 +233,63 @@ def module_rhel_contenthost(request):
     """A module-level fixture that provides a content host object parametrized"""
     # Request should be parametrized through pytest_fixtures.fixture_markers
     # unpack params dict
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         yield host
 
 
 @pytest.fixture(params=[{'rhel_version': '7'}])
 def rhel7_contenthost(request):
     """A function-level fixture that provides a rhel7 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         yield host
 
 
 @pytest.fixture(scope="class", params=[{'rhel_version': '7'}])
 def rhel7_contenthost_class(request):
     """A fixture for use with unittest classes. Provides a rhel7 Content Host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         yield host
 
 
 @pytest.fixture(scope='module', params=[{'rhel_version': '7'}])
 def rhel7_contenthost_module(request):
     """A module-level fixture that provides a rhel7 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         yield host
 
 
 @pytest.fixture(params=[{'rhel_version': '8'}])
 def rhel8_contenthost(request):
     """A fixture that provides a rhel8 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         yield host
 
 
 @pytest.fixture(scope='module', params=[{'rhel_version': '8'}])
 def rhel8_contenthost_module(request):
     """A module-level fixture that provides a rhel8 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         yield host
 
 
 @pytest.fixture(params=[{'rhel_version': 6}])
 def rhel6_contenthost(request):
     """A function-level fixture that provides a rhel6 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         yield host
 
 
 @pytest.fixture(params=[{'rhel_version': '9'}])
 def rhel9_contenthost(request):
     """A fixture that provides a rhel9 content host object"""
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         yield host
 
 
 @pytest.fixture
 def content_hosts(request):
     """A function-level fixture that provides two rhel content hosts object"""
-    with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
+    with _contenthost(request, _count=2) as hosts:
         hosts[0].set_infrastructure_type('physical')
         yield hosts
 
@@ -115,7 +297,7 @@ def content_hosts(request):
 @pytest.fixture(scope='module')
 def mod_content_hosts(request):
     """A module-level fixture that provides two rhel7 content hosts object"""
-    with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
+    with _contenthost(request, _count=2) as hosts:
         hosts[0].set_infrastructure_type('physical')
         yield hosts
 
@@ -123,7 +305,7 @@ def mod_content_hosts(request):
 @pytest.fixture
 def registered_hosts(request, target_sat, module_org, module_ak_with_cv):
     """Fixture that registers content hosts to Satellite, based on rh_cloud setup"""
-    with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
+    with _contenthost(request, _count=2) as hosts:
         for vm in hosts:
             repo = settings.repos['SATCLIENT_REPO'][f'RHEL{vm.os_version.major}']
             vm.register(module_org, None, module_ak_with_cv.name, target_sat, repo=repo)
@@ -165,7 +347,7 @@ def cockpit_host(class_target_sat, class_org, rhel_contenthost):
 @pytest.fixture
 def rex_contenthost(request, module_org, target_sat, module_ak_with_cv):
     request.param['no_containers'] = True
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         repo = settings.repos['SATCLIENT_REPO'][f'RHEL{host.os_version.major}']
         host.register(module_org, None, module_ak_with_cv.name, target_sat, repo=repo)
         yield host
@@ -174,7 +356,7 @@ def rex_contenthost(request, module_org, target_sat, module_ak_with_cv):
 @pytest.fixture
 def rex_contenthosts(request, module_org, target_sat, module_ak_with_cv):
     request.param['no_containers'] = True
-    with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
+    with _contenthost(request, _count=2) as hosts:
         for host in hosts:
             repo = settings.repos['SATCLIENT_REPO'][f'RHEL{host.os_version.major}']
             host.register(module_org, None, module_ak_with_cv.name, target_sat, repo=repo)
@@ -205,7 +387,7 @@ def module_container_contenthost(request, module_target_sat):
         "distro": "rhel",
         "no_containers": True,
     }
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         host.register_to_cdn()
         # needed for docker commands to accept Satellite's cert
         host.install_katello_ca(module_target_sat)
@@ -226,7 +408,7 @@ def centos_host(request, version):
         "distro": "centos",
         "no_containers": True,
     }
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         yield host
 
 
@@ -237,7 +419,7 @@ def oracle_host(request, version):
         "distro": "oracle",
         "no_containers": True,
     }
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
+    with _contenthost(request) as host:
         yield host
 
 
@@ -1,5 +1,10 @@
+import ast
 from contextlib import contextmanager
 from functools import lru_cache
+import inspect
+import math
+import os
+import textwrap
 
 from broker import Broker
 from packaging.version import Version
@@ -15,6 +20,8 @@ from robottelo.hosts import (
     lru_sat_ready_rhel,
 )
 from robottelo.logging import logger
+from robottelo.utils import apidoc_cache
+from robottelo.utils.host_pool import HostPool
 from robottelo.utils.installer import InstallerCommand
 
 
@@ -27,6 +34,81 @@ def resolve_deploy_args(args_dict):
     return args_dict
 
 
+@lru_cache
+def _uses_factory_pool(func, factory_name):
+    """Return whether the calls of a fixture or test to a factory can be served by its pool
+
+    Calls with a workflow or broker arguments, like a custom deploy flavor, check a host out of
+    their own. A function whose source cannot be read is assumed to use the pool.
+    """
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    except (OSError, TypeError, SyntaxError):
+        return True
+    return all(
+        len(node.args) <= 2 and all(kw.arg in ('retry_limit', 'delay') for kw in node.keywords)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == factory_name
+    )
+
+
+def _factory_demand(request, factory_name):
+    """Return the number of hosts the collected tests are expected to get from a factory
+
+    Tests sharing a module or session scoped fixture using the factory share its host, fixtures
+    and tests calling it with broker arguments are not counted. Under xdist, each worker is
+    expected to run its share of the tests: the scheduling is not known at session start, so a
+    worker which ends up running fewer of them checks the rest in unused at session end.
+    """
+    if 'sanity' in request.config.option.markexpr:
+        return 0
+    demands = set()
+    for item in request.session.items:
+        if not item.get_closest_marker('factory_instance') or factory_name not in item.fixturenames:
+            continue
+        if factory_name in item._fixtureinfo.argnames and _uses_factory_pool(
+            item.function, factory_name
+        ):
+            demands.add(('', item.nodeid))
+        for name, fixturedefs in item._fixtureinfo.name2fixturedefs.items():
+            if factory_name not in fixturedefs[-1].argnames or not _uses_factory_pool(
+                fixturedefs[-1].func, factory_name
+            ):
+                continue
+            scope = fixturedefs[-1].scope
+            if scope == 'module':
+                demands.add((name, item.nodeid.split('::')[0]))
+            elif scope == 'class':
+                demands.add((name, item.nodeid.rsplit('::', 1)[0]))
+            elif scope in ('package', 'session'):
+                demands.add((name, scope))
+            else:
+                demands.add((name, item.nodeid))
+    workers = int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 1))
+    return math.ceil(len(demands) / workers)
+
+
+def _factory_pool(request, factory_name, checkout):
+    """Return a pool checking hosts out ahead for a factory, None if it is disabled"""
+    size = settings.performance.factory_pool_size
+    demand = _factory_demand(request, factory_name) if size else 0
+    if not demand:
+        return None
+    logger.info(f'Checking out up to {size} of {demand} hosts ahead for {factory_name}')
+    return HostPool(checkout, lambda host: Broker(hosts=[host]).checkin(), demand, size)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def prefetch_factory_hosts(request):
+    """Start checking out the hosts of satellite_factory and capsule_factory at session start"""
+    if settings.performance.factory_pool_size:
+        for factory_name in ('satellite_factory', 'capsule_factory'):
+            if _factory_demand(request, factory_name):
+                request.getfixturevalue(factory_name)
+
+
 @contextmanager
 def _target_satellite_host(request, satellite_factory):
     if 'sanity' not in request.config.option.markexpr:
@@ -66,14 +148,14 @@ def _target_capsule_host(request, capsule_factory):
 
 
 @pytest.fixture(scope='session')
-def satellite_factory():
+def satellite_factory(request):
     if settings.server.get('deploy_arguments'):
         logger.debug(f'Original deploy arguments for sat: {settings.server.deploy_arguments}')
         resolved = resolve_deploy_args(settings.server.deploy_arguments)
         settings.set('server.deploy_arguments', resolved)
         logger.debug(f'Resolved deploy arguments for sat: {settings.server.deploy_arguments}')
 
-    def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
+    def checkout(retry_limit=3, delay=300, workflow=None, **broker_args):
         if settings.server.deploy_arguments:
             broker_args.update(settings.server.deploy_arguments)
             logger.debug(f'Updated broker args for sat: {broker_args}')
@@ -85,9 +167,19 @@ def satellite_factory():
         )
         timeout = (1200 + delay) * retry_limit
         sat = wait_for(vmb.checkout, timeout=timeout, delay=delay, fail_condition=[])
+        apidoc_cache.warm_up(sat.out)
         return sat.out
 
-    return factory
+    pool = _factory_pool(request, 'satellite_factory', checkout)
+
+    def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
+        if pool and workflow is None and not broker_args:
+            return pool.get()
+        return checkout(retry_limit, delay, workflow, **broker_args)
+
+    yield factory
+    if pool:
+        pool.close()
 
 
 @pytest.fixture
@@ -100,14 +192,14 @@ def large_capsule_host(capsule_factory):
 
 
 @pytest.fixture(scope='session')
-def capsule_factory():
+def capsule_factory(request):
     if settings.capsule.get('deploy_arguments'):
         logger.debug(f'Original deploy arguments for cap: {settings.capsule.deploy_arguments}')
         resolved = resolve_deploy_args(settings.capsule.deploy_arguments)
         settings.set('capsule.deploy_arguments', resolved)
         logger.debug(f'Resolved deploy arguments for cap: {settings.capsule.deploy_arguments}')
 
-    def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
+    def checkout(retry_limit=3, delay=300, workflow=None, **broker_args):
         if settings.capsule.deploy_arguments:
             broker_args.update(settings.capsule.deploy_arguments)
         vmb = Broker(
@@ -119,7 +211,20 @@ def capsule_factory():
         cap = wait_for(vmb.checkout, timeout=timeout, delay=delay, fail_condition=[])
         return cap.out
 
-    return factory
+    pool = (
+        None
+        if request.config.option.n_minus
+        else _factory_pool(request, 'capsule_factory', checkout)
+    )
+
+    def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
+        if pool and workflow is None and not broker_args:
+            return pool.get()
+        return checkout(retry_limit, delay, workflow, **broker_args)
+
+    yield factory
+    if pool:
+        pool.close()
 
 
 @pytest.fixture
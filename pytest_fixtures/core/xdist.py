@@ -1,6 +1,7 @@
 """Fixtures specific to or relating to pytest's xdist plugin"""
 
 import random
+import time
 
 from broker import Broker
 import pytest
@@ -8,6 +9,75 @@ import pytest
 from robottelo.config import configure_airgun, configure_nailgun, settings
 from robottelo.hosts import Satellite
 from robottelo.logging import logger
+from robottelo.utils import apidoc_cache
+from robottelo.utils.satellite_scheduler import SatelliteScheduler
+
+satellite_scheduler = pytest.StashKey[SatelliteScheduler]()
+# the module being run by the worker, when it started, its number of tests, and whether a
+# session scoped fixture pins the worker to its Satellite
+module_lease = pytest.StashKey[dict]()
+
+# fixtures that depend on the Satellite but are computed again when the worker moves
+_MOVABLE_FIXTURES = ('align_to_satellite', '_default_sat')
+
+
+def _pins_satellite(item):
+    """Whether the item uses a session or package scoped fixture depending on the Satellite"""
+    name2fixturedefs = item._fixtureinfo.name2fixturedefs
+    depends = {}
+
+    def depends_on_satellite(name):
+        if name not in depends:
+            depends[name] = False
+            fixturedef = name2fixturedefs[name][-1]
+            depends[name] = name == '_default_sat' or any(
+                depends_on_satellite(arg) for arg in fixturedef.argnames if arg in name2fixturedefs
+            )
+        return depends[name]
+
+    return any(
+        fixturedefs[-1].scope in ('session', 'package')
+        and name not in _MOVABLE_FIXTURES
+        and depends_on_satellite(name)
+        for name, fixturedefs in name2fixturedefs.items()
+    )
+
+
+def _use_satellite(hostname):
+    """Point the settings, nailgun and airgun to a Satellite"""
+    settings.set("server.hostname", hostname)
+    configure_airgun()
+    configure_nailgun()
+    apidoc_cache.warm_up(Satellite(hostname))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Renew the Satellite lease of the worker when it starts a test module
+
+    With the load-balance xdist behavior, the worker moves to a less loaded Satellite unless a
+    session scoped fixture already set up uses its current one.
+    """
+    scheduler = item.config.stash.get(satellite_scheduler, None)
+    if scheduler is None:
+        return
+    lease = item.config.stash.setdefault(module_lease, {'module': None, 'pinned': False})
+    if item.module is not lease['module']:
+        if lease['module'] is not None:
+            hostname = scheduler.renew(
+                tests=lease['tests'],
+                duration=time.monotonic() - lease['start'],
+                may_move=not lease['pinned'],
+            )
+            if hostname != settings.server.hostname:
+                _use_satellite(hostname)
+                # tear _default_sat down, it returns the Satellite of the previous hostname
+                fixturedefs = item._fixtureinfo.name2fixturedefs.get('_default_sat')
+                if fixturedefs:
+                    fixturedefs[-1].finish(item._request)
+        lease.update(module=item.module, start=time.monotonic(), tests=0)
+    lease['tests'] += 1
+    lease['pinned'] = lease['pinned'] or _pins_satellite(item)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -44,6 +114,10 @@ def align_to_satellite(request, worker_id, satellite_factory):
         # attempt to align a worker to a satellite
         if settings.server.xdist_behavior == 'run-on-one' and settings.server.hostnames:
             settings.set("server.hostname", settings.server.hostnames[0])
+        elif settings.server.xdist_behavior == 'load-balance' and settings.server.hostnames:
+            scheduler = SatelliteScheduler(settings.server.hostnames, worker_id)
+            request.config.stash[satellite_scheduler] = scheduler
+            settings.set("server.hostname", scheduler.acquire())
         elif settings.server.hostnames and worker_pos < len(settings.server.hostnames):
             settings.set("server.hostname", settings.server.hostnames[worker_pos])
         elif settings.server.xdist_behavior == 'balance' and settings.server.hostnames:
@@ -62,9 +136,10 @@ def align_to_satellite(request, worker_id, satellite_factory):
                 settings.set("server.hostname", random.choice(settings.server.hostnames))
         if settings.server.hostname:
             logger.info(f'{worker_id=}: Worker was assigned hostname {settings.server.hostname}')
-            configure_airgun()
-            configure_nailgun()
+            _use_satellite(settings.server.hostname)
         yield
+        if scheduler := request.config.stash.get(satellite_scheduler, None):
+            scheduler.release()
         if on_demand_sat and settings.server.auto_checkin:
             logger.info(
                 f'{worker_id=}: Checking in on-demand Satellite ' f'{on_demand_sat.hostname}'
@@ -0,0 +1,139 @@
+"""Distribute the tests between the xdist workers by their durations in previous runs
+
+With ``--dist-longest-first``, the durations of the tests are recorded in a SQLite database at the
+end of the session, see ``robottelo.utils.duration_history``. Tests sharing a module, class or
+package scoped fixture, like ``module_target_sat`` or ``module_sca_manifest_org``, form a work
+unit run by a single worker. The xdist workers are given the work units with the longest
+predicted duration first, so the longest modules do not start at the end of the run. The
+predicted and actual makespans are printed at the end of the session.
+"""
+
+import time
+
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+from robottelo.utils.duration_history import (
+    DurationHistory,
+    lpt_makespan,
+    shared_scope,
+    work_unit,
+)
+
+# the seconds taken by each test in this session
+test_durations = {}
+scheduler_key = pytest.StashKey['DurationScheduling']()
+
+
+def pytest_addoption(parser):
+    """Add the --dist-longest-first and --durations-db options"""
+    parser.addoption(
+        '--dist-longest-first',
+        action='store_true',
+        default=False,
+        help='Give the xdist workers the tests with the longest duration in previous runs first, '
+        'grouping the tests sharing module scoped fixtures.',
+    )
+    parser.addoption(
+        '--durations-db',
+        default=None,
+        help='The database of the test durations used by --dist-longest-first, '
+        'defaults to <robottelo.tmp_dir>/test_durations.db',
+    )
+
+
+def _history(config):
+    path = config.getoption('durations_db')
+    return DurationHistory(path) if path else DurationHistory()
+
+
+def _is_worker(config):
+    return hasattr(config, 'workerinput')
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """Load scope scheduling of the work units with the longest predicted duration first"""
+
+    def __init__(self, config, log=None, history=None):
+        super().__init__(config, log)
+        self.history = history
+        self.units = {}
+        self.unit_durations = {}
+        self.predicted_makespan = None
+        self.started = None
+        self.finished = None
+
+    def _split_scope(self, nodeid):
+        return self.units.get(nodeid) or work_unit(nodeid, 'module')
+
+    def schedule(self):
+        if self.collection is None and self.collection_is_completed:
+            collection = next(iter(self.registered_collections.values()))
+            self.units = self.history.units(collection)
+            for nodeid, duration in self.history.predict(collection).items():
+                unit = self._split_scope(nodeid)
+                self.unit_durations[unit] = self.unit_durations.get(unit, 0) + duration
+            self.predicted_makespan = lpt_makespan(self.unit_durations.values(), len(self.nodes))
+            self.started = time.monotonic()
+        super().schedule()
+
+    def mark_test_complete(self, node, item_index, duration=0):
+        self.finished = time.monotonic()
+        super().mark_test_complete(node, item_index, duration)
+
+    def _assign_work_unit(self, node):
+        longest = max(self.workqueue, key=lambda unit: self.unit_durations.get(unit, 0))
+        self.workqueue.move_to_end(longest, last=False)
+        super()._assign_work_unit(node)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getoption('dist_longest_first'):
+        scheduler = DurationScheduling(config, log, history=_history(config))
+        config.stash[scheduler_key] = scheduler
+        return scheduler
+    return None
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, items, config):
+    """Save the work unit of each test, read by the scheduler of the xdist controller"""
+    if not config.getoption('dist_longest_first'):
+        return
+    # the workers collect the same tests
+    if _is_worker(config) and config.workerinput['workerid'] != 'gw0':
+        return
+    units = {}
+    for item in items:
+        fixtureinfo = getattr(item, '_fixtureinfo', None)
+        scopes = (
+            [fixturedefs[-1].scope for fixturedefs in fixtureinfo.name2fixturedefs.values()]
+            if fixtureinfo
+            else []
+        )
+        units[item.nodeid] = work_unit(item.nodeid, shared_scope(scopes))
+    _history(config).save_units(units)
+
+
+def pytest_runtest_logreport(report):
+    """Sum the durations of the setup, call and teardown of each test"""
+    test_durations[report.nodeid] = test_durations.get(report.nodeid, 0) + report.duration
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if not config.getoption('dist_longest_first') or _is_worker(config):
+        return
+    if test_durations:
+        _history(config).record(test_durations)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    scheduler = config.stash.get(scheduler_key, None)
+    if scheduler is None or scheduler.predicted_makespan is None or scheduler.finished is None:
+        return
+    terminalreporter.write_line(
+        f'Makespan: predicted {scheduler.predicted_makespan:.0f}s, '
+        f'actual {scheduler.finished - scheduler.started:.0f}s'
+    )
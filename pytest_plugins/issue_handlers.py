@@ -1,8 +1,6 @@
 from collections import defaultdict
 from datetime import datetime
-import inspect
 import json
-import re
 
 import pytest
 
@@ -13,8 +11,10 @@ from robottelo.utils.issue_handlers import (
     add_workaround,
     bugzilla,
     is_open,
+    jira,
     should_deselect,
 )
+from robottelo.utils.metadata_index import get_index
 from robottelo.utils.version import VersionEncoder, search_version_key
 
 DEFAULT_BZ_CACHE_FILE = 'bz_cache.json'
@@ -100,35 +100,6 @@ def pytest_collection_modifyitems(session, items, config):
     items[:] = selected
 
 
-IS_OPEN = re.compile(
-    # To match `if is_open('BZ:123456'):`
-    r"\s*if\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
-)
-
-NOT_IS_OPEN = re.compile(
-    # To match `if not is_open('BZ:123456'):`
-    r"\s*if\snot\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
-)
-
-COMPONENT = re.compile(
-    # To match :CaseComponent: FooBar
-    r"\s*:CaseComponent:\s*(?P<component>\S*)",
-    re.IGNORECASE,
-)
-
-IMPORTANCE = re.compile(
-    # To match :CaseImportance: Critical
-    r"\s*:CaseImportance:\s*(?P<importance>\S*)",
-    re.IGNORECASE,
-)
-
-BZ = re.compile(
-    # To match :BZ: 123456, 456789
-    r"\s*:BZ:\s*(?P<bz>.*\S*)",
-    re.IGNORECASE,
-)
-
-
 def generate_issue_collection(items, config):  # pragma: no cover
     """Generates a dictionary with the usage of Issue blockers
 
@@ -189,6 +160,7 @@ def generate_issue_collection(items, config):  # pragma: no cover
             )
 
     deselect_data = {}  # a local cache for deselected tests
+    metadata_index = get_index()  # docstrings and sources parsed once per object
 
     test_modules = set()
 
@@ -206,8 +178,8 @@ def generate_issue_collection(items, config):  # pragma: no cover
         test_modules.add(item.module)
         # Find matches from docstrings top-down from: module, class, function.
         mod_cls_fun = (item.module, getattr(item, 'cls', None), item.function)
-        for docstring in [d for d in map(inspect.getdoc, mod_cls_fun) if d is not None]:
-            bz_matches = BZ.findall(docstring)
+        for tokens in [t for t in map(metadata_index.doc_tokens, mod_cls_fun) if t is not None]:
+            bz_matches = tokens['bz']
             if bz_matches:
                 bz_marks_to_add.extend(b.strip() for b in bz_matches[-1].split(','))
 
@@ -241,8 +213,8 @@ def generate_issue_collection(items, config):  # pragma: no cover
                 bz_marks_to_add.append(issue_key.split(':')[-1])
 
         # Then take the workarounds using `is_open` helper.
-        source = inspect.getsource(item.function)
-        if 'is_open(' in source:
+        source = metadata_index.source(item.function)
+        if source['uses_is_open']:
             kwargs = {
                 'filepath': filepath,
                 'lineno': lineno,
@@ -251,8 +223,8 @@ def generate_issue_collection(items, config):  # pragma: no cover
                 'importance': importance_mark,
                 'component_mark': component_slug,
             }
-            add_workaround(collected_data, IS_OPEN.findall(source), 'is_open', **kwargs)
-            add_workaround(collected_data, NOT_IS_OPEN.findall(source), 'not is_open', **kwargs)
+            add_workaround(collected_data, source['is_open'], 'is_open', **kwargs)
+            add_workaround(collected_data, source['not_is_open'], 'not is_open', **kwargs)
 
         # Add BZs from tokens as a marker to enable filter e.g: "--BZ 123456"
         if bz_marks_to_add:
@@ -260,12 +232,12 @@ def generate_issue_collection(items, config):  # pragma: no cover
 
     # Take uses of `is_open` from outside of test cases e.g: SetUp methods
     for test_module in test_modules:
-        module_source = inspect.getsource(test_module)
-        component_matches = COMPONENT.findall(module_source)
+        module_source = metadata_index.source(test_module)
+        component_matches = module_source['component']
         module_component = None
         if component_matches:
             module_component = component_matches[0]
-        if 'is_open(' in module_source:
+        if module_source['uses_is_open']:
             kwargs = {
                 'filepath': test_module.__file__,
                 'lineno': 1,
@@ -278,14 +250,14 @@ def generate_issue_collection(items, config):  # pragma: no cover
 
             add_workaround(
                 collected_data,
-                IS_OPEN.findall(module_source),
+                module_source['is_open'],
                 'is_open',
                 validation=validation,
                 **kwargs,
             )
             add_workaround(
                 collected_data,
-                NOT_IS_OPEN.findall(module_source),
+                module_source['not_is_open'],
                 'not is_open',
                 validation=validation,
                 **kwargs,
@@ -294,6 +266,12 @@ def generate_issue_collection(items, config):  # pragma: no cover
     # --- Collect BUGZILLA data ---
     bugzilla.collect_data_bz(collected_data, cached_data)
 
+    # --- Collect Jira data, at once before the items look their issues up ---
+    jira.collect_data_jira(
+        collected_data,
+        {key: value for key, value in (cached_data or {}).items() if key.startswith('SAT-')},
+    )
+
     # --- add deselect markers dynamically ---
     for item in items:
         issue = deselect_data.get(item.location)
@@ -5,6 +5,8 @@ import logzero
 import pytest
 from xdist import is_xdist_worker
 
+from robottelo.cli import hammer_shell
+from robottelo.cli.base import info_calls_saved
 from robottelo.logging import (
     DEFAULT_DATE_FORMAT,
     broker_log_setup,
@@ -13,6 +15,8 @@ from robottelo.logging import (
     robottelo_log_dir,
     robottelo_log_file,
 )
+from robottelo.utils import ssh as ssh_utils
+from robottelo.utils.decorators.func_shared.shared import lock_stats as shared_lock_stats
 
 with contextlib.suppress(ImportError):
     from pytest_reportportal import RPLogger, RPLogHandler
@@ -76,3 +80,18 @@ def pytest_runtest_logreport(report):
     """Process the TestReport produced for each of the setup,
     call and teardown runtest phases of an item."""
     logger.info('Finished %s for test: %s, result: %s', report.when, report.nodeid, report.outcome)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Log the ssh pool, hammer and shared function counters, close idle ssh sessions and
+    hammer workers
+    """
+    hammer_shell.stop_all()
+    if info_calls_saved:
+        logger.info('Hammer info commands saved after create: %s', dict(info_calls_saved))
+    if shared_stats := shared_lock_stats():
+        logger.info('Shared function lock stats: %s', shared_stats)
+    pool = ssh_utils._pool
+    if pool is not None:
+        logger.info('SSH connection pool stats: %s', pool.stats())
+        pool.close_all()
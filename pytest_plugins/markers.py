@@ -22,6 +22,8 @@ def pytest_configure(config):
         "rhel_ver_list: Filter rhel_contenthost versions by list",
         "rhel_ver_match: Filter rhel_contenthost versions by regexp",
         "no_containers: Disable container hosts from being used in favor of VMs",
+        "reuse_contenthost: Let the function scoped content hosts of the test be reset and given "
+        "to another test when it passes, see performance.contenthost_max_reuses",
         "include_capsule: For satellite-maintain tests to run on Satellite and Capsule both",
         "capsule_only: For satellite-maintain tests to run only on Capsules",
         "manifester: Tests that require manifester",
@@ -1,13 +1,12 @@
 import datetime
-import inspect
-import re
 
 import pytest
 
 from robottelo.config import settings
 from robottelo.hosts import get_sat_rhel_version
 from robottelo.logging import collection_logger as logger
-from robottelo.utils.issue_handlers.jira import are_any_jira_open
+from robottelo.utils.issue_handlers.jira import are_any_jira_open, prefetch_jira
+from robottelo.utils.metadata_index import get_index
 
 FMT_XUNIT_TIME = '%Y-%m-%dT%H:%M:%S'
 IMPORTANCE_LEVELS = []
@@ -72,37 +71,6 @@ def pytest_configure(config):
         config.addinivalue_line("markers", marker)
 
 
-component_regex = re.compile(
-    # To match :CaseComponent: FooBar
-    r'\s*:CaseComponent:\s*(?P<component>\S*)',
-    re.IGNORECASE,
-)
-
-importance_regex = re.compile(
-    # To match :CaseImportance: Critical
-    r'\s*:CaseImportance:\s*(?P<importance>\S*)',
-    re.IGNORECASE,
-)
-
-team_regex = re.compile(
-    # To match :Team: Rocket
-    r'\s*:Team:\s*(?P<team>\S*)',
-    re.IGNORECASE,
-)
-
-blocked_by_regex = re.compile(
-    # To match :BlockedBy: SAT-32932
-    r'\s*:BlockedBy:\s*(?P<blocked_by>.*\S*)',
-    re.IGNORECASE,
-)
-
-verifies_regex = re.compile(
-    # To match :Verifies: SAT-32932
-    r'\s*:Verifies:\s*(?P<verifies>.*\S*)',
-    re.IGNORECASE,
-)
-
-
 def handle_verification_issues(item, verifies_marker, verifies_issues):
     """Handles the logic for deselecting tests based on Verifies testimony token
     and --verifies-issues pytest option.
@@ -137,6 +105,17 @@ def handle_blocked_by(item, blocked_by_marker, blocked_by):
     return True
 
 
+def blocked_by_issues(item, metadata_index):
+    """Return the issues of the BlockedBy markers and testimony tokens of an item"""
+    issues = [issue for marker in item.iter_markers('blocked_by') for issue in marker.args[0]]
+    for tokens in map(
+        metadata_index.doc_tokens, (item.function, getattr(item, 'cls', None), item.module)
+    ):
+        if tokens and tokens['blocked_by']:
+            issues.extend(b.strip() for b in tokens['blocked_by'][-1].split(','))
+    return issues
+
+
 def log_and_deselect(item, option):
     logger.debug(f'Deselected test {item.nodeid} due to "{option}" pytest option.')
     deselected.append(item)
@@ -168,6 +147,15 @@ def pytest_collection_modifyitems(items, config):
     team = [a.lower() for a in (config.getoption('team') or '').split(',') if a != '']
     verifies_issues = config.getoption('verifies_issues')
     blocked_by = config.getoption('blocked_by')
+    metadata_index = get_index()
+    if blocked_by is True:
+        # fetch all the blocking issues at once, instead of one by one in handle_blocked_by
+        prefetch_jira(
+            issue
+            for item in items
+            if not item.nodeid.startswith('tests/robottelo/')
+            for issue in blocked_by_issues(item, metadata_index)
+        )
     logger.info('Processing test items to add testimony token markers')
     for item in items:
         item.user_properties.append(
@@ -179,30 +167,34 @@ def pytest_collection_modifyitems(items, config):
 
         # apply the marks for importance, component, and team
         # Find matches from docstrings starting at smallest scope
-        item_docstrings = [
-            d
-            for d in map(inspect.getdoc, (item.function, getattr(item, 'cls', None), item.module))
-            if d is not None
+        # the docstrings are parsed once per function, class and module, by the metadata index
+        item_doc_tokens = [
+            tokens
+            for tokens in map(
+                metadata_index.doc_tokens,
+                (item.function, getattr(item, 'cls', None), item.module),
+            )
+            if tokens is not None
         ]
         blocked_by_marks_to_add = []
         verifies_marks_to_add = []
-        for docstring in item_docstrings:
+        for tokens in item_doc_tokens:
             item_mark_names = [m.name for m in item.iter_markers()]
             # Add marker starting at smallest docstring scope
             # only add the mark if it hasn't already been applied at a lower scope
-            doc_component = component_regex.findall(docstring)
+            doc_component = tokens['component']
             if doc_component and 'component' not in item_mark_names:
                 item.add_marker(pytest.mark.component(doc_component[0].lower()))
-            doc_importance = importance_regex.findall(docstring)
+            doc_importance = tokens['importance']
             if doc_importance and 'importance' not in item_mark_names:
                 item.add_marker(pytest.mark.importance(doc_importance[0].lower()))
-            doc_team = team_regex.findall(docstring)
+            doc_team = tokens['team']
             if doc_team and 'team' not in item_mark_names:
                 item.add_marker(pytest.mark.team(doc_team[0].lower()))
-            doc_verifies = verifies_regex.findall(docstring)
+            doc_verifies = tokens['verifies']
             if doc_verifies and 'verifies_issues' not in item_mark_names:
                 verifies_marks_to_add.extend(str(b.strip()) for b in doc_verifies[-1].split(','))
-            doc_blocked_by = blocked_by_regex.findall(docstring)
+            doc_blocked_by = tokens['blocked_by']
             if doc_blocked_by and 'blocked_by' not in item_mark_names:
                 blocked_by_marks_to_add.extend(
                     str(b.strip()) for b in doc_blocked_by[-1].split(',')
@@ -281,3 +273,8 @@ def pytest_collection_modifyitems(items, config):
     # selected will be empty if no filter option was passed, defaulting to full items list
     items[:] = selected if deselected else items
     config.hook.pytest_deselected(items=deselected)
+
+
+def pytest_collection_finish(session):
+    """Persist the docstring metadata parsed during collection for the next runs"""
+    get_index().save()
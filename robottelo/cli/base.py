@@ -1,16 +1,113 @@
 """Generic base class for cli hammer commands."""
 
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import re
+import threading
 
 from wait_for import wait_for
 
 from robottelo import ssh
-from robottelo.cli import hammer
+from robottelo.cli import hammer, hammer_shell
 from robottelo.config import settings
 from robottelo.exceptions import CLIDataBaseError, CLIError, CLIReturnCodeError
 from robottelo.logging import logger
 from robottelo.utils.ssh import get_client
 
+# number of info commands not run after a create, per hammer command base
+info_calls_saved = Counter()
+_info_calls_lock = threading.Lock()
+
+
+def _count_info_calls_saved(command_base, count):
+    with _info_calls_lock:
+        info_calls_saved[command_base] += count
+
+
+class CreatedRecord(dict):
+    """A record created by :meth:`Base.create` without re-reading it
+
+    It holds the ``create`` output, i.e. the message, id and name of the record, and runs the
+    ``info`` command the first time any other field is needed, e.g. on ``record['label']``,
+    ``'label' in record``, iteration, comparison or attribute access. Items are also available
+    as attributes, like with the ``Box`` returned by the cli factory.
+    """
+
+    def __init__(self, row, info, command_base):
+        super().__init__(row)
+        self._info = info
+        self._command_base = command_base
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._info is None:
+                return
+            record = self._info()
+            self._info = None
+            if record:
+                dict.pop(self, 'message', None)
+                dict.update(self, record)
+        _count_info_calls_saved(self._command_base, -1)
+
+    def __missing__(self, key):
+        self._load()
+        return dict.__getitem__(self, key)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        for key in (name, name.replace('_', '-')):
+            if key in self:
+                return self[key]
+        raise AttributeError(name)
+
+    def __contains__(self, key):
+        if not dict.__contains__(self, key):
+            self._load()
+        return dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        if not dict.__contains__(self, key):
+            self._load()
+        return dict.get(self, key, default)
+
+    def __iter__(self):
+        self._load()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._load()
+        return dict.__len__(self)
+
+    def __eq__(self, other):
+        self._load()
+        if isinstance(other, CreatedRecord):
+            other._load()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def keys(self):
+        self._load()
+        return dict.keys(self)
+
+    def values(self):
+        self._load()
+        return dict.values(self)
+
+    def items(self):
+        self._load()
+        return dict.items(self)
+
+    def copy(self):
+        self._load()
+        return dict(self)
+
 
 class Base:
     """Base class for hammer CLI interaction
@@ -19,10 +116,13 @@ class Base:
     """
 
     omitting_credentials = False
+    use_hammer_shell = False  # True to run commands through a persistent hammer worker
     command_base = None  # each inherited instance should define this
     command_sub = None  # specific to instance, like: create, update, etc.
     command_end = None  # extending commands like for directory to pass
     command_requires_org = False  # True when command requires organization-id
+    fetch_after_create = True  # False to re-read created records only when a field is needed
+    create_needs_info = False  # True to re-read created records even if fetch_after_create is False
     hostname = None  # Now used for Satellite class hammer execution
     logger = logger
     _db_error_regex = re.compile(r'.*INSERT INTO|.*SELECT .*FROM|.*violates foreign key')
@@ -108,12 +208,17 @@ class Base:
                     raise CLIError(tmpl.format(cls.__name__))
                 info_options['organization-id'] = options['organization-id']
 
+            if not (cls.fetch_after_create or cls.create_needs_info):
+                # the create output has the id and name, the other fields are read on demand
+                _count_info_calls_saved(cls.command_base, 1)
+                return CreatedRecord(result[0], partial(cls.info, info_options), cls.command_base)
+
             # organization creation can take some time
             if cls.command_base == 'organization':
                 new_obj, _ = wait_for(
                     lambda: cls.info(info_options),
                     timeout=300000,
-                    delay=5,
+                    delay=1,
                     silent_failure=True,
                     handle_exception=True,
                 )
@@ -190,22 +295,39 @@ class Base:
         else:
             user, password = cls._get_username_password(user, password)
         time_hammer = settings.performance.time_hammer
-
-        # add time to measure hammer performance
-        cmd = 'LANG={} {} hammer -v {} {} {} {}'.format(
-            settings.robottelo.locale,
-            'time -p' if time_hammer else '',
-            f'-u {user}' if user else "--interactive no",
-            f'-p {password}' if password else "",
-            f'--output={output_format}' if output_format else "",
-            command,
-        )
-        response = ssh.command(
-            cmd,
-            hostname=hostname or cls.hostname or settings.server.hostname,
-            output_format=output_format,
-            timeout=timeout,
-        )
+        hostname = hostname or cls.hostname or settings.server.hostname
+
+        if cls.use_hammer_shell and not time_hammer:
+            response = hammer_shell.command(
+                '-v {} {} {} {}'.format(
+                    f'-u {user}' if user else "--interactive no",
+                    f'-p {password}' if password else "",
+                    f'--output={output_format}' if output_format else "",
+                    command,
+                ),
+                hostname=hostname,
+                user=user,
+                password=password,
+                env={'LANG': settings.robottelo.locale},
+                output_format=output_format,
+                timeout=timeout,
+            )
+        else:
+            # add time to measure hammer performance
+            cmd = 'LANG={} {} hammer -v {} {} {} {}'.format(
+                settings.robottelo.locale,
+                'time -p' if time_hammer else '',
+                f'-u {user}' if user else "--interactive no",
+                f'-p {password}' if password else "",
+                f'--output={output_format}' if output_format else "",
+                command,
+            )
+            response = ssh.command(
+                cmd,
+                hostname=hostname,
+                output_format=output_format,
+                timeout=timeout,
+            )
         if return_raw_response:
             return response
         return cls._handle_response(response, ignore_stderr=ignore_stderr)
@@ -284,6 +406,52 @@ class Base:
 
         return cls.execute(cls._construct_command(options), output_format=output_format)
 
+    @classmethod
+    def iter_list(cls, options=None, page_size=1000, prefetch=0, output_format='csv'):
+        """Iterate over the listed records, fetching them page by page.
+
+        Pages are only fetched when the consumer needs them, breaking out of the loop stops
+        fetching. The records are the same dictionaries :meth:`list` returns.
+
+        @param options: same as for :meth:`list`, ``page`` and ``per-page`` are overridden.
+        @param page_size: number of records fetched per hammer command.
+        @param prefetch: number of pages fetched concurrently ahead of the consumer.
+        """
+        options = dict(options or {})
+        options.pop('per-page', None)
+
+        def page_command(page):
+            # built by the caller thread, command_sub is shared class state
+            cls.command_sub = 'list'
+            return cls._construct_command({**options, 'page': page, 'per-page': page_size})
+
+        def fetch(command):
+            return cls.execute(command, output_format=output_format)
+
+        executor = ThreadPoolExecutor(max_workers=prefetch) if prefetch else None
+        pending = deque()
+        next_page = 1
+        try:
+            while True:
+                while executor and len(pending) < prefetch + 1:
+                    pending.append(executor.submit(fetch, page_command(next_page)))
+                    next_page += 1
+                if executor:
+                    records = pending.popleft().result()
+                else:
+                    records = fetch(page_command(next_page))
+                    next_page += 1
+                if not isinstance(records, list):
+                    return
+                yield from records
+                if len(records) < page_size:
+                    return
+        finally:
+            if executor:
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=False)
+
     @classmethod
     def puppetclasses(cls, options=None):
         """
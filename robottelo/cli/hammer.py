@@ -1,38 +1,41 @@
 """Helpers to interact with hammer command line utility."""
 
 import csv
+from functools import lru_cache
+import io
 import json
 import re
+import sys
 
+# number of lines sniffed when the header line alone can't tell whether the output is CSV
+CSV_SNIFF_LINES = 20
 
+
+@lru_cache(maxsize=4096)
 def _normalize(header):
-    """Replace empty spaces with '-' and lower all chars"""
-    return header.replace(' ', '-').lower()
+    """Replace empty spaces with '-' and lower all chars
+
+    Results are memoised and interned, hammer outputs repeat the same few keys in every row.
+    """
+    return sys.intern(header.replace(' ', '-').lower())
+
+
+def _normalized_dict(pairs):
+    """``object_pairs_hook`` normalizing keys while JSON objects are decoded"""
+    return {_normalize(k): v for k, v in pairs}
 
 
 def parse_json(stdout):
     """Parse JSON output from Hammer CLI and convert it to python dictionary
     while normalizing keys.
+
+    Keys are normalized and integers converted to strings, to conform to the csv parser,
+    in a single pass while decoding.
     """
     new_object_index = stdout.find('\n}\n{')
     if new_object_index > -1:
         stdout = stdout[new_object_index + 3 :]  # noqa: E203
-    parsed = json.loads(stdout)
-    return _normalize_obj(parsed)
-
-
-def _normalize_obj(obj):
-    """Normalize all dict's keys replacing empty spaces with "-" and lowering
-    chars
-    """
-    if isinstance(obj, dict):
-        return {_normalize(k): _normalize_obj(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_normalize_obj(v) for v in obj]
-    # doing this to conform to csv parser
-    if isinstance(obj, int) and not isinstance(obj, bool):
-        return str(obj)
-    return obj
+    return json.loads(stdout, parse_int=str, object_pairs_hook=_normalized_dict)
 
 
 def is_csv(output):
@@ -45,21 +48,50 @@ def is_csv(output):
         return False
 
 
+def _split_header(output):
+    """Split ``output`` into its first line and the rest, without splitting every line"""
+    header, _, body = output.partition('\n')
+    return header.rstrip('\r'), body
+
+
+def iter_csv(output):
+    """Parse CSV output from Hammer CLI, yielding one dictionary per row
+
+    The format is detected from the header line only: any header with more than one column is
+    CSV. Single column headers, which the csv sniffer can't reliably tell apart from plain text,
+    fall back to sniffing the first lines of the output. Rows are produced lazily.
+
+    :return: a generator of dictionaries, or None if ``output`` is not CSV.
+    """
+    header, body = _split_header(output)
+    is_rex = 'Job invocation' in header or 'Job invocation' in _split_header(body)[0]
+    is_pkg_list = 'Nvra' in header
+    is_table = is_rex or is_pkg_list or len(next(csv.reader([header]), ())) > 1
+    if not is_table and not is_csv(
+        '\n'.join(output.split('\n', CSV_SNIFF_LINES)[:CSV_SNIFF_LINES])
+    ):
+        return None
+    # Generate the key names, spaces will be converted to dashes "-"
+    keys = [_normalize(key) for key in next(csv.reader([header]), ())]
+    # job invocation output is followed by the task progress, only its first row is CSV
+    lines = [_split_header(body)[0]] if is_rex else io.StringIO(body)
+    return _iter_rows(keys, csv.reader(lines))
+
+
+def _iter_rows(keys, reader):
+    # For each entry, create a dict mapping each key with each value
+    for values in reader:
+        if len(values) > 0:
+            yield dict(zip(keys, values, strict=True))
+
+
 def parse_csv(output):
     """Parse CSV output from Hammer CLI and convert it to python dictionary."""
-    # ignore warning about puppet and ostree deprecation
-    output.replace('Puppet and OSTree will no longer be supported in Katello 3.16\n', '')
-    is_rex = 'Job invocation' in output
-    is_pkg_list = 'Nvra' in output
+    rows = iter_csv(output)
     # Validate if the output is eligible for CSV conversions else return as it is
-    if not is_csv(output) and not is_rex and not is_pkg_list:
+    if rows is None:
         return output
-    output = output.splitlines()[0:2] if is_rex else output.splitlines()
-    reader = csv.reader(output)
-    # Generate the key names, spaces will be converted to dashes "-"
-    keys = [_normalize(header) for header in next(reader)]
-    # For each entry, create a dict mapping each key with each value
-    return [dict(zip(keys, values, strict=True)) for values in reader if len(values) > 0]
+    return list(rows)
 
 
 def parse_help(output):
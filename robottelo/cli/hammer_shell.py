@@ -0,0 +1,217 @@
+"""Persistent hammer workers, to avoid paying hammer's startup cost on every command.
+
+Every ``hammer`` invocation starts a Ruby interpreter, loads all hammer plugins and the
+apipie API description before doing any work. A :class:`HammerShell` starts a single
+long-lived Ruby process on the Satellite that loads hammer once, then streams commands to it
+over a dedicated ssh channel. Requests and responses are exchanged as JSON lines, each
+response carries the exit status, stdout and stderr of the command, so the result can be
+handled by :meth:`robottelo.cli.base.Base._handle_response` like any ssh command result.
+
+Workers are kept per Satellite hostname and per hammer credential set, hammer caches its API
+connection, and therefore its credentials, in the process context.
+"""
+
+import json
+import threading
+import time
+
+from broker.helpers import Result
+
+from robottelo.cli import hammer
+from robottelo.logging import logger
+
+WORKER_PATH = '/tmp/robottelo_hammer_worker.rb'
+
+WORKER_SCRIPT = r"""
+require 'json'
+require 'shellwords'
+require 'stringio'
+require 'hammer_cli'
+
+HammerCLI::Settings.load_from_defaults
+HammerCLI::Modules.load_all
+
+# commands store their options, e.g. the output adapter, in the context: each command starts
+# from the initial context, only the API connection is kept between commands
+context = HammerCLI.context
+initial_context = context.dup
+out = STDOUT.dup
+out.sync = true
+out.puts({ready: true}.to_json)
+while (line = STDIN.gets)
+  request = JSON.parse(line)
+  context.replace(initial_context.merge(api_connection: context[:api_connection]).compact)
+  (request['env'] || {}).each { |key, value| ENV[key] = value }
+  stdout, stderr = StringIO.new, StringIO.new
+  $stdout, $stderr = stdout, stderr
+  begin
+    status = HammerCLI::MainCommand.run('hammer', Shellwords.split(request['args']), HammerCLI.context)
+  rescue SystemExit => e
+    status = e.status
+  rescue Exception => e
+    stderr.puts("#{e.class}: #{e.message}")
+    status = 70
+  ensure
+    $stdout, $stderr = STDOUT, STDERR
+  end
+  out.puts({status: status || 0, stdout: stdout.string, stderr: stderr.string}.to_json)
+end
+"""
+
+
+class HammerShellError(Exception):
+    """Raised when the persistent hammer worker can't be started or stops responding"""
+
+
+class HammerShell:
+    """A long-lived hammer worker running on a Satellite
+
+    :param hostname: the Satellite to run hammer on.
+    :param user: hammer username, ``None`` when credentials are omitted.
+    :param password: hammer password.
+    """
+
+    def __init__(self, hostname, user=None, password=None):
+        self.hostname = hostname
+        self.user = user
+        self.password = password
+        self.lock = threading.Lock()
+        self._client = None
+        self._channel = None
+        self._buffer = b''
+        self.commands = 0
+
+    @property
+    def running(self):
+        return self._channel is not None
+
+    def start(self):
+        """Upload the worker script and start it on a dedicated ssh channel"""
+        from robottelo.utils.ssh import get_client
+
+        self._client = get_client(hostname=self.hostname)
+        result = self._client.execute(
+            f"cat > {WORKER_PATH} <<'ROBOTTELO_EOF'\n{WORKER_SCRIPT}\nROBOTTELO_EOF"
+        )
+        if result.status != 0:
+            raise HammerShellError(f'Unable to upload hammer worker: {result.stderr}')
+        channel = self._client.session.session.open_session()
+        channel.execute(f'ruby {WORKER_PATH}')
+        self._channel = channel
+        self._buffer = b''
+        if not self._read_response(timeout=None).get('ready'):
+            self.stop()
+            raise HammerShellError(f'Hammer worker on {self.hostname} failed to start')
+        logger.debug('Started persistent hammer worker on %s for user %s', self.hostname, self.user)
+
+    def stop(self):
+        """Stop the worker and close its ssh session"""
+        if self._channel is not None:
+            try:
+                self._channel.send_eof()
+                self._channel.close()
+            except Exception as err:
+                logger.debug('Error while stopping hammer worker on %s: %s', self.hostname, err)
+        if self._client is not None:
+            self._client.close()
+        self._channel = self._client = None
+
+    def _read_response(self, timeout):
+        """Read one JSON line from the worker
+
+        :param timeout: seconds to wait for the whole line, ``None`` to wait forever
+        """
+        session = self._client.session.session
+        deadline = time.monotonic() + timeout if timeout else None
+        while b'\n' not in self._buffer:
+            remaining = deadline - time.monotonic() if deadline else None
+            if remaining is not None and remaining <= 0:
+                raise HammerShellError(f'Hammer worker on {self.hostname} timed out')
+            # the blocking read returns, or raises, once the session timeout expires, 0 is none
+            session.set_timeout(int(remaining * 1000) + 1 if remaining else 0)
+            try:
+                size, data = self._channel.read()
+            except Exception as err:
+                if deadline and time.monotonic() >= deadline:
+                    raise HammerShellError(f'Hammer worker on {self.hostname} timed out') from err
+                raise HammerShellError(
+                    f'Failed to read from hammer worker on {self.hostname}: {err}'
+                ) from err
+            finally:
+                session.set_timeout(0)
+            if size < 0:
+                # LIBSSH2_ERROR_TIMEOUT when it is returned instead of raised
+                if deadline:
+                    continue
+                raise HammerShellError(
+                    f'Failed to read from hammer worker on {self.hostname}: error {size}'
+                )
+            if size == 0 and self._channel.eof():
+                _, err = self._channel.read_stderr()
+                raise HammerShellError(
+                    f'Hammer worker on {self.hostname} exited: {err.decode(errors="replace")}'
+                )
+            self._buffer += data
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        return json.loads(line)
+
+    def run(self, args, env=None, timeout=None):
+        """Run hammer ``args`` in the worker and return a ``broker.helpers.Result``
+
+        :param str args: hammer arguments, as they would follow ``hammer`` on a shell.
+        :param dict env: environment variables to set before running the command.
+        :param timeout: seconds to wait for the command, ``None`` to wait forever.
+        """
+        with self.lock:
+            if not self.running:
+                self.start()
+            request = json.dumps({'args': args, 'env': env or {}}) + '\n'
+            try:
+                self._channel.write(request.encode())
+                response = self._read_response(timeout)
+            except Exception:
+                # the worker state is unknown, a fresh one will be started next time
+                self.stop()
+                raise
+            self.commands += 1
+        return Result(
+            stdout=response['stdout'], stderr=response['stderr'], status=response['status']
+        )
+
+
+_shells = {}
+_shells_lock = threading.Lock()
+
+
+def get_shell(hostname, user=None, password=None):
+    """Return the worker for ``hostname`` and the given credentials, creating it if needed"""
+    key = (hostname, user, password)
+    with _shells_lock:
+        if key not in _shells:
+            _shells[key] = HammerShell(hostname, user=user, password=password)
+        return _shells[key]
+
+
+def stop_all():
+    """Stop every persistent hammer worker of this process"""
+    with _shells_lock:
+        for shell in _shells.values():
+            shell.stop()
+        _shells.clear()
+
+
+def command(args, hostname, user=None, password=None, env=None, output_format=None, timeout=None):
+    """Run hammer ``args`` through a persistent worker, mirroring :func:`robottelo.ssh.command`
+
+    :param str args: hammer arguments, as they would follow ``hammer`` on a shell.
+    :param str output_format: json, csv or None, stdout is parsed when the command succeeded.
+    :param int timeout: time to wait for the command to finish, in milliseconds.
+    """
+    shell = get_shell(hostname, user=user, password=password)
+    result = shell.run(args, env=env, timeout=timeout / 1000 if timeout else None)
+    if output_format and result.status == 0:
+        if output_format == 'csv':
+            result.stdout = hammer.parse_csv(result.stdout) if result.stdout else {}
+        if output_format == 'json':
+            result.stdout = hammer.parse_json(result.stdout) if result.stdout else None
+    return result
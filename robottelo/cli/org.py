@@ -48,6 +48,8 @@ class Org(Base):
     """Manipulates Foreman's Organizations"""
 
     command_base = 'organization'
+    # organizations are set up asynchronously, info makes sure the new one is usable
+    create_needs_info = True
 
     @classmethod
     def add_compute_resource(cls, options=None):
@@ -16,7 +16,9 @@ VALIDATORS = dict(
         Validator('server.version.source', must_exist=True),
         Validator('server.version.rhel_version', must_exist=True, cast=str),
         Validator(
-            'server.xdist_behavior', must_exist=True, is_in=['run-on-one', 'balance', 'on-demand']
+            'server.xdist_behavior',
+            must_exist=True,
+            is_in=['run-on-one', 'balance', 'on-demand', 'load-balance'],
         ),
         Validator('server.auto_checkin', default=False, is_type_of=bool),
         (
@@ -35,6 +37,8 @@ VALIDATORS = dict(
         Validator('server.ssh_username', default='root'),
         Validator('server.ssh_password', default=None),
         Validator('server.verify_ca', default=False),
+        Validator('server.ssh_client.pool_size', default=4, is_type_of=int),
+        Validator('server.ssh_client.pool_idle_timeout', default=300, is_type_of=int),
     ],
     content_host=[
         Validator('content_host.default_rhel_version', must_exist=True),
@@ -198,6 +202,7 @@ VALIDATORS = dict(
         Validator('jira.comment_visibility', default="Red Hat Employee"),
         Validator('jira.enable_comment', default=False),
         Validator('jira.issue_status', default=["Review", "Release Pending"]),
+        Validator('jira.cache_ttl', default=3600, is_type_of=int, gte=0),
     ],
     ldap=[
         Validator(
@@ -254,7 +259,19 @@ VALIDATORS = dict(
             must_exist=True,
         ),
     ],
-    performance=[Validator('performance.time_hammer', default=False)],
+    performance=[
+        Validator('performance.time_hammer', default=False),
+        Validator('performance.hammer_shell', default=False, is_type_of=bool),
+        Validator('performance.warm_apidoc_cache', default=True, is_type_of=bool),
+        Validator('performance.bulk_workers', default=8, is_type_of=int, gte=1),
+        Validator('performance.fetch_after_create', default=True, is_type_of=bool),
+        Validator('performance.pipelined_content_setup', default=False, is_type_of=bool),
+        Validator('performance.host_facts_ttl', default=0, is_type_of=int, gte=0),
+        Validator('performance.factory_pool_size', default=0, is_type_of=int, gte=0),
+        Validator('performance.contenthost_pool_size', default=0, is_type_of=int, gte=0),
+        Validator('performance.contenthost_max_reuses', default=0, is_type_of=int, gte=0),
+        Validator('performance.manifest_pool_size', default=0, is_type_of=int, gte=0),
+    ],
     report_portal=[
         Validator(
             'report_portal.portal_url',
@@ -329,7 +346,7 @@ VALIDATORS = dict(
         Validator('remotedb.port', default=5432),
     ],
     shared_function=[
-        Validator('shared_function.storage', is_in=('file', 'redis'), default='file'),
+        Validator('shared_function.storage', is_in=('file', 'redis', 'sqlite'), default='file'),
         Validator('shared_function.share_timeout', lte=86400, default=86400),
         Validator('shared_function.scope', default=None),
         Validator('shared_function.enabled', default=False),
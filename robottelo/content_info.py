@@ -1,12 +1,160 @@
 """Miscellaneous content helper functions"""
 
+import bz2
+from contextlib import contextmanager
+from functools import partial
+import gzip
+from html.parser import HTMLParser
+import lzma
 import os
 import re
+import threading
+from xml.etree import ElementTree
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from robottelo import ssh
 from robottelo.exceptions import CLIReturnCodeError
+from robottelo.logging import logger
+from robottelo.utils.concurrency import run_concurrently
+
+REPO_NS = '{http://linux.duke.edu/metadata/repo}'
+COMMON_NS = '{http://linux.duke.edu/metadata/common}'
+# decompressors of the repodata files, by extension
+DECOMPRESSORS = {
+    '.gz': gzip.open,
+    '.xz': lzma.open,
+    '.bz2': bz2.open,
+    '.xml': None,
+    '.yaml': None,
+}
+# maximum number of connections kept open to a host
+HTTP_POOL_SIZE = 16
+
+_http_session = None
+_http_session_lock = threading.Lock()
+# the file URLs of published repositories, by URL, extension, source and repomd revision
+_files_cache = {}
+
+
+def http_session():
+    """Return the HTTP session shared by the threads, keeping its connections open"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            session.verify = False
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _http_session = session
+    return _http_session
+
+
+class _LinkParser(HTMLParser):
+    """Collect the links of a directory index, except to the parent directory"""
+
+    def __init__(self):
+        super().__init__()
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            if href and not href.startswith('..'):
+                self.links.append(href)
+
+
+def _list_directory(url):
+    """Return the links of the index of a published directory"""
+    parser = _LinkParser()
+    with http_session().get(url, stream=True) as result:
+        if result.status_code != 200:
+            raise requests.HTTPError(f'{url} is not accessible')
+        for chunk in result.iter_content(chunk_size=65536, decode_unicode=True):
+            parser.feed(chunk if isinstance(chunk, str) else chunk.decode())
+    parser.close()
+    return parser.links
+
+
+def _crawl(url, extension):
+    """Return the URLs of the files of a published repository, crawling its indexes"""
+    links = _list_directory(url)
+    if 'Packages/' not in links:
+        return [f'{url}{link}' for link in links if extension in link]
+    subs = [f'{url}Packages/{link}' for link in _list_directory(f'{url}Packages/') if '/' in link]
+    results, errors = run_concurrently(
+        [partial(_list_directory, sub) for sub in subs], raise_on_error=False
+    )
+    if errors:
+        raise next(iter(errors.values()))
+    return [
+        f'{sub}{link}'
+        for sub, links in zip(subs, results, strict=True)
+        for link in links
+        if extension in link
+    ]
+
+
+@contextmanager
+def open_repodata(url, repomd, data_type):
+    """Open a repodata file of a published repository, decompressed while it is downloaded
+
+    :param url: URL where the repo or CV is published, ending with a slash
+    :param repomd: the content of the repomd file of the repository, see ``get_repomd``
+    :param data_type: the type of the repodata file, e.g. ``primary``, ``updateinfo``
+        or ``modules``
+    :return: a context manager of a binary file object, or of None if the repository has no
+        such repodata file or its compression is not supported
+    """
+    data = next(
+        (data for data in ElementTree.fromstring(repomd) if data.get('type') == data_type), None
+    )
+    if data is None:
+        yield None
+        return
+    href = data.find(f'{REPO_NS}location').get('href')
+    extension = os.path.splitext(href)[1]
+    if extension not in DECOMPRESSORS:
+        logger.debug(f'Unsupported compression of {url}{href}')
+        yield None
+        return
+    with http_session().get(f'{url}{href}', stream=True) as result:
+        if result.status_code != 200:
+            raise requests.HTTPError(f'{url}{href} is not accessible')
+        result.raw.decode_content = True
+        decompressor = DECOMPRESSORS[extension]
+        yield decompressor(result.raw) if decompressor else result.raw
+
+
+def iter_repodata_elements(stream, tag):
+    """Yield the elements of a tag of an XML repodata stream as soon as they are parsed
+
+    The elements read so far are dropped from the tree once the next one is asked for, so the
+    memory used by the parsing does not grow with the number of packages or errata.
+
+    :param stream: a binary stream of the XML file, like the ones of ``open_repodata``.
+    :param str tag: the tag of the elements, with its namespace.
+    """
+    root = None
+    for event, element in ElementTree.iterparse(stream, events=('start', 'end')):
+        if root is None:
+            root = element
+        elif event == 'end' and element.tag == tag:
+            yield element
+            root.clear()
+
+
+def _primary_locations(url, repomd):
+    """Return the location of each package of the primary repodata, None if it can not be read"""
+    with open_repodata(url, repomd, 'primary') as stream:
+        if stream is None:
+            return None
+        return [
+            element.find(f'{COMMON_NS}location').get('href')
+            for element in iter_repodata_elements(stream, f'{COMMON_NS}package')
+        ]
 
 
 def get_repo_files(repo_path, extension='rpm', hostname=None):
@@ -33,40 +181,56 @@ def get_repo_files(repo_path, extension='rpm', hostname=None):
     return sorted(repo_file for repo_file in result.stdout.splitlines() if repo_file)
 
 
-def get_repo_files_urls_by_url(url, extension='rpm'):
+def get_repo_files_urls_by_url(url, extension='rpm', from_repodata=False):
     """Returns a list of URLs of repo files (for example rpms) in a specific repository
     published at some URL.
+
+    The directory indexes are fetched concurrently. The result is cached by the repomd revision
+    of the repository, when it has one.
+
     :param url: URL where the repo or CV is published
     :param extension: extension of searched files. Defaults to 'rpm'
+    :param from_repodata: list the rpms from the primary repodata of the repository instead of
+        crawling its directory indexes.
     :return:  list representing package URLs
     """
     if not url.endswith('/'):
         url += '/'
+    try:
+        repomd = get_repomd(url.rstrip('/'))
+    except requests.HTTPError:
+        repomd = None
+    revision = parse_repomd_revision(repomd) if repomd else None
+    key = (url, extension, from_repodata, revision)
+    if revision and key in _files_cache:
+        return list(_files_cache[key])
+    files = None
+    if from_repodata and repomd and extension == 'rpm':
+        locations = _primary_locations(url, repomd)
+        if locations is not None:
+            files = [f'{url}{location}' for location in locations]
+    if files is None:
+        files = _crawl(url, extension)
+    files.sort()
+    if revision:
+        _files_cache[key] = files
+    return list(files)
 
-    result = requests.get(url, verify=False)
-    if result.status_code != 200:
-        raise requests.HTTPError(f'{url} is not accessible')
 
-    links = re.findall(r'(?<=href=")(?!\.\.).*?(?=">)', result.text)
-    if 'Packages/' not in links:
-        files = sorted(line for line in links if extension in line)
-        return [f'{url}{file}' for file in files]
-
-    files = []
-    subs = get_repo_files_urls_by_url(f'{url}Packages/', extension='/')
-    for sub in subs:
-        files.extend(get_repo_files_urls_by_url(sub, extension))
-    return sorted(files)
-
-
-def get_repo_files_by_url(url, extension='rpm'):
+def get_repo_files_by_url(url, extension='rpm', from_repodata=False):
     """Returns a list of repo files (for example rpms) in a specific repository
     published at some URL.
     :param url: URL where the repo or CV is published
     :param extension: extension of searched files. Defaults to 'rpm'
+    :param from_repodata: see ``get_repo_files_urls_by_url``
     :return:  list representing package names
     """
-    return sorted([os.path.basename(f) for f in get_repo_files_urls_by_url(url, extension)])
+    return sorted(
+        [
+            os.path.basename(f)
+            for f in get_repo_files_urls_by_url(url, extension, from_repodata=from_repodata)
+        ]
+    )
 
 
 def get_repomd(repo_url):
@@ -76,13 +240,22 @@ def get_repomd(repo_url):
     :return: string with repomd content
     """
     repomd_path = 'repodata/repomd.xml'
-    result = requests.get(f'{repo_url}/{repomd_path}', verify=False)
+    result = http_session().get(f'{repo_url}/{repomd_path}')
     if result.status_code != 200:
         raise requests.HTTPError(f'{repo_url}/{repomd_path} is not accessible')
 
     return result.text
 
 
+def parse_repomd_revision(repomd):
+    """Return the revision of the content of a repomd file, None if it has none
+
+    :param str repomd: content of the repomd file, see ``get_repomd``.
+    """
+    match = re.search('(?<=<revision>).*?(?=</revision>)', repomd)
+    return match.group(0) if match else None
+
+
 def get_repomd_revision(repo_url):
     """Fetches a revision of a repository.
 
@@ -90,8 +263,8 @@ def get_repomd_revision(repo_url):
     :return: string containing repository revision
     :rtype: str
     """
-    match = re.search('(?<=<revision>).*?(?=</revision>)', get_repomd(repo_url))
-    if not match:
+    revision = parse_repomd_revision(get_repomd(repo_url))
+    if not revision:
         raise ValueError(f'<revision> not found in repomd file of {repo_url}')
 
-    return match.group(0)
+    return revision
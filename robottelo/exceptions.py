@@ -63,6 +63,28 @@ class CLIFactoryError(Exception):
     """Indicates an error occurred while creating an entity using hammer"""
 
 
+class BulkOperationError(Exception):
+    """Indicates that some items of a bulk operation failed
+
+    :param results: the results in request order, ``None`` for the failed items
+    :param errors: a dict mapping the index of each failed item to its exception
+    """
+
+    def __init__(self, results, errors):
+        self.results = results
+        self.errors = errors
+        details = '\n'.join(f'[{index}] {err!r}' for index, err in sorted(errors.items()))
+        super().__init__(f'{len(errors)} of {len(results)} items failed:\n{details}')
+
+
+class HostFactError(Exception):
+    """Indicates that a fact about a host could not be read"""
+
+
+class FileInspectionError(Exception):
+    """Indicates that files could not be inspected on a host"""
+
+
 class CLIError(Exception):
     """Indicates that a CLI command could not be run."""
 
@@ -18,6 +18,8 @@ from robottelo.constants import (
     REPO_TYPE,
 )
 from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
+from robottelo.logging import logger
+from robottelo.utils.concurrency import run_concurrently
 
 
 class APIFactory:
@@ -27,6 +29,29 @@ class APIFactory:
         self._satellite = satellite
         self.__dict__.update(initiate_repo_helpers(self._satellite))
 
+    def make_many(self, entity, count, max_workers=None, raise_on_error=True, **fields):
+        """Create ``count`` entities of the same kind concurrently.
+
+        :param str entity: the nailgun entity name, e.g. ``Organization``.
+        :param int count: the number of entities to create.
+        :param int max_workers: the maximum number of concurrent creations,
+            ``settings.performance.bulk_workers`` by default.
+        :param bool raise_on_error: raise :class:`robottelo.exceptions.BulkOperationError`
+            once all creations finished if any of them failed. When False, failed entities are
+            ``None`` in the result and their errors are logged.
+        :param fields: field values common to all the entities, e.g. ``organization=org``.
+        :return: a list of the created entities, in request order.
+        """
+        entity_cls = getattr(self._satellite.api, entity)
+
+        def create():
+            return entity_cls(**fields).create()
+
+        results, errors = run_concurrently([create] * count, max_workers, raise_on_error)
+        for index, err in errors.items():
+            logger.warning(f'make_many {entity}: item {index} failed: {err}')
+        return results
+
     def make_http_proxy(self, org, http_proxy_type):
         """
         Creates HTTP proxy.
@@ -407,11 +432,9 @@ class APIFactory:
         :param int from_when: Epoch Time (seconds in UTC) to limit number of returned tasks to investigate.
         :param int search_rate: Delay between searches.
         :param int max_tries: How many times search should be executed.
-        :param int poll_rate: Delay between the end of one task check-up and
-                the start of the next check-up. Parameter for
-                ``nailgun.entities.ForemanTask.poll()`` method.
-        :param int poll_timeout: Maximum number of seconds to wait until timing out.
-                Parameter for ``nailgun.entities.ForemanTask.poll()`` method.
+        :param int poll_rate: Unused, the tasks are polled by the Satellite's task watcher,
+                see :attr:`robottelo.hosts.Satellite.task_watcher`.
+        :param int poll_timeout: Maximum number of seconds to wait for the tasks to finish.
         :return: Relevant errata applicability task.
         :raises: ``AssertionError``. If not tasks were found for given host until timeout.
         """
@@ -433,20 +456,22 @@ class APIFactory:
                 f' started_at >= "{long_format}" '
             )
             tasks = self._satellite.api.ForemanTask().search(query={'search': search_query})
-            tasks_finished = 0
-            for task in tasks:
+            host_tasks = [
+                task
+                for task in tasks
                 if (
                     task.label == 'Actions::Katello::Applicability::Hosts::BulkGenerate'
                     and 'host_ids' in task.input
                     and host_id in task.input['host_ids']
-                ) or (
+                )
+                or (
                     task.label == 'Actions::Katello::Host::UploadPackageProfile'
                     and 'host' in task.input
                     and host_id == task.input['host']['id']
-                ):
-                    task.poll(poll_rate=poll_rate, timeout=poll_timeout)
-                    tasks_finished += 1
-            if tasks_finished > 0:
+                )
+            ]
+            if host_tasks:
+                self._satellite.task_watcher.wait(host_tasks, timeout=poll_timeout)
                 break
             time.sleep(search_rate)
         else:
@@ -1,7 +1,6 @@
 from datetime import datetime, timedelta
 import time
 
-from box import Box
 from dateutil.parser import parse
 
 from robottelo.constants import (
@@ -48,10 +47,9 @@ class CapsuleInfo:
         :param search_query: Search query that will be passed to API call.
         :param search_rate: Delay between searches.
         :param max_tries: How many times search should be executed.
-        :param poll_rate: Delay between the end of one task check-up and
-            the start of the next check-up. Parameter for ``sat.api.ForemanTask.poll()`` method.
-        :param poll_timeout: Maximum number of seconds to wait until timing out.
-            Parameter for ``sat.api.ForemanTask.poll()`` method.
+        :param poll_rate: Unused, the tasks are polled by the Satellite's task watcher,
+            see :attr:`robottelo.hosts.Satellite.task_watcher`.
+        :param poll_timeout: Maximum number of seconds to wait for all the tasks to finish.
         :param must_succeed: Assert success result on finished task.
         :return: List of ``sat.api.ForemanTask`` entities.
         :raises: ``AssertionError``. If not tasks were found until timeout.
@@ -59,8 +57,9 @@ class CapsuleInfo:
         for _ in range(max_tries):
             tasks = self.satellite.api.ForemanTask().search(query={'search': search_query})
             if tasks:
-                for task in tasks:
-                    task.poll(poll_rate=poll_rate, timeout=poll_timeout, must_succeed=must_succeed)
+                self.satellite.task_watcher.wait(
+                    tasks, timeout=poll_timeout, must_succeed=must_succeed
+                )
                 break
             time.sleep(search_rate)
         else:
@@ -108,11 +107,12 @@ class CapsuleInfo:
             f" and the `last_sync_time`: {sync_status['last_sync_time']},"
             f" was prior to the `start_time`: {start_time}."
         )
-        sync_tasks = []
         # Poll and verify succeeds, any active sync task from initial status.
         logger.info(f"Active tasks: {sync_status['active_sync_tasks']}")
-        for task in sync_status['active_sync_tasks']:
-            sync_tasks.append(self.satellite.api.ForemanTask(id=task['id']).poll(timeout=timeout))
+        sync_tasks = self.satellite.task_watcher.wait(
+            sync_status['active_sync_tasks'], timeout=timeout
+        )
+        for task in sync_tasks:
             logger.info(f"Active sync task :id {task['id']} succeeded.")
 
         # Fetch updated capsule status (expect no ongoing sync)
@@ -155,17 +155,39 @@ class CapsuleInfo:
             return f'{self.url}/pulp/content/{org}/{lce}/{cv}/custom/{prod}/{repo}/'
         return f'{self.url}/pulp/content/{org}/Library/custom/{prod}/{repo}/'
 
-    def get_artifacts(self, since=None, tz='UTC'):
+    def get_artifacts(self, since=None, tz='UTC', info=False):
         """Get paths of pulp artifact.
 
         :param str since: Creation time of artifact we are looking for.
         :param str tz: Time zone for `since` param.
+        :param bool info: Whether to return the information of the artifacts, see
+            ``get_artifacts_info``, instead of their paths.
         :return: A list of artifacts paths.
         """
         query = f'find {PULP_ARTIFACT_DIR} -type f'
         if since:
             query = f'{query} -newermt "{since} {tz}"'
-        return self.execute(query).stdout.splitlines()
+        paths = self.execute(query).stdout.splitlines()
+        return self.get_artifacts_info(paths=paths) if info else paths
+
+    def get_artifacts_info(self, checksums=None, paths=None, workers=1):
+        """Returns information about pulp artifacts if found on FS,
+        throws FileNotFoundError otherwise.
+
+        All the artifacts are inspected by one command, see ``inspect_files``.
+
+        :param checksums: Checksums of the artifacts to look for.
+        :param paths: Paths to the artifacts.
+        :param workers: Number of artifacts hashed in parallel on the host.
+        :return: A list of Boxes with artifact path, size, latest sum, info and mime type.
+        """
+        paths = list(paths or []) + [
+            f'{PULP_ARTIFACT_DIR}{checksum[0:2]}/{checksum[2:]}' for checksum in checksums or []
+        ]
+        artifacts = self.inspect_files(paths, workers=workers)
+        if missing := [artifact.path for artifact in artifacts if 'error' in artifact]:
+            raise FileNotFoundError(f'Artifacts not found: {", ".join(missing)}')
+        return artifacts
 
     def get_artifact_info(self, checksum=None, path=None):
         """Returns information about pulp artifact if found on FS,
@@ -173,7 +195,7 @@ class CapsuleInfo:
 
         :param checksum: Checksum of the artifact to look for.
         :param path: Path to the artifact.
-        :return: A Box with artifact path, size, latest sum and info.
+        :return: A Box with artifact path, size, latest sum, info and mime type.
         """
         if not (checksum or path):
             raise ValueError('Either checksum or path must be specified')
@@ -181,11 +203,7 @@ class CapsuleInfo:
         if not path:
             path = f'{PULP_ARTIFACT_DIR}{checksum[0:2]}/{checksum[2:]}'
 
-        res = self.execute(f'stat --format %s {path}')
-        if res.status:
-            raise FileNotFoundError(f'Artifact not found: {path}')
-        size = int(res.stdout)
-        real_sum = self.execute(f'sha256sum {path}').stdout.split()[0]
-        info = self.execute(f'file {path}').stdout.strip().split(': ')[1]
-
-        return Box(path=path, size=size, sum=real_sum, info=info)
+        try:
+            return self.get_artifacts_info(paths=[path])[0]
+        except FileNotFoundError:
+            raise FileNotFoundError(f'Artifact not found: {path}') from None
@@ -27,10 +27,13 @@ from fauxfactory import (
 )
 
 from robottelo import constants
+from robottelo.cli.base import CreatedRecord
 from robottelo.cli.proxy import CapsuleTunnelError
 from robottelo.config import settings
 from robottelo.exceptions import CLIFactoryError, CLIReturnCodeError
 from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
+from robottelo.logging import logger
+from robottelo.utils.concurrency import run_concurrently
 from robottelo.utils.manifest import clone
 
 
@@ -62,6 +65,9 @@ def create_object(cli_object, options, values=None, credentials=None, timeout=No
     # Sometimes we get a list with a dictionary and not a dictionary.
     if isinstance(result, list) and len(result) > 0:
         result = result[0]
+    if isinstance(result, CreatedRecord):
+        # copying it would read the whole record
+        return result
     return Box(result)
 
 
@@ -300,11 +306,58 @@ class CLIFactory:
     @lru_cache
     def _find_entity_class(self, entity_name):
         entity_name = entity_name.replace('_', '').lower()
-        for name, class_obj in self._satellite.cli.__dict__.items():
+        # the cli namespace is lazy, look the name up among all the classes it can provide
+        for name in dir(self._satellite.cli):
             if entity_name == name.lower():
-                return class_obj
+                return getattr(self._satellite.cli, name)
         return None
 
+    def make_many(
+        self, entity, count, fetch_info=None, max_workers=None, raise_on_error=True, **overrides
+    ):
+        """Create ``count`` entities of the same kind concurrently.
+
+        Each entity gets its own default values, as with ``make_<entity>``. Entities defined in
+        ``ENTITY_FIELDS`` are created on a thread pool, each with a private copy of the cli
+        class, since hammer classes keep the current subcommand in class attributes. Entities
+        with a dedicated ``make_<entity>`` method are created one after the other.
+
+        :param str entity: the entity name, e.g. ``org`` to call ``make_org``.
+        :param int count: the number of entities to create.
+        :param bool fetch_info: re-read each created entity with ``info``. When False, the
+            ``create`` output, i.e. the id and name, is returned as a
+            :class:`robottelo.cli.base.CreatedRecord`, which runs ``info`` only once another
+            field is needed, unless the entity type always needs ``info``.
+            ``settings.performance.fetch_after_create`` by default. Dedicated
+            ``make_<entity>`` methods ignore it.
+        :param int max_workers: the maximum number of concurrent creations,
+            ``settings.performance.bulk_workers`` by default.
+        :param bool raise_on_error: raise :class:`robottelo.exceptions.BulkOperationError`
+            once all creations finished if any of them failed. When False, failed entities are
+            ``None`` in the result and their errors are logged.
+        :param overrides: options common to all the entities, underscores in option names are
+            replaced with dashes, e.g. ``organization_id=1``.
+        :return: a list of dictionaries representing the created entities, in request order.
+        """
+        options = {key.replace('_', '-'): value for key, value in overrides.items()}
+        entity = entity.removeprefix('make_')
+        calls = []
+        for _ in range(count):
+            maker = getattr(self, f'make_{entity}')
+            if isinstance(maker, partial) and maker.func is create_object:
+                cli_object, fields = maker.args
+                attrs = {} if fetch_info is None else {'fetch_after_create': fetch_info}
+                cli_object = type(cli_object.__name__, (cli_object,), attrs)
+                calls.append(partial(create_object, cli_object, fields, dict(options)))
+            else:
+                # dedicated make methods share the classes of the cli namespace
+                max_workers = 1
+                calls.append(partial(maker, dict(options)))
+        results, errors = run_concurrently(calls, max_workers, raise_on_error)
+        for index, err in errors.items():
+            logger.warning(f'make_many {entity}: item {index} failed: {err}')
+        return results
+
     def make_content_credential(self, options=None):
         """Creates a content credential.
 
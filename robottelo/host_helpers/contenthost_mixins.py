@@ -7,6 +7,7 @@ from tempfile import NamedTemporaryFile
 from robottelo import constants
 from robottelo.config import robottelo_tmp_dir, settings
 from robottelo.logging import logger
+from robottelo.utils import remote_inspection
 from robottelo.utils.ohsnap import dogfood_repofile_url, dogfood_repository
 
 
@@ -144,6 +145,31 @@ class HostInfo:
         self.run('subscription-manager repos')
         return self.nailgun_host.read().content_facet_attributes['applicable_package_count']
 
+    def inspect_files(self, paths, workers=1):
+        """Return the size, sha256 sum, ``file`` description and mime type of files
+
+        All the files are read by one command, instead of a few commands per file.
+
+        :param list paths: paths of the files.
+        :param int workers: number of files read and hashed in parallel on the host.
+        :return: a list of Boxes with the ``path``, and the ``size``, ``sum``, ``info`` and
+            ``mime`` of each file, or the ``error`` reading it.
+        """
+        return remote_inspection.inspect(self, 'path', paths, workers=workers)
+
+    def inspect_urls(self, urls, sum_type='sha256sum', workers=1):
+        """Return the size and checksum of files downloaded by the host
+
+        :param list urls: URLs of the files.
+        :param str sum_type: Checksum type like md5sum, sha256sum, sha512sum, etc.
+        :param int workers: number of files downloaded and hashed in parallel on the host.
+        :return: a list of Boxes with the ``url``, and the ``size`` and ``sum`` of each file,
+            or the ``error`` downloading it.
+        """
+        return remote_inspection.inspect(
+            self, 'url', urls, algorithm=sum_type.removesuffix('sum'), workers=workers
+        )
+
 
 class SystemFacts:
     """Helpers mixin that enables getting/setting subscription-manager facts on a host"""
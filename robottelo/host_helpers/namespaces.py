@@ -0,0 +1,84 @@
+"""Lazily populated ``cli`` and ``api`` namespaces of host objects
+
+Robottelo cli modules and nailgun entities are looked up once per process, in the registries
+below. Each host object then gets a :class:`LazyNamespace` which only creates the host specific
+wrapper of a class, e.g. a cli class bound to the host's hostname, the first time it is accessed.
+"""
+
+from functools import lru_cache
+import importlib
+from pathlib import Path
+
+from robottelo.cli.base import Base
+
+CLI_DIR = Path(__file__).resolve().parent.parent.joinpath('cli')
+
+
+@lru_cache
+def cli_registry(prefix=''):
+    """Import the robottelo cli modules whose name starts with ``prefix``, once
+
+    :return: a dict mapping class names to the :class:`robottelo.cli.base.Base` subclasses
+    """
+    registry = {}
+    for file in sorted(CLI_DIR.iterdir()):
+        if file.suffix == '.py' and not file.name.startswith('_') and file.name.startswith(prefix):
+            cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
+            for name, obj in cli_module.__dict__.items():
+                if isinstance(obj, type) and issubclass(obj, Base):
+                    registry[name] = obj
+    return registry
+
+
+def sm_cli_registry():
+    """The registry of satellite-maintain cli classes"""
+    return cli_registry('sm_')
+
+
+@lru_cache
+def api_registry():
+    """Import nailgun entities, once
+
+    :return: a dict mapping class names to the nailgun ``Entity`` subclasses
+    """
+    from nailgun import entities
+    from nailgun.entity_mixins import Entity
+
+    return {
+        name: obj
+        for name, obj in entities.__dict__.items()
+        if isinstance(obj, type) and issubclass(obj, Entity)
+    }
+
+
+class LazyNamespace:
+    """A namespace creating the wrapper of a registered class on first attribute access
+
+    The wrapper is stored on the namespace, so it is created once per namespace.
+
+    :param registry: a callable returning a dict mapping names to classes
+    :param wrap: a callable taking a name and a class, returning the wrapper class
+    """
+
+    _configured = True
+
+    def __init__(self, registry, wrap):
+        self._registry = registry
+        self._wrap = wrap
+
+    def __getattr__(self, name):
+        # only reached for attributes not created yet, private ones are never registered
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            cls = self._registry()[name]
+        except KeyError:
+            raise AttributeError(
+                f'{type(self).__name__} has no registered class named {name!r}'
+            ) from None
+        wrapper = self._wrap(name, cls)
+        setattr(self, name, wrapper)
+        return wrapper
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._registry()))
@@ -3,8 +3,11 @@ All the Repository classes in this module are supposed to use from sat_object.cl
 The direct import of the repo classes in this module is prohibited !!!!!
 """
 
+from concurrent import futures
 import inspect
+import json
 import sys
+import threading
 
 from robottelo import constants
 from robottelo.config import settings
@@ -17,6 +20,8 @@ from robottelo.exceptions import (
     RepositoryDataNotFound,
 )
 
+REPO_SYNC_TIMEOUT = 4800  # seconds
+
 
 def initiate_repo_helpers(satellite):
     return {
@@ -105,7 +110,16 @@ class BaseRepository:
 
     def synchronize(self):
         """Synchronize the repository"""
-        self.satellite.cli.Repository.synchronize({'id': self.repo_info['id']}, timeout=4800000)
+        self.satellite.cli.Repository.synchronize(
+            {'id': self.repo_info['id']}, timeout=REPO_SYNC_TIMEOUT * 1000
+        )
+
+    def synchronize_async(self):
+        """Start synchronizing the repository, without waiting for the end of the sync
+
+        :return: the synchronization task, as returned by the API
+        """
+        return self.satellite.api.Repository(id=self.repo_info['id']).sync(synchronous=False)
 
     def add_to_content_view(self, organization_id, content_view_id):
         """Associate repository content to content-view"""
@@ -435,7 +449,12 @@ class GenericRHRepository(BaseRepository):
             if synchronize:
                 self.synchronize()
         else:
-            repo_info = super().create(organization_id, product_id, download_policy=download_policy)
+            repo_info = super().create(
+                organization_id,
+                product_id,
+                download_policy=download_policy,
+                synchronize=synchronize,
+            )
         return repo_info
 
 
@@ -497,6 +516,34 @@ class RHELServerExtras(GenericRHRepository):
     _key = constants.PRODUCT_KEY_RHEL_EXTRAS
 
 
+class ContentSetupRuns:
+    """Pipelined content setups shared by identical repository collections
+
+    Collections of the same repositories set up on the same Satellite with the same arguments
+    and the same :class:`ContentSetupRuns` share a single run, see
+    :meth:`RepositoryCollection.setup_content`. The runs are forgotten with this object, create
+    one for the scope the shared content is valid in, e.g. a module scoped fixture.
+    """
+
+    def __init__(self):
+        self._runs = {}
+        self._lock = threading.Lock()
+
+    def start(self, key):
+        """Return the future of the run of ``key`` and whether the caller has to do it"""
+        with self._lock:
+            run = self._runs.get(key)
+            if run is not None:
+                return run, False
+            run = self._runs[key] = futures.Future()
+            return run, True
+
+    def discard(self, key):
+        """Forget a failed run, the next caller does it again"""
+        with self._lock:
+            del self._runs[key]
+
+
 class RepositoryCollection:
     """Repository collection"""
 
@@ -613,16 +660,31 @@ class RepositoryCollection:
     def __iter__(self):
         yield from self._items
 
-    def setup(self, org_id, download_policy='on_demand', synchronize=True):
+    def setup(self, org_id, download_policy='on_demand', synchronize=True, pipelined=False):
         """Setup the repositories on server.
 
         Recommended usage: repository only setup, for full content setup see
             setup_content.
+
+        :param pipelined: start the synchronization of each repository as soon as it is
+            created, through the API, and wait for all of them at the end.
+        """
+        custom_product, repos_info, sync_tasks = self._setup(
+            org_id, download_policy=download_policy, synchronize=synchronize, pipelined=pipelined
+        )
+        if sync_tasks:
+            self.satellite.task_watcher.wait(sync_tasks, timeout=REPO_SYNC_TIMEOUT)
+        return custom_product, repos_info
+
+    def _setup(self, org_id, download_policy='on_demand', synchronize=True, pipelined=False):
+        """Create the repositories, return the product, the repositories and the sync tasks
+        started in pipelined mode, which are not waited for.
         """
         if self._repos_info:
             raise RepositoryAlreadyCreated('Repositories already created')
         custom_product = None
         repos_info = []
+        sync_tasks = []
         if any(not repo.cdn for repo in self):
             custom_product = self.satellite.cli_factory.make_product_wait(
                 {'organization-id': org_id}
@@ -633,16 +695,21 @@ class RepositoryCollection:
                 org_id,
                 custom_product_id,
                 download_policy=download_policy,
-                synchronize=synchronize,
+                synchronize=synchronize and not pipelined,
             )
+            if synchronize and pipelined:
+                # the repository syncs while the next ones are created
+                sync_tasks.append(repo.synchronize_async())
             repos_info.append(repo_info)
         self._custom_product_info = custom_product
         self._repos_info = repos_info
-        return custom_product, repos_info
+        return custom_product, repos_info, sync_tasks
 
-    def setup_content_view(self, org_id, lce_id=None):
+    def setup_content_view(self, org_id, lce_id=None, sync_tasks=None):
         """Setup organization content view by adding all the repositories, publishing and promoting
         to lce if needed.
+
+        :param sync_tasks: repository synchronization tasks to wait for before publishing.
         """
         if lce_id is None:
             lce = self.satellite.cli_factory.make_lifecycle_environment({'organization-id': org_id})
@@ -654,6 +721,8 @@ class RepositoryCollection:
         # Add repositories to content view
         for repo in self:
             repo.add_to_content_view(org_id, content_view['id'])
+        if sync_tasks:
+            self.satellite.task_watcher.wait(sync_tasks, timeout=REPO_SYNC_TIMEOUT)
         # Publish the content view
         self.satellite.cli.ContentView.publish({'id': content_view['id']})
         if lce['name'] != constants.ENVIRONMENT:
@@ -744,6 +813,8 @@ class RepositoryCollection:
         download_policy='on_demand',
         rh_subscriptions=None,
         override=None,
+        pipelined=None,
+        shared_runs=None,
     ):
         """
         Setup content view and activation key of all the repositories.
@@ -755,11 +826,61 @@ class RepositoryCollection:
         :param download_policy: The repositories download policy
         :param rh_subscriptions: The RH subscriptions to be added to activation key
         :param override: Content override (True = enable, False = disable, None = no action)
+        :param pipelined: Synchronize the repositories in parallel while the content view is
+            created, and publish it once they are all synchronized.
+            Defaults to ``settings.performance.pipelined_content_setup``.
+        :param ContentSetupRuns shared_runs: in pipelined mode, collections of the same
+            repositories set up on the same Satellite with the same arguments and the same
+            ``shared_runs`` share a single run: the first one does the setup, the others wait
+            for it and reuse its content.
         """
         if self._repos_info:
             raise RepositoryAlreadyCreated('Repositories already created can not setup content')
         if rh_subscriptions is None:
             rh_subscriptions = []
+        if pipelined is None:
+            pipelined = settings.performance.pipelined_content_setup
+        args = (org_id, lce_id, upload_manifest, download_policy, rh_subscriptions, override)
+        if not (pipelined and shared_runs):
+            return self._setup_content(*args, pipelined=pipelined)
+        key = json.dumps(
+            [self.satellite.hostname, self.distro, self.repos_data, *args],
+            sort_keys=True,
+            default=str,
+        )
+        run, owner = shared_runs.start(key)
+        if not owner:
+            self._reuse_content(run.result())
+            return self._setup_content_data
+        try:
+            setup_content_data = self._setup_content(*args, pipelined=True)
+        except Exception as err:
+            shared_runs.discard(key)
+            run.set_exception(err)
+            raise
+        run.set_result(self)
+        return setup_content_data
+
+    def _reuse_content(self, collection):
+        """Take over the content set up by an identical collection"""
+        for repo, source_repo in zip(self, collection, strict=True):
+            repo._repo_info = source_repo.repo_info
+        self._custom_product_info = collection.custom_product
+        self._repos_info = collection.repos_info
+        self._org = collection.organization
+        self._setup_content_data = collection.setup_content_data
+
+    def _setup_content(
+        self,
+        org_id,
+        lce_id,
+        upload_manifest,
+        download_policy,
+        rh_subscriptions,
+        override,
+        pipelined,
+    ):
+        """Setup the content, see :meth:`setup_content`"""
         if self.need_subscription:
             # upload manifest only when needed
             if upload_manifest and not self.organization_has_manifest(org_id):
@@ -767,8 +888,10 @@ class RepositoryCollection:
             if not rh_subscriptions:
                 # add the default subscription if no subscription provided
                 rh_subscriptions = [constants.DEFAULT_SUBSCRIPTION_NAME]
-        custom_product, repos_info = self.setup(org_id=org_id, download_policy=download_policy)
-        content_view, lce = self.setup_content_view(org_id, lce_id)
+        custom_product, repos_info, sync_tasks = self._setup(
+            org_id=org_id, download_policy=download_policy, pipelined=pipelined
+        )
+        content_view, lce = self.setup_content_view(org_id, lce_id, sync_tasks=sync_tasks)
         custom_product_name = custom_product['name'] if custom_product else None
         subscription_names = list(rh_subscriptions)
         if custom_product_name:
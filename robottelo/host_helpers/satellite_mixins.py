@@ -5,9 +5,9 @@ import os
 import random
 import re
 
-import requests
 from wait_for import TimedOutError, wait_for
 
+from robottelo import content_info
 from robottelo.cli.proxy import CapsuleTunnelError
 from robottelo.config import settings
 from robottelo.constants import (
@@ -65,31 +65,16 @@ class ContentInfo:
         # of different paths)
         return sorted(repo_file for repo_file in result.stdout.splitlines() if repo_file)
 
-    def get_repo_files_by_url(self, url, extension='rpm'):
+    def get_repo_files_by_url(self, url, extension='rpm', from_repodata=False):
         """Returns a list of repo files (for example rpms) in a specific repository
         published at some url.
         :param url: url where the repo or CV is published
         :param extension: extension of searched files. Defaults to 'rpm'
+        :param from_repodata: list the rpms from the primary repodata of the repository
+            instead of crawling its directory indexes.
         :return:  list representing rpm package names
         """
-        if not url.endswith('/'):
-            url += '/'
-
-        result = requests.get(url, verify=False)
-        if result.status_code != 200:
-            raise requests.HTTPError(f'{url} is not accessible')
-
-        links = re.findall(r'(?<=href=").*?(?=">)', result.text)
-
-        if 'Packages/' not in links:
-            return sorted(line for line in links if extension in line)
-
-        files = []
-        subs = self.get_repo_files_by_url(f'{url}Packages/', extension='/')
-        for sub in subs:
-            files.extend(self.get_repo_files_by_url(f'{url}Packages/{sub}', extension))
-
-        return sorted(files)
+        return content_info.get_repo_files_by_url(url, extension, from_repodata=from_repodata)
 
     def get_repomd(self, repo_url):
         """Fetches content of the repomd file of a repository
@@ -97,12 +82,7 @@ class ContentInfo:
         :param repo_url: the 'Published_At' link of a repo
         :return: string with repomd content
         """
-        repomd_path = 'repodata/repomd.xml'
-        result = requests.get(f'{repo_url}/{repomd_path}', verify=False)
-        if result.status_code != 200:
-            raise requests.HTTPError(f'{repo_url}/{repomd_path} is not accessible')
-
-        return result.text
+        return content_info.get_repomd(repo_url)
 
     def get_repomd_revision(self, repo_url):
         """Fetches a revision of a repository.
@@ -130,12 +110,32 @@ class ContentInfo:
             reached or calculation was not successful).
         """
         filename = url.split('/')[-1]
-        result = self.execute(f'wget -q --spider {url}')
+        result = self.execute(
+            f'set -o pipefail; wget -qO - {url} | {sum_type} | awk \'{{print $1}}\''
+        )
         if result.status != 0:
             raise AssertionError(f'Failed to get `{filename}` from `{url}`.')
-        return self.execute(
-            f'wget -qO - {url} | tee {filename} | {sum_type} | awk \'{{print $1}}\''
-        ).stdout.strip()
+        return result.stdout.strip()
+
+    def checksums_by_url(self, urls, sum_type='md5sum', workers=4):
+        """Returns desired checksums of files, accessible via URLs, downloaded and
+        calculated by a single command. Prefer it to :meth:`checksum_by_url` in a loop.
+
+        :param list urls: URLs of the files.
+        :param str sum_type: Checksum type like md5sum, sha256sum, sha512sum, etc.
+            Defaults to md5sum.
+        :param int workers: number of files downloaded and hashed in parallel.
+        :return list: strings containing the checksums, in the order of ``urls``.
+        :raises: AssertionError: If a file couldn't be reached.
+        """
+        results = self.inspect_urls(urls, sum_type=sum_type, workers=workers)
+        for result in results:
+            if 'error' in result:
+                filename = result.url.split('/')[-1]
+                raise AssertionError(
+                    f'Failed to get `{filename}` from `{result.url}`: {result.error}'
+                )
+        return [result.sum for result in results]
 
     def upload_manifest(self, org_id, manifest=None, interface='API', timeout=None):
         """Upload a manifest using the requested interface.
@@ -0,0 +1,170 @@
+"""Shared watcher of a Satellite's Foreman tasks
+
+``ForemanTask.poll`` sends one request per task and per poll interval, so fixtures waiting on
+many sync or publish tasks at once flood the Satellite with identical requests. A
+:class:`TaskWatcher` belongs to a Satellite, see :attr:`robottelo.hosts.Satellite.task_watcher`.
+It polls all the tasks any waiter is waiting for with a single search per tick, and resolves a
+:class:`concurrent.futures.Future` per task once it finished.
+
+The interval between two searches starts at ``min_interval``, grows while no task finishes and
+goes back to ``min_interval`` when a task finishes or a new one is watched.
+"""
+
+from collections import Counter
+from concurrent import futures
+import threading
+import time
+
+from nailgun import entity_mixins
+from nailgun.entity_mixins import TaskFailedError, TaskTimedOutError
+
+from robottelo.logging import logger
+
+FINISHED_STATES = ('paused', 'stopped')
+
+
+def _task_id(task):
+    """Return the id of a task given as an id, a ``ForemanTask`` entity or an API response"""
+    if isinstance(task, dict):
+        return str(task['id'])
+    return str(getattr(task, 'id', task))
+
+
+class TaskWatcher:
+    """Poll the Foreman tasks of a Satellite in batches
+
+    :param satellite: the Satellite running the tasks.
+    :param min_interval: seconds between two searches while tasks keep finishing.
+    :param max_interval: maximum number of seconds between two searches.
+    :param backoff: factor applied to the interval after a search where no task finished.
+    :param max_failures: number of consecutive failed searches after which all the watched
+        tasks are failed with the search error.
+    """
+
+    def __init__(self, satellite, min_interval=1, max_interval=15, backoff=1.5, max_failures=5):
+        self._satellite = satellite
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_failures = max_failures
+        self.searches = 0
+        self._futures = {}
+        self._waiters = Counter()
+        self._lock = threading.RLock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def watch(self, task_id):
+        """Start watching a task
+
+        :param task_id: the id of the task, a ``ForemanTask`` entity or a task dictionary as
+            returned by the API, e.g. by ``repository.sync(synchronous=False)``.
+        :return: a :class:`concurrent.futures.Future` resolved with the task information, as
+            returned by the API, once the task is stopped or paused. Waiters of the same task
+            share the future.
+        """
+        task_id = _task_id(task_id)
+        with self._lock:
+            future = self._futures.get(task_id)
+            if future is None or future.cancelled():
+                future = self._futures[task_id] = futures.Future()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f'task-watcher-{self._satellite.hostname}', daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+        return future
+
+    def wait(self, task_ids, timeout=None, must_succeed=True):
+        """Wait for several tasks to finish
+
+        :param task_ids: a list of tasks, as accepted by :meth:`watch`.
+        :param timeout: maximum number of seconds to wait for all the tasks,
+            ``nailgun.entity_mixins.TASK_TIMEOUT`` by default.
+        :param must_succeed: raise if a task finished with a result other than success.
+        :return: the information of each task, in the order of ``task_ids``.
+        :raises nailgun.entity_mixins.TaskTimedOutError: if the tasks did not finish in time.
+        :raises nailgun.entity_mixins.TaskFailedError: if ``must_succeed`` is set and a task
+            did not succeed.
+        """
+        deadline = time.monotonic() + (timeout or entity_mixins.TASK_TIMEOUT)
+        with self._lock:
+            watched = [(_task_id(task_id), self.watch(task_id)) for task_id in task_ids]
+            self._waiters.update(task_id for task_id, _ in watched)
+        try:
+            results = []
+            for task_id, future in watched:
+                try:
+                    task_info = future.result(timeout=max(0, deadline - time.monotonic()))
+                except futures.TimeoutError:
+                    raise TaskTimedOutError(f'Timed out waiting for task {task_id}') from None
+                if must_succeed and task_info['result'] != 'success':
+                    raise TaskFailedError(
+                        f'Task {task_id} did not succeed. Task information: {task_info}'
+                    )
+                results.append(task_info)
+            return results
+        finally:
+            self._release(watched)
+
+    def _release(self, watched):
+        """Stop watching the unfinished tasks of a wait that no other wait is waiting for"""
+        with self._lock:
+            for task_id, future in watched:
+                self._waiters[task_id] -= 1
+                if self._waiters[task_id] > 0:
+                    continue
+                del self._waiters[task_id]
+                if self._futures.get(task_id) is future and future.cancel():
+                    del self._futures[task_id]
+
+    def _search(self, task_ids):
+        """Fetch the information of all the given tasks with one request"""
+        self.searches += 1
+        query = {'search': f'id ^ ({",".join(task_ids)})', 'per_page': len(task_ids)}
+        return self._satellite.api.ForemanTask().search_json(query=query)['results']
+
+    def _run(self):
+        interval = self.min_interval
+        failures = 0
+        while True:
+            with self._lock:
+                for task_id in [key for key, value in self._futures.items() if value.cancelled()]:
+                    del self._futures[task_id]
+                if not self._futures:
+                    self._thread = None
+                    return
+                task_ids = list(self._futures)
+            self._wakeup.clear()
+            try:
+                tasks = self._search(task_ids)
+                failures = 0
+            except Exception as err:
+                failures += 1
+                logger.warning(f'Failed to search tasks on {self._satellite.hostname}: {err}')
+                if failures >= self.max_failures:
+                    failures = 0
+                    with self._lock:
+                        failed, self._futures = self._futures, {}
+                    for future in failed.values():
+                        if future.set_running_or_notify_cancel():
+                            future.set_exception(err)
+                tasks = []
+            finished = []
+            with self._lock:
+                for task in tasks:
+                    if task['state'] in FINISHED_STATES:
+                        future = self._futures.pop(str(task['id']), None)
+                        if future is not None:
+                            finished.append((future, task))
+            # resolve outside of the lock, futures run their callbacks right away
+            for future, task in finished:
+                if future.set_running_or_notify_cancel():
+                    future.set_result(task)
+            if finished:
+                interval = self.min_interval
+            else:
+                interval = min(interval * self.backoff, self.max_interval)
+            if self._wakeup.wait(interval):
+                interval = self.min_interval
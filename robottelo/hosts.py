@@ -2,13 +2,14 @@ from configparser import ConfigParser
 import contextlib
 from contextlib import contextmanager
 from datetime import datetime
+import functools
 from functools import cached_property, lru_cache
-import importlib
 import io
 import json
 from pathlib import Path, PurePath
 import random
 import re
+import shlex
 from tempfile import NamedTemporaryFile
 import time
 from urllib.parse import urljoin, urlparse, urlunsplit
@@ -53,10 +54,22 @@ from robottelo.constants import (
     RHSSO_USER_UPDATE,
     SATELLITE_VERSION,
 )
-from robottelo.exceptions import CLIFactoryError, DownloadFileError, HostPingFailed
+from robottelo.exceptions import (
+    CLIFactoryError,
+    DownloadFileError,
+    HostFactError,
+    HostPingFailed,
+)
 from robottelo.host_helpers import CapsuleMixins, ContentHostMixins, SatelliteMixins
+from robottelo.host_helpers.namespaces import (
+    LazyNamespace,
+    api_registry,
+    cli_registry,
+    sm_cli_registry,
+)
+from robottelo.host_helpers.task_watcher import TaskWatcher
 from robottelo.logging import logger
-from robottelo.utils import validate_ssh_pub_key
+from robottelo.utils import apidoc_cache, host_facts, validate_ssh_pub_key
 from robottelo.utils.datafactory import valid_emails_list
 from robottelo.utils.installer import InstallerCommand
 
@@ -66,6 +79,19 @@ POWER_OPERATIONS = {
     'reboot': 'reboot',
     # TODO paused, suspended, shelved?
 }
+# the configuration a test may add or edit on a content host, restored by ContentHost.reset:
+# repositories, package manager and dnf module settings, subscription-manager configuration and
+# custom facts, and the SSH keys of remote execution
+RESET_PATHS = (
+    '/etc/yum.repos.d',
+    '/etc/yum.conf',
+    '/etc/yum',
+    '/etc/dnf',
+    '/etc/rhsm',
+    '/etc/hosts',
+    '/root/.ssh',
+)
+SYSTEM_STATE_BACKUP = '/root/.robottelo_system_state.tar'
 
 
 @lru_cache
@@ -82,11 +108,19 @@ def lru_sat_ready_rhel(rhel_ver):
 
 def get_sat_version():
     """Try to read sat_version from envvar SATELLITE_VERSION
-    if not available fallback to ssh connection to get it."""
+    if not available fallback to ssh connection to get it.
+
+    The version read from the Satellite is cached, see :mod:`robottelo.utils.host_facts`.
+    """
 
     try:
-        sat_version = Satellite().version
-    except (AuthenticationError, ContentHostError, BoxKeyError):
+        sat_version = host_facts.get(
+            settings.server.hostname,
+            'version',
+            lambda: Satellite().version,
+            errors=(AuthenticationError, ContentHostError, BoxKeyError),
+        )
+    except HostFactError:
         if sat_version := str(settings.server.version.get('release')) == 'stream':
             sat_version = str(settings.robottelo.get('satellite_version'))
         if not sat_version:
@@ -96,11 +130,21 @@ def get_sat_version():
 
 def get_sat_rhel_version():
     """Try to read rhel_version from Satellite host
-    if not available fallback to robottelo configuration."""
+    if not available fallback to robottelo configuration.
+
+    The version read from the Satellite is cached, see :mod:`robottelo.utils.host_facts`.
+    """
 
     try:
-        return Satellite().os_version
-    except (AuthenticationError, ContentHostError, BoxKeyError):
+        return Version(
+            host_facts.get(
+                settings.server.hostname,
+                'rhel_version',
+                lambda: str(Satellite().os_version),
+                errors=(AuthenticationError, ContentHostError, BoxKeyError),
+            )
+        )
+    except HostFactError:
         if hasattr(settings.server.version, 'rhel_version'):
             rhel_version = str(settings.server.version.rhel_version)
         elif hasattr(settings.robottelo, 'rhel_version'):
@@ -401,6 +445,98 @@ class ContentHost(Host, ContentHostMixins):
 
         logger.debug('END: tearing down host %s', self)
 
+    @property
+    def package_manager(self):
+        """The package manager command of the host, ``yum`` before RHEL 8 and ``dnf`` after"""
+        return 'yum' if self.os_version.major < 8 else 'dnf'
+
+    def _enabled_services(self):
+        """Return the names of the services enabled at boot"""
+        if self.os_version.major < 7:
+            lines = self.execute('chkconfig --list').stdout.splitlines()
+            return sorted(line.split()[0] for line in lines if ':on' in line)
+        lines = self.execute(
+            'systemctl list-unit-files --type=service --state=enabled --no-legend'
+        ).stdout.splitlines()
+        return sorted(line.split()[0] for line in lines if line.strip())
+
+    def system_state(self):
+        """Return the state of the host checked by ``reset``
+
+        :return: a dict of the installed packages as NEVRAs, the services enabled at boot and the
+            sha256 checksum of each file of ``RESET_PATHS``.
+        """
+        packages = self.execute(
+            "rpm -qa --qf '%{NAME}-%|EPOCH?{%{EPOCH}}:{0}|:%{VERSION}-%{RELEASE}.%{ARCH}\\n'"
+        ).stdout
+        checksums = self.execute(
+            f'find {" ".join(RESET_PATHS)} -type f -exec sha256sum {{}} + 2>/dev/null'
+        ).stdout
+        return {
+            'packages': sorted(packages.split()),
+            'services': self._enabled_services(),
+            'files': {
+                path: checksum
+                for checksum, path in (line.split(maxsplit=1) for line in checksums.splitlines())
+            },
+        }
+
+    def save_system_state(self):
+        """Back the files of ``RESET_PATHS`` up for ``reset`` and return the ``system_state``
+
+        :raises robottelo.hosts.ContentHostError: If the files could not be backed up.
+        """
+        paths = ' '.join(path.lstrip('/') for path in RESET_PATHS)
+        result = self.execute(
+            f'tar -C / -cpf {SYSTEM_STATE_BACKUP} --ignore-failed-read {paths} 2>/dev/null'
+        )
+        if result.status != 0:
+            raise ContentHostError(f'Failed to back up the configuration of {self.hostname}')
+        return self.system_state()
+
+    def reset(self, state):
+        """Reset a torn down host, for another test to use it instead of a new host
+
+        Remove the katello-ca rpm and the packages installed since ``state`` was saved by
+        ``save_system_state``, disable the services enabled since then, restore the files of
+        ``RESET_PATHS`` from their backup and clean the package manager cache. The host is then
+        checked to be unregistered and back to ``state``. Packages which were updated,
+        downgraded or removed are not restored, they fail the check.
+
+        :param state: the state of the host returned by ``save_system_state``.
+        :raises robottelo.hosts.ContentHostError: If the host could not be reset.
+        """
+        self.remove_katello_ca()
+        current = self.system_state()
+        # NEVRAs are name-[epoch:]version-release.arch, neither version nor release have a dash
+        installed = {nevra.rsplit('-', 2)[0] for nevra in state['packages']}
+        added = {nevra.rsplit('-', 2)[0] for nevra in current['packages']} - installed
+        if added:
+            self.execute(f'{self.package_manager} remove -y {shlex.join(sorted(added))}')
+        if services := sorted(set(current['services']) - set(state['services'])):
+            if self.os_version.major < 7:
+                self.execute('; '.join(f'chkconfig {service} off' for service in services))
+            else:
+                self.execute(f'systemctl disable --now {shlex.join(services)}')
+        if added_files := sorted(set(current['files']) - set(state['files'])):
+            self.execute(f'rm -f {shlex.join(added_files)}')
+        if changed_files := sorted(
+            path
+            for path, checksum in state['files'].items()
+            if current['files'].get(path) != checksum
+        ):
+            paths = shlex.join(path.lstrip('/') for path in changed_files)
+            self.execute(f'tar -C / -xpf {SYSTEM_STATE_BACKUP} {paths}')
+        self.execute(f'{self.package_manager} clean all')
+        self.clean_cached_properties()
+        failed = []
+        if self.execute('subscription-manager identity').status == 0:
+            failed.append('still registered')
+        current = self.system_state()
+        failed.extend(f'{name} differ' for name, value in state.items() if current[name] != value)
+        if failed:
+            raise ContentHostError(f'Failed to reset {self.hostname}: {", ".join(failed)}')
+
     def power_control(self, state=VmState.RUNNING, ensure=True):
         """Lookup the host workflow for power on and execute
 
@@ -1728,29 +1864,14 @@ class Capsule(ContentHost, CapsuleMixins):
     @property
     def cli(self):
         """Import only satellite-maintain robottelo cli entities and wrap them under self.cli"""
-        self._cli = type('cli', (), {'_configured': False})
-        if self._cli._configured:
-            return self._cli
-
-        for file in Path('robottelo/cli/').iterdir():
-            if (
-                file.suffix == '.py'
-                and not file.name.startswith('_')
-                and file.name.startswith('sm_')
-            ):
-                cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
-                for name, obj in cli_module.__dict__.items():
-                    try:
-                        if Base in obj.mro():
-                            # create a copy of the class and set our hostname as a class attribute
-                            new_cls = type(name, (obj,), {'hostname': self.hostname})
-                            setattr(self._cli, name, new_cls)
-                    except AttributeError:
-                        # not everything has an mro method, we don't care about them
-                        pass
-        self._cli._configured = True
+        if not getattr(self, '_cli', None):
+            self._cli = LazyNamespace(sm_cli_registry, self._wrap_cli_class)
         return self._cli
 
+    def _wrap_cli_class(self, name, cli_class):
+        """Create a copy of ``cli_class`` with our hostname set as a class attribute"""
+        return type(name, (cli_class,), {'hostname': self.hostname})
+
     def enable_satellite_or_capsule_module_for_rhel8(self):
         """Enable Satellite/Capsule module for RHEL8.
         Note: Make sure required repos are enabled before using this.
@@ -1780,10 +1901,11 @@ class Satellite(Capsule, SatelliteMixins):
         self.omitting_credentials = False
         self.port = kwargs.get('port', settings.server.port)
         super().__init__(hostname=hostname, **kwargs)
-        # create dummy classes for later population
-        self._api = type('api', (), {'_configured': False})
-        self._cli = type('cli', (), {'_configured': False})
+        # namespaces are populated on first access
+        self._api = None
+        self._cli = None
         self._apidoc = None
+        self._task_watcher = None
         self.record_property = None
 
     def _swap_nailgun(self, new_version):
@@ -1794,7 +1916,8 @@ class Satellite(Capsule, SatelliteMixins):
 
         pip_main(['uninstall', '-y', 'nailgun'])
         pip_main(['install', f'https://github.com/SatelliteQE/nailgun/archive/{new_version}.zip'])
-        self._api = type('api', (), {'_configured': False})
+        self._api = None
+        api_registry.cache_clear()
         to_clear = [k for k in sys.modules if 'nailgun' in k]
         [sys.modules.pop(k) for k in to_clear]
 
@@ -1802,91 +1925,80 @@ class Satellite(Capsule, SatelliteMixins):
     def api(self):
         """Import all nailgun entities and wrap them under self.api"""
         if not self._api:
-            self._api = type('api', (), {'_configured': False})
-        if self._api._configured:
-            return self._api
-        from nailgun import entities as _entities  # use a private import
-        from nailgun.config import ServerConfig
-        from nailgun.entity_mixins import Entity
-
-        def inject_config(cls, server_config):
-            """inject a nailgun server config into the init of nailgun entity classes"""
-            import functools
-
-            class DecClass(cls):
-                __init__ = functools.partialmethod(cls.__init__, server_config=server_config)
-
-            return DecClass
-
-        # set the server configuration to point to this satellite
-        self.nailgun_cfg = ServerConfig(
-            auth=(settings.server.admin_username, settings.server.admin_password),
-            url=f'{self.url}',
-            verify=settings.server.verify_ca,
-        )
-        # add each nailgun entity to self.api, injecting our server config
-        for name, obj in _entities.__dict__.items():
-            try:
-                if Entity in obj.mro():
-                    #  create a copy of the class and inject our server config into the __init__
-                    new_cls = type(name, (obj,), {})
-                    setattr(self._api, name, inject_config(new_cls, self.nailgun_cfg))
-            except AttributeError:
-                # not everything has an mro method, we don't care about them
-                pass
-        self._api._configured = True
+            from nailgun.config import ServerConfig
+
+            # set the server configuration to point to this satellite
+            self.nailgun_cfg = ServerConfig(
+                auth=(settings.server.admin_username, settings.server.admin_password),
+                url=f'{self.url}',
+                verify=settings.server.verify_ca,
+            )
+            self._api = LazyNamespace(api_registry, self._wrap_api_entity)
         return self._api
 
+    def _wrap_api_entity(self, name, entity):
+        """Create a copy of nailgun ``entity`` with our server config injected into its init"""
+        return type(
+            name,
+            (entity,),
+            {'__init__': functools.partialmethod(entity.__init__, server_config=self.nailgun_cfg)},
+        )
+
     @property
     def apidoc(self):
         """Provide Satellite's apidoc via apypie"""
         if not self._apidoc:
+            # read the apidoc from the cache shared by all workers, only fetch it on a miss
+            try:
+                cache_dir, cache_name = apidoc_cache.cache_apidoc(self)
+                cache = {'apidoc_cache_dir': str(cache_dir), 'apidoc_cache_name': cache_name}
+            except Exception as err:
+                logger.warning(f'Unable to use the apidoc cache of {self.hostname}: {err}')
+                cache = {}
             self._apidoc = apypie.Api(
                 uri=self.url,
                 username=settings.server.admin_username,
                 password=settings.server.admin_password,
                 api_version=2,
                 verify_ssl=settings.server.verify_ca,
+                **cache,
             ).apidoc
         return self._apidoc
 
+    @property
+    def task_watcher(self):
+        """Watcher polling the Foreman tasks waited for on this Satellite in batches"""
+        if not self._task_watcher:
+            self._task_watcher = TaskWatcher(self)
+        return self._task_watcher
+
     @property
     def cli(self):
         """Import all robottelo cli entities and wrap them under self.cli"""
         if not self._cli:
-            self._cli = type('cli', (), {'_configured': False})
-        if self._cli._configured:
-            return self._cli
-
-        for file in Path('robottelo/cli/').iterdir():
-            if file.suffix == '.py' and not file.name.startswith('_'):
-                cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
-                for name, obj in cli_module.__dict__.items():
-                    try:
-                        if Base in obj.mro():
-                            # create a copy of the class and set our hostname as a class attribute
-                            new_cls = type(
-                                name,
-                                (obj,),
-                                {
-                                    'hostname': self.hostname,
-                                    'omitting_credentials': self.omitting_credentials,
-                                },
-                            )
-                            setattr(self._cli, name, new_cls)
-                    except AttributeError:
-                        # not everything has an mro method, we don't care about them
-                        pass
-        self._cli._configured = True
+            self._cli = LazyNamespace(cli_registry, self._wrap_cli_class)
         return self._cli
 
+    def _wrap_cli_class(self, name, cli_class):
+        """Create a copy of ``cli_class`` with our hostname set as a class attribute"""
+        return type(
+            name,
+            (cli_class,),
+            {
+                'hostname': self.hostname,
+                'omitting_credentials': self.omitting_credentials,
+                'use_hammer_shell': settings.performance.hammer_shell,
+                'fetch_after_create': settings.performance.fetch_after_create,
+            },
+        )
+
     @contextmanager
     def omit_credentials(self):
         change = not self.omitting_credentials  # if not already set to omit
         if change:
             self.omitting_credentials = True
             # if CLI is already created
-            if self._cli._configured:
+            if self._cli:
                 for name, obj in self._cli.__dict__.items():
                     with contextlib.suppress(
                         AttributeError
@@ -1896,7 +2008,7 @@ class Satellite(Capsule, SatelliteMixins):
         yield
         if change:
             self.omitting_credentials = False
-            if self._cli._configured:
+            if self._cli:
                 for name, obj in self._cli.__dict__.items():
                     with contextlib.suppress(
                         AttributeError
@@ -2138,13 +2250,7 @@ class Satellite(Capsule, SatelliteMixins):
             ).create()
             task = repo.sync(synchronous=False)
             tasks.append(task)
-        for task in tasks:
-            self.wait_for_tasks(
-                search_query=(f'id = {task["id"]}'),
-                poll_timeout=1500,
-            )
-            task_status = self.api.ForemanTask(id=task['id']).poll()
-            assert task_status['result'] == 'success'
+        self.task_watcher.wait(tasks, timeout=1500)
 
         # register contenthost
         rhel_contenthost.install_katello_ca(self)
@@ -1,6 +1,7 @@
 """Utility module to handle the shared ssh connection."""
 
 from robottelo.cli import hammer
+from robottelo.utils.ssh import get_pool, release_client
 
 
 def get_client(
@@ -8,21 +9,28 @@ def get_client(
     username=None,
     password=None,
     port=22,
+    pooled=False,
 ):
     """Returns a host object that provides an ssh connection
 
     Processes ssh credentials in the order: password, key_filename, ssh_key
     Config validation enforces one of the three must be set in settings.server
+
+    :param bool pooled: take the client from the shared connection pool. Pooled clients
+        must be handed back with :func:`release_client`.
     """
     from robottelo.config import settings
     from robottelo.hosts import ContentHost
 
-    return ContentHost(
+    kwargs = dict(
         hostname=hostname or settings.server.hostname,
         username=username or settings.server.ssh_username,
         password=password or settings.server.ssh_password,
         port=port or settings.server.ssh_client.port,
     )
+    if pooled:
+        return get_pool().acquire(**kwargs)
+    return ContentHost(**kwargs)
 
 
 def command(
@@ -48,8 +56,14 @@ def command(
         username=username,
         password=password,
         port=port,
+        pooled=True,
     )
-    result = client.execute(cmd, timeout=timeout)
+    try:
+        result = client.execute(cmd, timeout=timeout)
+    except Exception:
+        release_client(client, discard=True)
+        raise
+    release_client(client)
 
     if output_format and result.status == 0:
         if output_format == 'csv':
@@ -0,0 +1,128 @@
+"""Shared, content-addressed cache of Satellite API documentation
+
+Both hammer and apypie need Satellite's apipie API description before the first command can
+run. Without a shared cache each xdist worker, and each new Satellite object, downloads and
+parses it again. This module fetches the apidoc once per Satellite version and API checksum,
+stores it in ``<robottelo.tmp_dir>/apidoc`` and:
+
+* feeds it to apypie, see :attr:`robottelo.hosts.Satellite.apidoc`;
+* warms hammer's own cache (``~/.cache/hammer`` on the Satellite) once per Satellite, so the
+  workers don't all pay for it with their first hammer command.
+
+Cache files are keyed by a digest of the server version and the apipie checksum, a Satellite
+upgrade or any API change therefore invalidates them. Workers coordinate through file locks,
+only the first one downloads, the others wait and reuse the result.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+from pytest_services.locks import file_lock
+import requests
+
+from robottelo.config import robottelo_tmp_dir, settings
+from robottelo.logging import logger
+
+APIDOC_CACHE_DIR = robottelo_tmp_dir.joinpath('apidoc')
+LOCK_TIMEOUT = 600
+
+
+def _get(satellite, path):
+    response = requests.get(
+        f'{satellite.url}{path}',
+        auth=(settings.server.admin_username, settings.server.admin_password),
+        verify=settings.server.verify_ca,
+        headers={'Accept': 'application/json'},
+    )
+    response.raise_for_status()
+    return response
+
+
+def get_cache_key(satellite):
+    """Return the cache key of ``satellite`` apidoc, a digest of its version and API checksum"""
+    version = _get(satellite, '/api/status').json().get('version', '')
+    checksum = _get(satellite, '/apidoc/apipie_checksum').json().get('checksum', '')
+    return hashlib.sha256(f'{version}:{checksum}'.encode()).hexdigest()
+
+
+def cache_apidoc(satellite, cache_dir=APIDOC_CACHE_DIR, key=None):
+    """Make sure ``satellite`` apidoc is in the cache
+
+    :param key: the cache key, as returned by :func:`get_cache_key`, looked up when not given.
+    :return: a tuple ``(cache_dir, cache_key)``, the apidoc is stored in
+        ``cache_dir/<cache_key>.json``, the layout apypie expects for its cache files.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    key = key or get_cache_key(satellite)
+    cache_file = cache_dir.joinpath(f'{key}.json')
+    if cache_file.exists():
+        return cache_dir, key
+    with file_lock(str(cache_dir.joinpath(f'{key}.lock')), remove=False, timeout=LOCK_TIMEOUT):
+        # another worker may have fetched it while we were waiting for the lock
+        if not cache_file.exists():
+            logger.info('Caching apidoc of %s in %s', satellite.hostname, cache_file)
+            content = _get(satellite, '/apidoc/v2.json').content
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_file.write_bytes(content)
+            tmp_file.replace(cache_file)
+    return cache_dir, key
+
+
+def _machine_id(satellite):
+    """Return the machine id of ``satellite``, a new one is generated when a host is installed"""
+    result = satellite.execute('cat /etc/machine-id')
+    return result.stdout.strip() if result.status == 0 else None
+
+
+def warm_hammer_cache(satellite, cache_dir=APIDOC_CACHE_DIR, key=None):
+    """Make sure hammer's API cache on ``satellite`` is populated for its current API
+
+    A marker file, keyed by hostname, records the machine id of the Satellite and the apidoc
+    cache key of a successful warm-up, so it happens once per installation of a Satellite and
+    API version across workers and runs. Without a machine id, hammer is always warmed up.
+
+    :param key: the cache key, as returned by :func:`get_cache_key`, looked up when not given.
+    :return: True if hammer's cache was warmed up by this call, False if it was already warm.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    key = key or get_cache_key(satellite)
+    # a Satellite provisioned again with the same hostname has a new machine id
+    machine_id = _machine_id(satellite)
+    marker = cache_dir.joinpath(f'hammer-{satellite.hostname}')
+    warm = f'{machine_id}:{key}'
+    if machine_id and marker.exists() and marker.read_text() == warm:
+        return False
+    lock = cache_dir.joinpath(f'hammer-{satellite.hostname}.lock')
+    with file_lock(str(lock), remove=False, timeout=LOCK_TIMEOUT):
+        if machine_id and marker.exists() and marker.read_text() == warm:
+            return False
+        logger.info('Warming up hammer API cache on %s', satellite.hostname)
+        # any command that needs the API description makes hammer fetch and cache it
+        result = satellite.execute(
+            f'hammer -u {settings.server.admin_username} -p {settings.server.admin_password} '
+            '--output=json organization list --per-page=1'
+        )
+        if result.status != 0:
+            logger.warning(f'Failed to warm up hammer on {satellite.hostname}: {result.stderr}')
+            return False
+        if machine_id:
+            marker.write_text(warm)
+    return True
+
+
+def warm_up(satellite):
+    """Pre-flight the apidoc caches of ``satellite`` for apypie and hammer
+
+    Failures are logged and otherwise ignored, the caches are only an optimization.
+    """
+    if not settings.performance.warm_apidoc_cache:
+        return
+    try:
+        key = get_cache_key(satellite)
+        cache_apidoc(satellite, key=key)
+        warm_hammer_cache(satellite, key=key)
+    except Exception as err:
+        logger.warning(f'Unable to warm up apidoc cache of {satellite.hostname}: {err}')
@@ -0,0 +1,35 @@
+"""Helpers to run independent calls concurrently"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from robottelo.config import settings
+from robottelo.exceptions import BulkOperationError
+
+
+def run_concurrently(calls, max_workers=None, raise_on_error=True):
+    """Run ``calls`` on a bounded thread pool
+
+    :param calls: a list of callables taking no argument.
+    :param max_workers: the size of the thread pool, ``settings.performance.bulk_workers``
+        by default. Never larger than the number of calls.
+    :param raise_on_error: raise when any call failed, once all of them finished.
+    :return: a tuple ``(results, errors)``, the results in the order of ``calls``, ``None``
+        for the failed ones, and a dict mapping the index of each failed call to its exception.
+    :raises robottelo.exceptions.BulkOperationError: if a call failed and ``raise_on_error``
+        is set. The exception carries the results and the errors.
+    """
+    results = [None] * len(calls)
+    errors = {}
+    if not calls:
+        return results, errors
+    max_workers = min(max_workers or settings.performance.bulk_workers, len(calls))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(call) for call in calls]
+        for index, future in enumerate(futures):
+            try:
+                results[index] = future.result()
+            except Exception as err:
+                errors[index] = err
+    if errors and raise_on_error:
+        raise BulkOperationError(results, errors)
+    return results, errors
@@ -95,5 +95,9 @@ class FileStorageHandler(BaseStorageHandler):
         """
         value = self.encode(value)
         key_file_path = self.get_key_file_path(key)
-        with open(key_file_path, 'w') as file_handler:
+        # ready values are read without locking, write them to a private file and move it in
+        # place so that readers never see a partial value
+        tmp_file_path = f'{key_file_path}.{os.getpid()}.tmp'
+        with open(tmp_file_path, 'w') as file_handler:
             file_handler.write(value)
+        os.replace(tmp_file_path, key_file_path)
@@ -5,6 +5,10 @@ return the stored results, which make the shared function results persistent.
 Note: Shared function store it's data as json. The results of the decorated
     function must be json compatible.
 
+Note: Only the first caller runs the function, the others wait for the storage
+    lock of the key. Once the result is ready, callers read it without taking
+    the lock, and keep it in memory until it expires.
+
 Usage::
 
 
@@ -85,6 +89,8 @@ Usage::
             return dict(org=cls.org, repo=cls.repo}
 """
 
+from collections import Counter, defaultdict
+import copy
 import datetime
 import functools
 import hashlib
@@ -92,6 +98,7 @@ from importlib import import_module
 import inspect
 import os
 import sys
+import time
 import traceback
 import uuid
 
@@ -99,11 +106,16 @@ from nailgun.entities import Entity
 
 from robottelo.config import setting_is_set, settings
 from robottelo.logging import logger
-from robottelo.utils.decorators.func_shared import file_storage, redis_storage
+from robottelo.utils.decorators.func_shared import file_storage, redis_storage, sqlite_storage
 from robottelo.utils.decorators.func_shared.file_storage import FileStorageHandler
 from robottelo.utils.decorators.func_shared.redis_storage import RedisStorageHandler
+from robottelo.utils.decorators.func_shared.sqlite_storage import SQLiteStorageHandler
 
-_storage_handlers = {'file': FileStorageHandler, 'redis': RedisStorageHandler}
+_storage_handlers = {
+    'file': FileStorageHandler,
+    'redis': RedisStorageHandler,
+    'sqlite': SQLiteStorageHandler,
+}
 
 DEFAULT_STORAGE_HANDLER = 'file'
 # by default using the shared data is disabled
@@ -125,6 +137,14 @@ _DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
 
 _SERVER_CERT_MD5 = None
 
+# values of the keys found ready in this process, valid until they expire
+_memo = {}
+# per key counters of the calls served without locking, of the lock acquisitions and of the
+# seconds spent waiting for the lock
+fast_reads = Counter()
+lock_waits = Counter()
+lock_wait_seconds = defaultdict(float)
+
 
 def _set_configured(value):
     global _configured
@@ -146,6 +166,7 @@ def _check_config():
         DEFAULT_CALL_RETRIES = settings.shared_function.call_retries
         file_storage.LOCK_TIMEOUT = settings.shared_function.lock_timeout
         redis_storage.LOCK_TIMEOUT = settings.shared_function.lock_timeout
+        sqlite_storage.LOCK_TIMEOUT = settings.shared_function.lock_timeout
         redis_storage.REDIS_HOST = settings.shared_function.redis_host
         redis_storage.REDIS_PORT = settings.shared_function.redis_port
         redis_storage.REDIS_DB = settings.shared_function.redis_db
@@ -169,6 +190,23 @@ def set_default_scope(value):
     NAMESPACE_SCOPE = value
 
 
+def clear_memo():
+    """Forget the values of the keys found ready in this process"""
+    _memo.clear()
+
+
+def lock_stats():
+    """Return the number of fast reads, lock acquisitions and seconds of lock wait per key"""
+    return {
+        key: {
+            'fast_reads': fast_reads[key],
+            'lock_waits': lock_waits[key],
+            'lock_wait_seconds': round(lock_wait_seconds[key], 3),
+        }
+        for key in fast_reads.keys() | lock_waits.keys()
+    }
+
+
 def _get_default_scope():
     """Return the shared function default scope"""
 
@@ -291,69 +329,84 @@ class _SharedFunction:
 
         return False
 
-    def __call__(self):
-        # this lock prevent any other process to run the function,
-        # and if an other process is running the function, I should wait it
-        # to finish
-        # note: when results are ready this lock has a very short time
-        with self.storage.lock(self.key) as data:
-            self.storage.when_lock_acquired(data)
-            # first must investigate, call the function or use the results
-            result = None
-            error = None
-            traceback_text = ''
-            error_class_name = None
-            exp = None
-            pid = None
-            value = self.storage.get(self.key)
-            if value is None:
-                call_function = True
-            else:
-                state = value['state']
-                result = value['result']
-                error = value['error']
-                traceback_text = value.get('traceback', '')
-                error_class_name = value.get('error_class_name')
-                pid = value['pid']
-                creation_datetime = datetime.datetime.strptime(
-                    value['creation_datetime'], _DATETIME_FORMAT
-                )
+    def _is_ready(self, value):
+        """Whether a stored value is a result, or an error, that did not expire yet"""
+        if value is None or value['state'] not in [_STATE_READY, _STATE_FAILED]:
+            return False
+        creation_datetime = datetime.datetime.strptime(value['creation_datetime'], _DATETIME_FORMAT)
+        return not self._has_result_expired(creation_datetime)
 
-                if state in [_STATE_READY, _STATE_FAILED] and not self._has_result_expired(
-                    creation_datetime
-                ):
-                    call_function = False
-                else:
-                    call_function = True
+    def _read_ready_value(self):
+        """Return the value of the key if ready, without locking, else None
 
-            if call_function is True:
-                result, exp, traceback_text = self._call_function()
-                creation_datetime = datetime.datetime.utcnow().strftime(_DATETIME_FORMAT)
-                if exp:
-                    error = str(exp) or 'error occurred'
-                    error_class_name = f'{exp.__class__.__module__}.{exp.__class__.__name__}'
-                    value = dict(
-                        state=_STATE_FAILED,
-                        id=self.transaction,
-                        result=None,
-                        error=error,
-                        error_class_name=error_class_name,
-                        traceback=traceback_text,
-                        pid=os.getpid(),
-                        creation_datetime=creation_datetime,
-                    )
+        A ready value does not change until it expires, so it is memoized in this process.
+        """
+        value = _memo.get(self.key)
+        if not self._is_ready(value):
+            try:
+                value = self.storage.get(self.key)
+            except ValueError:
+                # the value is being written, let the locked path read it
+                return None
+            if not self._is_ready(value):
+                return None
+            _memo[self.key] = value
+        fast_reads[self.key] += 1
+        # the injected calls may modify the result
+        return copy.deepcopy(value)
+
+    def __call__(self):
+        exp = None
+        value = self._read_ready_value()
+        call_function = value is None
+        if call_function:
+            # this lock prevent any other process to run the function,
+            # and if an other process is running the function, I should wait it
+            # to finish
+            lock = self.storage.lock(self.key)
+            start = time.monotonic()
+            with lock as data:
+                lock_waits[self.key] += 1
+                lock_wait_seconds[self.key] += time.monotonic() - start
+                self.storage.when_lock_acquired(data)
+                # an other process may have called the function while I was waiting
+                value = self.storage.get(self.key)
+                if self._is_ready(value):
+                    call_function = False
                 else:
-                    error = None
-                    result = self._encode_result_kwargs(result)
-                    value = dict(
-                        state=_STATE_READY,
-                        id=self.transaction,
-                        result=result,
-                        error=error,
-                        pid=os.getpid(),
-                        creation_datetime=creation_datetime,
-                    )
-                self.storage.set(self.key, value)
+                    result, exp, traceback_text = self._call_function()
+                    creation_datetime = datetime.datetime.utcnow().strftime(_DATETIME_FORMAT)
+                    if exp:
+                        error = str(exp) or 'error occurred'
+                        error_class_name = f'{exp.__class__.__module__}.{exp.__class__.__name__}'
+                        value = dict(
+                            state=_STATE_FAILED,
+                            id=self.transaction,
+                            result=None,
+                            error=error,
+                            error_class_name=error_class_name,
+                            traceback=traceback_text,
+                            pid=os.getpid(),
+                            creation_datetime=creation_datetime,
+                        )
+                    else:
+                        result = self._encode_result_kwargs(result)
+                        value = dict(
+                            state=_STATE_READY,
+                            id=self.transaction,
+                            result=result,
+                            error=None,
+                            pid=os.getpid(),
+                            creation_datetime=creation_datetime,
+                        )
+                    self.storage.set(self.key, value)
+            _memo[self.key] = copy.deepcopy(value)
+
+        result = value['result']
+        error = value['error']
+        traceback_text = value.get('traceback', '')
+        error_class_name = value.get('error_class_name')
+        pid = value['pid']
 
         if call_function and exp:
             # i'am in the first launched process
@@ -0,0 +1,131 @@
+"""SQLite key value storage handler
+
+A local alternative to the redis storage handler, for workers running on the same machine.
+All the keys are stored in one SQLite database in WAL mode, so readers do not wait for writers.
+The lock of a key is a row of the ``locks`` table holding the process id of its owner; the lock
+of a process that died without releasing it is taken over.
+"""
+
+import contextlib
+import os
+import sqlite3
+import time
+
+from robottelo.utils.decorators.func_shared.base import BaseStorageHandler
+from robottelo.utils.decorators.func_shared.file_storage import _get_root_dir
+
+DB_FILE_NAME = 'shared_functions.db'
+LOCK_TIMEOUT = 7200
+LOCK_POLL_INTERVAL = 0.1
+# seconds a statement waits for an other connection to finish writing
+BUSY_TIMEOUT = 60
+
+# the databases initialized by this process
+_initialized = set()
+
+
+def _pid_exists(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SQLiteStorageHandler(BaseStorageHandler):
+    """SQLite Key value storage handler"""
+
+    def __init__(self, path=None, lock_timeout=None):
+        if path is None:
+            path = os.path.join(_get_root_dir(), DB_FILE_NAME)
+        if lock_timeout is None:
+            lock_timeout = LOCK_TIMEOUT
+        self._path = path
+        self._lock_timeout = lock_timeout
+
+    @contextlib.contextmanager
+    def connect(self):
+        """Return a context manager of a new connection, closed on exit
+
+        Connections are not kept open between operations, a SQLite connection must not be
+        inherited by a forked process, like the workers of a multiprocessing pool.
+        """
+        # autocommit mode, each statement is a transaction
+        connection = sqlite3.connect(self._path, timeout=BUSY_TIMEOUT, isolation_level=None)
+        try:
+            if (self._path, os.getpid()) not in _initialized:
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS shared (key TEXT PRIMARY KEY, value TEXT NOT NULL)'
+                )
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, pid INTEGER NOT NULL)'
+                )
+                _initialized.add((self._path, os.getpid()))
+            yield connection
+        finally:
+            connection.close()
+
+    def _acquire(self, lock_key):
+        """Try to take the lock once, return whether it was acquired"""
+        pid = os.getpid()
+        with self.connect() as connection:
+            try:
+                connection.execute('INSERT INTO locks (key, pid) VALUES (?, ?)', (lock_key, pid))
+                return True
+            except sqlite3.IntegrityError:
+                pass
+            row = connection.execute('SELECT pid FROM locks WHERE key = ?', (lock_key,)).fetchone()
+            if row is None or _pid_exists(row[0]):
+                return False
+            # the owner died holding the lock
+            cursor = connection.execute(
+                'UPDATE locks SET pid = ? WHERE key = ? AND pid = ?', (pid, lock_key, row[0])
+            )
+            return cursor.rowcount == 1
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        """Return the storage locker context manager"""
+        lock_key = f'{key}.lock'
+        deadline = time.monotonic() + self._lock_timeout
+        while not self._acquire(lock_key):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f'Timed out waiting for the lock of {key}')
+            time.sleep(LOCK_POLL_INTERVAL)
+        try:
+            yield lock_key
+        finally:
+            with self.connect() as connection:
+                connection.execute(
+                    'DELETE FROM locks WHERE key = ? AND pid = ?', (lock_key, os.getpid())
+                )
+
+    def when_lock_acquired(self, lock_key):
+        # do nothing
+        pass
+
+    def get(self, key):
+        """Return the key value
+
+        :type key: str
+        """
+        with self.connect() as connection:
+            row = connection.execute('SELECT value FROM shared WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        return self.decode(row[0])
+
+    def set(self, key, value):
+        """Write the value of key
+
+        :type key: str
+        :type value: object
+        """
+        value = self.encode(value)
+        with self.connect() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO shared (key, value) VALUES (?, ?)', (key, value)
+            )
@@ -0,0 +1,185 @@
+"""Durations of the tests in previous runs
+
+The durations are kept in a SQLite database, ``<robottelo.tmp_dir>/test_durations.db`` by default,
+with the work unit of each test: the tests sharing a module, class or package scoped fixture have
+to run on the same worker, one after the other. They are used by
+``pytest_plugins.duration_scheduler`` to give the longest work units to the xdist workers first.
+"""
+
+import contextlib
+import heapq
+import sqlite3
+
+from robottelo.config import robottelo_tmp_dir
+
+DB_FILE = robottelo_tmp_dir.joinpath('test_durations.db')
+# weight of the last run in the recorded duration of a test
+DURATION_SMOOTHING = 0.5
+# seconds predicted for a test of a module that never ran
+DEFAULT_DURATION = 60
+# seconds a statement waits for an other connection to finish writing
+BUSY_TIMEOUT = 60
+_SCOPES = ('class', 'module', 'package')
+
+
+def work_unit(nodeid, scope=None):
+    """Return the work unit of a test
+
+    :param nodeid: the node id of the test.
+    :param scope: the widest scope of the fixtures of the test shared with other tests,
+        ``class``, ``module`` or ``package``, ``None`` when it has none.
+    """
+    path = nodeid.split('::', 1)[0]
+    if scope == 'package':
+        return path.rpartition('/')[0]
+    if scope == 'module':
+        return path
+    if scope == 'class':
+        return nodeid.rsplit('::', 1)[0]
+    return nodeid
+
+
+def shared_scope(scopes):
+    """Return the widest of the class, module and package ``scopes``, None if there is none"""
+    shared = [scope for scope in scopes if scope in _SCOPES]
+    return max(shared, key=_SCOPES.index, default=None)
+
+
+def lpt_makespan(durations, workers):
+    """Return the makespan of the work units scheduled longest processing time first
+
+    :param durations: the duration of each work unit.
+    :param workers: the number of workers running the work units.
+    """
+    loads = [0] * max(workers, 1)
+    for duration in sorted(durations, reverse=True):
+        heapq.heapreplace(loads, loads[0] + duration)
+    return max(loads)
+
+
+class DurationHistory:
+    """The durations of the tests and modules in previous runs
+
+    :param path: the path of the SQLite database.
+    """
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+
+    @contextlib.contextmanager
+    def connect(self):
+        """Return a context manager of a new connection, committed and closed on exit"""
+        connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+        try:
+            with connection:
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS tests '
+                    '(nodeid TEXT PRIMARY KEY, duration REAL, unit TEXT)'
+                )
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS modules '
+                    '(module TEXT PRIMARY KEY, duration REAL NOT NULL, tests INTEGER NOT NULL)'
+                )
+                yield connection
+        finally:
+            connection.close()
+
+    def _select(self, connection, query, keys):
+        """Return the rows of a query on the keys, in chunks below the SQLite variable limit"""
+        keys = list(keys)
+        rows = []
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ', '.join('?' * len(chunk))
+            rows.extend(connection.execute(query.format(placeholders), chunk))
+        return rows
+
+    def save_units(self, units):
+        """Save the work unit of tests
+
+        :param units: the work unit of each node id.
+        """
+        with self.connect() as connection:
+            connection.executemany(
+                'INSERT INTO tests (nodeid, unit) VALUES (?, ?) '
+                'ON CONFLICT (nodeid) DO UPDATE SET unit = excluded.unit',
+                units.items(),
+            )
+
+    def units(self, nodeids):
+        """Return the saved work unit of each node id, the tests never seen are left out"""
+        with self.connect() as connection:
+            rows = self._select(
+                connection,
+                'SELECT nodeid, unit FROM tests WHERE unit IS NOT NULL AND nodeid IN ({})',
+                nodeids,
+            )
+        return dict(rows)
+
+    def record(self, durations):
+        """Record the durations of a run
+
+        :param durations: the seconds taken by each node id, including setup and teardown.
+        """
+        modules = {}
+        for nodeid, duration in durations.items():
+            module = modules.setdefault(nodeid.split('::', 1)[0], [0, 0])
+            module[0] += duration
+            module[1] += 1
+        with self.connect() as connection:
+            previous = dict(
+                self._select(
+                    connection,
+                    'SELECT nodeid, duration FROM tests '
+                    'WHERE duration IS NOT NULL AND nodeid IN ({})',
+                    durations,
+                )
+            )
+            connection.executemany(
+                'INSERT INTO tests (nodeid, duration) VALUES (?, ?) '
+                'ON CONFLICT (nodeid) DO UPDATE SET duration = excluded.duration',
+                [
+                    (
+                        nodeid,
+                        duration
+                        if nodeid not in previous
+                        else previous[nodeid] + DURATION_SMOOTHING * (duration - previous[nodeid]),
+                    )
+                    for nodeid, duration in durations.items()
+                ],
+            )
+            connection.executemany(
+                'INSERT OR REPLACE INTO modules (module, duration, tests) VALUES (?, ?, ?)',
+                [(module, duration, tests) for module, (duration, tests) in modules.items()],
+            )
+
+    def predict(self, nodeids):
+        """Return the predicted duration of each node id
+
+        Tests that never ran are predicted to take the mean duration of the tests of their
+        module in its last run, or ``DEFAULT_DURATION``.
+        """
+        modules = {nodeid.split('::', 1)[0] for nodeid in nodeids}
+        with self.connect() as connection:
+            durations = dict(
+                self._select(
+                    connection,
+                    'SELECT nodeid, duration FROM tests '
+                    'WHERE duration IS NOT NULL AND nodeid IN ({})',
+                    nodeids,
+                )
+            )
+            module_means = {
+                module: duration / tests
+                for module, duration, tests in self._select(
+                    connection,
+                    'SELECT module, duration, tests FROM modules WHERE module IN ({})',
+                    modules,
+                )
+            }
+        return {
+            nodeid: durations[nodeid]
+            if nodeid in durations
+            else module_means.get(nodeid.split('::', 1)[0], DEFAULT_DURATION)
+            for nodeid in nodeids
+        }
@@ -0,0 +1,111 @@
+"""Cache of facts about the hosts under test, like the Satellite version
+
+Collection-time plugins need facts about the Satellite, e.g. its version for the ``is_open``
+checks or its RHEL version for the markers, and reading them takes an SSH round trip. A fact is
+read once per hostname and process, then kept in memory. When
+``settings.performance.host_facts_ttl`` is set, facts are also persisted in
+``<robottelo.tmp_dir>/host_facts.json`` for that many seconds. The file is shared by the xdist
+workers and later runs, and only one process at a time reads a missing fact from the host.
+Persisted facts outlive the host they were read from, e.g. an upgraded or re-provisioned
+Satellite of the same hostname, only set the TTL when the hosts do not change within it.
+
+Expected failures are cached too, for ``FAILURE_TTL`` seconds at most, so an unreachable host
+costs one timeout per session instead of one per lookup.
+"""
+
+import json
+import os
+import time
+
+from pytest_services.locks import file_lock
+
+from robottelo.config import robottelo_tmp_dir, settings
+from robottelo.exceptions import HostFactError
+from robottelo.logging import logger
+
+FACTS_FILE = robottelo_tmp_dir.joinpath('host_facts.json')
+FAILURE_TTL = 300
+LOCK_TIMEOUT = 600
+
+_facts = {}
+_failures = {}
+
+
+def _load():
+    try:
+        return json.loads(FACTS_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _read(hostname, name, ttl):
+    """Return the persisted entry of a fact, ``None`` if missing or expired"""
+    entry = _load().get(hostname, {}).get(name)
+    if entry is None:
+        return None
+    max_age = min(ttl, FAILURE_TTL) if 'error' in entry else ttl
+    if time.time() - entry['fetched'] > max_age:
+        return None
+    return entry
+
+
+def _write(hostname, name, entry):
+    data = _load()
+    data.setdefault(hostname, {})[name] = entry
+    # readers do not take the lock, write to a private file and move it in place
+    tmp_file = FACTS_FILE.with_suffix(f'.{os.getpid()}.tmp')
+    tmp_file.write_text(json.dumps(data))
+    tmp_file.replace(FACTS_FILE)
+
+
+def _probe(hostname, name, probe, errors):
+    try:
+        return {'value': probe(), 'fetched': time.time()}
+    except errors as err:
+        logger.warning(f'Failed to read {name} of {hostname}: {err!r}')
+        return {'error': repr(err), 'fetched': time.time()}
+
+
+def get(hostname, name, probe, errors=()):
+    """Return a fact about a host
+
+    :param hostname: the hostname of the host.
+    :param name: the name of the fact, e.g. ``version``.
+    :param probe: a callable reading the fact from the host, called on a cache miss. It must
+        return a JSON serializable value.
+    :param errors: the exception types of ``probe`` failures which are cached and raised as
+        :class:`robottelo.exceptions.HostFactError`. Other exceptions are propagated.
+    :return: the value of the fact.
+    :raises robottelo.exceptions.HostFactError: if ``probe`` failed with one of ``errors``, in
+        this process or, while the failure is cached, in another one.
+    """
+    hostname = str(hostname)
+    key = (hostname, name)
+    if key in _facts:
+        return _facts[key]
+    if key in _failures:
+        raise HostFactError(_failures[key])
+    ttl = settings.performance.host_facts_ttl
+    if ttl:
+        entry = _read(hostname, name, ttl)
+        if entry is None:
+            lock_file = str(FACTS_FILE.with_suffix('.lock'))
+            with file_lock(lock_file, remove=False, timeout=LOCK_TIMEOUT):
+                # another worker may have read it while this one waited for the lock
+                entry = _read(hostname, name, ttl)
+                if entry is None:
+                    entry = _probe(hostname, name, probe, errors)
+                    _write(hostname, name, entry)
+    else:
+        entry = _probe(hostname, name, probe, errors)
+    if 'error' in entry:
+        _failures[key] = f'Failed to read {name} of {hostname}: {entry["error"]}'
+        raise HostFactError(_failures[key])
+    _facts[key] = entry['value']
+    return _facts[key]
+
+
+def clear():
+    """Forget the facts cached in this process"""
+    _facts.clear()
+    _failures.clear()
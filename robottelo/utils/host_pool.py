@@ -0,0 +1,106 @@
+"""Check hosts out ahead of demand
+
+Used by ``satellite_factory`` and ``capsule_factory`` to deploy the Satellites and Capsules of the
+collected tests in the background, instead of deploying each of them when a test asks for it, and
+by the content host fixtures, which can also give their hosts back to be reused.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from robottelo.logging import logger
+
+
+class HostPool:
+    """Keep up to ``size`` hosts being checked out for the next requests
+
+    :param checkout: a callable taking no argument and returning a checked out host.
+    :param checkin: a callable checking a host in, called on the hosts left at ``close``.
+    :param demand: the number of hosts expected to be requested, no more are checked out ahead.
+    :param size: the maximum number of hosts checked out ahead at the same time, 0 to only
+        serve the hosts given back with ``put``.
+
+    ``wait_times`` holds the seconds each request waited for its host, ``misses`` the number
+    of requests served by a checkout on demand and ``reuses`` the number of requests served by
+    a host given back.
+    """
+
+    def __init__(self, checkout, checkin, demand, size):
+        self._checkout = checkout
+        self._checkin = checkin
+        self._remaining = demand
+        self._size = size
+        self._pending = deque()
+        self._returned = deque()
+        self.wait_times = []
+        self.misses = 0
+        self.reuses = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(size, 1), thread_name_prefix='host_pool'
+        )
+        with self._lock:
+            self._fill()
+
+    def _fill(self):
+        """Start checkouts until the expected requests are covered, up to ``size``"""
+        while len(self._pending) + len(self._returned) < min(self._size, self._remaining):
+            self._pending.append(self._executor.submit(self._checkout))
+
+    def get(self):
+        """Return a host given back, or the next host checked out ahead, or a new host"""
+        start = time.monotonic()
+        with self._lock:
+            self._remaining = max(self._remaining - 1, 0)
+            if self._returned:
+                self.reuses += 1
+                self.wait_times.append(0)
+                return self._returned.popleft()
+            future = self._pending.popleft() if self._pending else None
+            self._fill()
+        try:
+            if future is not None:
+                try:
+                    return future.result()
+                except Exception as err:
+                    logger.warning(
+                        f'Host checked out ahead is not available, checking out again: {err}'
+                    )
+            self.misses += 1
+            return self._checkout()
+        finally:
+            self.wait_times.append(time.monotonic() - start)
+
+    def put(self, host):
+        """Give a host back, to serve a next request"""
+        with self._lock:
+            self._returned.append(host)
+
+    def stats(self):
+        """Return a summary of the requests served by the pool"""
+        waits = self.wait_times
+        return (
+            f'{len(waits)} hosts requested, {self.misses} checked out on demand, '
+            f'{self.reuses} reused, waited {sum(waits):.0f}s in total, '
+            f'{max(waits, default=0):.0f}s at most'
+        )
+
+    def close(self):
+        """Stop checking hosts out and check in the hosts that were not requested"""
+        with self._lock:
+            pending, self._pending = list(self._pending), deque()
+            unused, self._returned = list(self._returned), deque()
+            self._remaining = 0
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for future in pending:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            unused.append(future.result())
+        for host in unused:
+            logger.info(f'Checking in unused host {host.hostname}')
+            try:
+                self._checkin(host)
+            except Exception as err:
+                logger.warning(f'Failed to check in unused host {host.hostname}: {err}')
@@ -1,67 +1,205 @@
 # Helper methods for tests requiring I/0
+import codecs
 import hashlib
 import json
 from pathlib import Path
+import re
 import tarfile
 
+# bytes read at once from the report files
+CHUNK_SIZE = 1 << 20
+WHITESPACE = re.compile(r'\s*')
 
-def get_local_file_data(path):
-    """Returns information about tar file.
+
+class _HashingReader:
+    """File-like object hashing and counting the bytes read from a file"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        self.digest.update(data)
+        self.size += len(data)
+        return data
+
+
+class _JSONStream:
+    """Decode a JSON document from a binary file one value at a time
+
+    Only the values read with ``value`` are decoded in memory, the members of an object and the
+    items of an array can be iterated over with ``members`` and ``items``.
+    """
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+
+    def _fill(self):
+        """Read the next chunk, return False at the end of the file"""
+        data = self._fileobj.read(CHUNK_SIZE)
+        chunk = self._utf8.decode(data, final=not data)
+        if not data:
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _next(self):
+        """Return the next character other than whitespace, without consuming it"""
+        while True:
+            self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise json.JSONDecodeError('Unexpected end of data', self._buffer, self._pos)
+
+    def _expect(self, chars):
+        char = self._next()
+        if char not in chars:
+            raise json.JSONDecodeError(f'Expecting one of {chars!r}', self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def value(self):
+        """Decode the next value"""
+        self._next()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # the value may continue in the next chunk
+                if self._fill():
+                    continue
+                raise
+            if end == len(self._buffer) and self._fill():
+                # a number may continue in the next chunk
+                continue
+            self._pos = end
+            return value
+
+    def members(self):
+        """Yield the keys of the next object, the caller reads the value of each key"""
+        self._expect('{')
+        if self._next() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self._expect(':')
+            yield key
+            if self._expect(',}') == '}':
+                return
+
+    def items(self):
+        """Yield the decoded items of the next array, one at a time"""
+        self._expect('[')
+        if self._next() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self._expect(',]') == ']':
+                return
+
+
+def _read_slice(fileobj, keep_hosts):
+    """Returns the data of a report slice and its number of hosts.
 
     Args:
-        path: path to tar file
+        fileobj: binary file object of the slice
+        keep_hosts: whether to keep the hosts in the data, they are only counted otherwise
     """
-    size = Path(path).stat().st_size
-
-    with open(path, 'rb') as fh:
-        file_content = fh.read()
-    checksum = hashlib.sha256(file_content).hexdigest()
-
-    try:
-        tarobj = tarfile.open(path, mode='r')
-        host_counts = get_host_counts(tarobj)
-        tarobj.close()
-        extractable = True
-        json_files_parsable = True
-    except (tarfile.TarError, json.JSONDecodeError):
-        host_counts = {}
-        extractable = False
-        json_files_parsable = False
-
-    return {
-        'size': size,
-        'checksum': checksum,
-        'extractable': extractable,
-        'json_files_parsable': json_files_parsable,
-        **host_counts,
-    }
+    stream = _JSONStream(fileobj)
+    data, count = {}, 0
+    for key in stream.members():
+        if key != 'hosts':
+            data[key] = stream.value()
+            continue
+        hosts = []
+        for host in stream.items():
+            count += 1
+            if keep_hosts:
+                hosts.append(host)
+        if keep_hosts:
+            data['hosts'] = hosts
+    return data, count
 
 
-def get_host_counts(tarobj):
-    """Returns hosts count from tar file.
+def inspect_report(report_path, keep_hosts=True, raise_on_error=False):
+    """Returns information about a report tar file and its contents, reading it once.
+
+    The file is hashed while the tar members are read, and the hosts of each slice are
+    counted while they are decoded, one at a time.
 
     Args:
-        tarobj: tar file to get host count from
+        report_path: path to tar file
+        keep_hosts: whether to keep the hosts of the slices, they are only counted otherwise
+        raise_on_error: raise the errors of a report that can not be extracted or parsed,
+            instead of reporting them in the ``extractable`` and ``json_files_parsable`` flags
+
+    Returns:
+        dict with the keys of ``get_local_file_data``, the ``metadata`` of the report and
+        the data of each slice by file name in ``slices``
     """
-    metadata_counts = {}
-    slices_counts = {}
-    for file_ in tarobj.getmembers():
-        file_name = Path(file_.name).name
-        if not file_name.endswith('.json'):
-            continue
-        json_data = json.load(tarobj.extractfile(file_))
-        if file_name == 'metadata.json':
-            metadata_counts = {
-                f'{key}.json': value['number_hosts']
-                for key, value in json_data['report_slices'].items()
-            }
-        else:
-            slices_counts[file_name] = len(json_data['hosts'])
-
-    return {
-        'metadata_counts': metadata_counts,
-        'slices_counts': slices_counts,
+    report = {
+        'extractable': True,
+        'json_files_parsable': True,
+        'metadata_counts': {},
+        'slices_counts': {},
+        'metadata': {},
+        'slices': {},
     }
+    with open(report_path, 'rb') as fh:
+        reader = _HashingReader(fh)
+        try:
+            with tarfile.open(fileobj=reader, mode='r|*') as tarobj:
+                for file_ in tarobj:
+                    file_name = Path(file_.name).name
+                    if not file_.isfile() or not file_name.endswith('.json'):
+                        continue
+                    if file_name == 'metadata.json':
+                        report['metadata'] = json.load(tarobj.extractfile(file_))
+                        report['metadata_counts'] = {
+                            f'{key}.json': value['number_hosts']
+                            for key, value in report['metadata']['report_slices'].items()
+                        }
+                    else:
+                        data, count = _read_slice(tarobj.extractfile(file_), keep_hosts)
+                        report['slices'][file_name] = data
+                        report['slices_counts'][file_name] = count
+        except (tarfile.TarError, EOFError, OSError):
+            if raise_on_error:
+                raise
+            report.update(extractable=False, json_files_parsable=False)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            if raise_on_error:
+                raise
+            report['json_files_parsable'] = False
+        if not report['json_files_parsable']:
+            report.update(metadata_counts={}, slices_counts={})
+        # hash the end of the file, not read by tarfile
+        while reader.read(CHUNK_SIZE):
+            pass
+    report['size'] = reader.size
+    report['checksum'] = reader.digest.hexdigest()
+    return report
+
+
+def get_local_file_data(path):
+    """Returns information about tar file.
+
+    Args:
+        path: path to tar file
+    """
+    report = inspect_report(path, keep_hosts=False)
+    del report['metadata'], report['slices']
+    return report
 
 
 def get_remote_report_checksum(satellite, org_id):
@@ -86,20 +224,13 @@ def get_remote_report_checksum(satellite, org_id):
 
 
 def get_report_data(report_path):
-    """Returns report data from tar file.
+    """Returns report data from tar file, the data of its last slice.
 
     Args:
-        tarobj: tar file to get report data from
+        report_path: path to tar file
     """
-    json_data = {}
-    with tarfile.open(report_path, mode='r') as tarobj:
-        for file_ in tarobj.getmembers():
-            file_name = Path(file_.name).name
-            if not file_name.endswith('.json'):
-                continue
-            if file_name != 'metadata.json':
-                json_data = json.load(tarobj.extractfile(file_))
-    return json_data
+    slices = list(inspect_report(report_path, raise_on_error=True)['slices'].values())
+    return slices[-1] if slices else {}
 
 
 def get_report_metadata(report_path):
@@ -108,10 +239,8 @@ def get_report_metadata(report_path):
     Args:
         report_path: path to tar file
     """
-    json_meta_data = {}
-    with tarfile.open(report_path, mode='r') as tarobj:
-        for file_ in tarobj.getmembers():
-            file_name = Path(file_.name).name
-            if file_name == 'metadata.json':
-                json_meta_data = json.load(tarobj.extractfile(file_))
-    return json_meta_data
+    with tarfile.open(report_path, mode='r|*') as tarobj:
+        for file_ in tarobj:
+            if Path(file_.name).name == 'metadata.json':
+                return json.load(tarobj.extractfile(file_))
+    return {}
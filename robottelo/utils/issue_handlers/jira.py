@@ -1,12 +1,17 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
 import re
+import time
 
 from packaging.version import Version
 import pytest
+from pytest_services.locks import file_lock
 import requests
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import retry, stop_after_attempt, wait_exponential
 
-from robottelo.config import settings
+from robottelo.config import robottelo_tmp_dir, settings
 from robottelo.constants import (
     JIRA_CLOSED_STATUSES,
     JIRA_ONQA_STATUS,
@@ -20,6 +25,12 @@ from robottelo.logging import logger
 # The .version group being a `d.d` string that can be casted to Version()
 VERSION_RE = re.compile(r'(?:sat-)*?(?P<version>\d\.\d)\.\w*')
 
+# issues fetched from the API, shared between workers and runs, see get_data_jira
+JIRA_CACHE_FILE = robottelo_tmp_dir.joinpath('jira_cache.json')
+JIRA_CHUNK_SIZE = 50  # issues per search, the default page size of Jira search
+JIRA_FETCH_WORKERS = 4
+JIRA_FIELDS = ['key', 'summary', 'status', 'resolution', 'fixVersions']
+
 
 def is_open_jira(issue_id, data=None):
     """Check if specific Jira is open consulting a cached `data` dict or
@@ -148,7 +159,7 @@ def collect_data_jira(collected_data, cached_data):  # pragma: no cover
 def collect_dupes(jira, collected_data, cached_data=None):  # pragma: no cover
     """Recursively find for duplicates"""
     cached_data = cached_data or {}
-    if jira.get('resolution') == 'Duplicate':
+    if jira.get('resolution') == 'Duplicate' and jira.get('dupe_of'):
         # Collect duplicates
         jira['dupe_data'] = get_single_jira(jira.get('dupe_of'), cached_data=cached_data)
         dupe_key = f"{jira['dupe_of']}"
@@ -165,13 +176,29 @@ def collect_dupes(jira, collected_data, cached_data=None):  # pragma: no cover
 CACHED_RESPONSES = defaultdict(dict)
 
 
-@retry(
-    stop=stop_after_attempt(4),  # Retry 3 times before raising
-    wait=wait_fixed(20),  # Wait seconds between retries
-)
+def prefetch_jira(issue_ids):
+    """Fetch Jira issues at once, before they are looked up one by one, e.g. by
+    :func:`are_any_jira_open` during collection.
+
+    Arguments:
+        issue_ids {iterable of str} -- ['SAT-12345', ...]
+    """
+    issue_ids = {str(issue_id) for issue_id in issue_ids if str(issue_id).startswith('SAT-')}
+    issue_ids -= set(CACHED_RESPONSES['get_single'])
+    if not issue_ids:
+        return
+    for data in get_data_jira(sorted(issue_ids)) or []:
+        CACHED_RESPONSES['get_single'][data['key']] = data
+
+
 def get_data_jira(issue_ids, cached_data=None):  # pragma: no cover
     """Get a list of marked Jira data and query Jira REST API.
 
+    Issues are cached in ``JIRA_CACHE_FILE`` for ``settings.jira.cache_ttl`` seconds. Issues
+    missing from the cache are fetched, expired ones are only fetched again if they were
+    updated since they were cached. Searches are made by chunks of ``JIRA_CHUNK_SIZE`` issues,
+    concurrently.
+
     Arguments:
         issue_ids {list of str} -- ['SAT-12345', ...]
         cached_data {dict} -- Cached data previous loaded from API
@@ -202,34 +229,64 @@ def get_data_jira(issue_ids, cached_data=None):  # pragma: no cover
         # Provide default data for collected Jira's.
         return [get_default_jira(issue_id) for issue_id in issue_ids]
 
-    # No cached data so Call Jira API
-    logger.debug(f"Calling Jira API for {set(issue_ids)}")
-    jira_fields = [
-        "key",
-        "summary",
-        "status",
-        "resolution",
-        "fixVersions",
+    issue_ids = sorted({str(issue_id) for issue_id in issue_ids})
+    cache = _load_jira_cache() if settings.jira.cache_ttl else {}
+    now = time.time()
+    stale = [key for key in issue_ids if key in cache]
+    stale = [key for key in stale if now - cache[key]['fetched'] >= settings.jira.cache_ttl]
+    missing = [key for key in issue_ids if key not in cache]
+    if missing or stale:
+        logger.debug(f"Calling Jira API for {set(missing)}, refreshing {set(stale)}")
+        searches = [f"key in ({', '.join(chunk)})" for chunk in _chunks(missing)]
+        for chunk in _chunks(stale):
+            # only fetch again the issues updated since they were cached, with a 5 minutes
+            # margin, relative dates don't depend on the time zone of the Jira user
+            minutes = int((now - min(cache[key]['fetched'] for key in chunk)) / 60) + 5
+            searches.append(f"key in ({', '.join(chunk)}) AND updated >= -{minutes}m")
+        with ThreadPoolExecutor(max_workers=JIRA_FETCH_WORKERS) as executor:
+            fetched = {
+                issue['key']: issue
+                for issues in executor.map(_search_jira, searches)
+                for issue in issues
+            }
+        updates = {key: {'fetched': now, 'data': data} for key, data in fetched.items()}
+        # the stale issues which were not returned did not change
+        updates.update({key: {**cache[key], 'fetched': now} for key in stale if key not in fetched})
+        cache.update(updates)
+        if settings.jira.cache_ttl:
+            _save_jira_cache(updates)
+    # copies, the callers add calculated data to them
+    data = [dict(cache[key]['data']) for key in issue_ids if key in cache]
+    CACHED_RESPONSES['get_data'][str(sorted(issue_ids))] = data
+    return data
+
+
+def _chunks(issue_ids):
+    return [
+        issue_ids[index : index + JIRA_CHUNK_SIZE]
+        for index in range(0, len(issue_ids), JIRA_CHUNK_SIZE)
     ]
-    # Following fields are dynamically calculated/loaded
-    for field in ('is_open', 'version'):
-        assert field not in jira_fields
 
-    # Generate jql
-    jql = ' OR '.join([f"id = {issue_id}" for issue_id in issue_ids])
 
+@retry(
+    stop=stop_after_attempt(4),  # Retry 3 times before raising
+    wait=wait_exponential(multiplier=2, max=20),  # Wait 2, 4, 8 seconds between retries
+)
+def _search_jira(jql):  # pragma: no cover
+    """Search Jira issues, return their cleaned data"""
     response = requests.get(
         f"{settings.jira.url}/rest/api/latest/search/",
         params={
             "jql": jql,
-            "fields": ",".join(jira_fields),
+            "fields": ",".join(JIRA_FIELDS),
+            "maxResults": JIRA_CHUNK_SIZE,
         },
         headers={"Authorization": f"Bearer {settings.jira.api_key}"},
     )
     response.raise_for_status()
     data = response.json().get('issues')
     # Clean the data, only keep the required info.
-    data = [
+    return [
         {
             'key': issue['key'],
             'summary': issue['fields']['summary'],
@@ -244,8 +301,24 @@ def get_data_jira(issue_ids, cached_data=None):  # pragma: no cover
         for issue in data
         if issue is not None
     ]
-    CACHED_RESPONSES['get_data'][str(sorted(issue_ids))] = data
-    return data
+
+
+def _load_jira_cache():
+    try:
+        return json.loads(JIRA_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_jira_cache(updates):
+    """Merge ``updates`` into the cache file, other workers may have updated it meanwhile"""
+    JIRA_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(str(JIRA_CACHE_FILE.with_suffix('.lock')), remove=False, timeout=60):
+        cache = _load_jira_cache()
+        cache.update(updates)
+        tmp_file = JIRA_CACHE_FILE.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_file.write_text(json.dumps(cache))
+        tmp_file.replace(JIRA_CACHE_FILE)
 
 
 def get_single_jira(issue_id, cached_data=None):  # pragma: no cover
@@ -1,5 +1,12 @@
+import atexit
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
 import io
 import json
+import multiprocessing
+import os
+import threading
 import time
 import uuid
 import zipfile
@@ -10,6 +17,53 @@ from cryptography.hazmat.primitives.asymmetric import padding
 import requests
 
 from robottelo.config import settings
+from robottelo.logging import logger
+
+CONSUMER_FILE = 'export/consumer.json'
+
+
+def build_clone(base, consumer_data, private_key, org_environment_access=False):
+    """Build and sign a manifest from the shared parts of its template
+
+    :param base: a zip archive of the members of the template ``consumer_export.zip``, other
+        than ``export/consumer.json``, see ``ManifestCloner._clone_base``.
+    :param consumer_data: the consumer data of the template.
+    :param private_key: the key signing the manifest.
+    :param org_environment_access: Whether to modify consumer content
+        access mode to org_environment (Golden ticket enabled manifest).
+    :return: the bytes of the manifest
+    """
+    consumer_data = dict(consumer_data, uuid=str(uuid.uuid1()))
+    if org_environment_access:
+        consumer_data['contentAccessMode'] = 'org_environment'
+        consumer_data['owner'] = dict(
+            consumer_data['owner'], contentAccessModeList='entitlement,org_environment'
+        )
+    # Append the new consumer.json to a copy of the archive, the compressed members of the
+    # template are copied as they are.
+    consumer_export = io.BytesIO(base)
+    with zipfile.ZipFile(consumer_export, 'a', zipfile.ZIP_DEFLATED) as consumer_export_zip:
+        consumer_export_zip.writestr(CONSUMER_FILE, json.dumps(consumer_data))
+    consumer_export = consumer_export.getvalue()
+    signature = private_key.sign(consumer_export, padding.PKCS1v15(), hashes.SHA256())
+    # consumer_export.zip is already compressed, it is stored as it is in the manifest
+    manifest = io.BytesIO()
+    with zipfile.ZipFile(manifest, 'w') as manifest_zip:
+        manifest_zip.writestr('consumer_export.zip', consumer_export)
+        manifest_zip.writestr('signature', signature)
+    return manifest.getvalue()
+
+
+@cache
+def _load_private_key(signing_key):
+    return crypto_serialization.load_pem_private_key(
+        signing_key, password=None, backend=crypto_default_backend()
+    )
+
+
+def _sign_clone(base, consumer_data, signing_key, org_environment_access):
+    """Build a manifest in a process of ``ManifestPool``, where keys can not be passed"""
+    return build_clone(base, consumer_data, _load_private_key(signing_key), org_environment_access)
 
 
 # Manifest Cloning
@@ -20,6 +74,8 @@ class ManifestCloner:
         self.template = template
         self.signing_key = signing_key
         self.private_key = private_key
+        # the parts of each template shared by its clones, see ``_clone_base``
+        self._bases = {}
 
     def _download_manifest_info(self, name='default'):
         """Download and cache the manifest information."""
@@ -33,6 +89,28 @@ class ManifestCloner:
                 self.signing_key, password=None, backend=crypto_default_backend()
             )
 
+    def _clone_base(self, name):
+        """Return the parts of the template manifest shared by its clones
+
+        The members of ``consumer_export.zip`` other than ``export/consumer.json`` are compressed
+        once into a zip archive, to which each clone only appends its own ``consumer.json``.
+
+        :return: a tuple of the zip archive bytes and of the template consumer data
+        """
+        if name not in self._bases:
+            template_zip = zipfile.ZipFile(io.BytesIO(self.template[name]))
+            consumer_export_zip = zipfile.ZipFile(
+                io.BytesIO(template_zip.read('consumer_export.zip'))
+            )
+            base = io.BytesIO()
+            with zipfile.ZipFile(base, 'w', zipfile.ZIP_DEFLATED) as base_zip:
+                for member in consumer_export_zip.namelist():
+                    if member != CONSUMER_FILE:
+                        base_zip.writestr(member, consumer_export_zip.read(member))
+            consumer_data = json.loads(consumer_export_zip.read(CONSUMER_FILE).decode('utf-8'))
+            self._bases[name] = (base.getvalue(), consumer_data)
+        return self._bases[name]
+
     def manifest_clone(self, org_environment_access=False, name='default'):
         """Clones a RedHat-manifest file.
 
@@ -54,43 +132,10 @@ class ManifestCloner:
         """
         if self.signing_key is None or self.template is None or self.template.get(name) is None:
             self._download_manifest_info(name)
-
-        template_zip = zipfile.ZipFile(io.BytesIO(self.template[name]))
-        # Extract the consumer_export.zip from the template manifest.
-        consumer_export_zip = zipfile.ZipFile(io.BytesIO(template_zip.read('consumer_export.zip')))
-
-        # Generate a new consumer_export.zip file changing the consumer
-        # uuid.
-        consumer_export = io.BytesIO()
-        with zipfile.ZipFile(consumer_export, 'w') as new_consumer_export_zip:
-            for name in consumer_export_zip.namelist():
-                if name == 'export/consumer.json':
-                    consumer_data = json.loads(consumer_export_zip.read(name).decode('utf-8'))
-                    consumer_data['uuid'] = str(uuid.uuid1())
-                    if org_environment_access:
-                        consumer_data['contentAccessMode'] = 'org_environment'
-                        consumer_data['owner']['contentAccessModeList'] = (
-                            'entitlement,org_environment'
-                        )
-                    new_consumer_export_zip.writestr(name, json.dumps(consumer_data))
-                else:
-                    new_consumer_export_zip.writestr(name, consumer_export_zip.read(name))
-
-        # Generate a new manifest.zip file with the generated
-        # consumer_export.zip and new signature.
-        manifest = io.BytesIO()
-        with zipfile.ZipFile(manifest, 'w', zipfile.ZIP_DEFLATED) as manifest_zip:
-            consumer_export.seek(0)
-            manifest_zip.writestr('consumer_export.zip', consumer_export.read())
-            consumer_export.seek(0)
-            signature = self.private_key.sign(
-                consumer_export.read(), padding.PKCS1v15(), hashes.SHA256()
-            )
-            manifest_zip.writestr('signature', signature)
-        # Make sure that the file-like object is at the beginning and
-        # ready to be read.
-        manifest.seek(0)
-        return manifest
+        base, consumer_data = self._clone_base(name)
+        return io.BytesIO(
+            build_clone(base, consumer_data, self.private_key, org_environment_access)
+        )
 
     def original(self, name='default'):
         """Returns the original manifest as a file-like object.
@@ -109,9 +154,103 @@ class ManifestCloner:
         return io.BytesIO(self.template[name])
 
 
+class ManifestPool:
+    """Keep up to ``size`` signed clones of each manifest ready for the next requests
+
+    The clones are built in background processes from the parts of the template shared by the
+    clones, and the pool of a manifest name and access mode is filled from its first request.
+    Requests never wait for the background processes, a clone is built on demand when none is
+    ready.
+
+    :param cloner: the ``ManifestCloner`` providing the templates and the signing key.
+    :param size: the number of clones kept ready for each manifest name and access mode.
+
+    ``hits`` holds the number of requests served by a clone built ahead and ``misses`` the
+    number of requests served by a clone built on demand.
+    """
+
+    def __init__(self, cloner, size):
+        self._cloner = cloner
+        self._size = size
+        self._ready = {}
+        self._executor = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _fill(self, org_environment_access, name):
+        """Start building clones until ``size`` of them are ready or being built"""
+        if self._executor is None:
+            # processes started from a fork server, the test processes run threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=min(self._size, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context('forkserver'),
+            )
+        base, consumer_data = self._cloner._clone_base(name)
+        ready = self._ready.setdefault((org_environment_access, name), deque())
+        while len(ready) < self._size:
+            ready.append(
+                self._executor.submit(
+                    _sign_clone,
+                    base,
+                    consumer_data,
+                    self._cloner.signing_key,
+                    org_environment_access,
+                )
+            )
+
+    def get(self, org_environment_access=False, name='default'):
+        """Return a clone built ahead, or a new clone when none is ready, as a ``BytesIO``"""
+        with self._lock:
+            ready = self._ready.get((org_environment_access, name))
+            # building a clone here is faster than waiting for one being built
+            future = ready.popleft() if ready and ready[0].done() else None
+        if future is not None:
+            try:
+                content = future.result()
+            except Exception as err:
+                logger.warning(f'Manifest clone built ahead is not available: {err}')
+            else:
+                self.hits += 1
+                with self._lock:
+                    self._fill(org_environment_access, name)
+                return io.BytesIO(content)
+        self.misses += 1
+        # clone first, it downloads the template and signing key the pool needs
+        content = self._cloner.manifest_clone(
+            org_environment_access=org_environment_access, name=name
+        )
+        with self._lock:
+            self._fill(org_environment_access, name)
+        return content
+
+    def close(self):
+        """Stop building clones"""
+        with self._lock:
+            self._ready = {}
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
 # Cache the ManifestCloner in order to avoid downloading the manifest template
 # every single time.
 _manifest_cloner = ManifestCloner()
+# Created with the first clone when performance.manifest_pool_size is set
+_manifest_pool = None
+
+
+def _clone_content(org_environment_access, name):
+    """Return the content of a new clone, from the manifest pool when it is enabled"""
+    global _manifest_pool
+    if not settings.performance.manifest_pool_size:
+        return _manifest_cloner.manifest_clone(
+            org_environment_access=org_environment_access, name=name
+        )
+    if _manifest_pool is None:
+        _manifest_pool = ManifestPool(_manifest_cloner, settings.performance.manifest_pool_size)
+        atexit.register(_manifest_pool.close)
+    return _manifest_pool.get(org_environment_access=org_environment_access, name=name)
 
 
 class Manifest:
@@ -130,9 +269,7 @@ class Manifest:
         self.filename = filename
 
         if self._content is None:
-            self._content = _manifest_cloner.manifest_clone(
-                org_environment_access=org_environment_access, name=name
-            )
+            self._content = _clone_content(org_environment_access, name)
         if self.filename is None:
             self.filename = f'/var/tmp/manifest-{int(time.time())}.zip'
 
@@ -0,0 +1,205 @@
+"""Collection-time index of the metadata found in test docstrings and sources
+
+The testimony tokens of a test, e.g. ``:CaseComponent:``, and its ``is_open`` workarounds are
+read from the docstrings and sources of its module, class and function. Parametrized tests share
+these objects, so the index parses each of them once per process, keyed by code object, and
+persists the results in ``<robottelo.tmp_dir>/metadata_index.json``. Entries are grouped by
+source file and dropped when the file's mtime or size changes, so an unchanged test module is
+not parsed again by the next run or ``--collect-only``.
+
+Used by the ``metadata_markers`` and ``issue_handlers`` pytest plugins.
+"""
+
+import inspect
+import json
+import os
+from pathlib import Path
+import re
+
+from robottelo.config import robottelo_tmp_dir
+from robottelo.logging import collection_logger as logger
+
+INDEX_FILE = robottelo_tmp_dir.joinpath('metadata_index.json')
+INDEX_VERSION = 1
+
+COMPONENT = re.compile(
+    # To match :CaseComponent: FooBar
+    r'\s*:CaseComponent:\s*(?P<component>\S*)',
+    re.IGNORECASE,
+)
+
+IMPORTANCE = re.compile(
+    # To match :CaseImportance: Critical
+    r'\s*:CaseImportance:\s*(?P<importance>\S*)',
+    re.IGNORECASE,
+)
+
+TEAM = re.compile(
+    # To match :Team: Rocket
+    r'\s*:Team:\s*(?P<team>\S*)',
+    re.IGNORECASE,
+)
+
+BLOCKED_BY = re.compile(
+    # To match :BlockedBy: SAT-32932
+    r'\s*:BlockedBy:\s*(?P<blocked_by>.*\S*)',
+    re.IGNORECASE,
+)
+
+VERIFIES = re.compile(
+    # To match :Verifies: SAT-32932
+    r'\s*:Verifies:\s*(?P<verifies>.*\S*)',
+    re.IGNORECASE,
+)
+
+BZ = re.compile(
+    # To match :BZ: 123456, 456789
+    r'\s*:BZ:\s*(?P<bz>.*\S*)',
+    re.IGNORECASE,
+)
+
+IS_OPEN = re.compile(
+    # To match `if is_open('BZ:123456'):`
+    r"\s*if\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
+)
+
+NOT_IS_OPEN = re.compile(
+    # To match `if not is_open('BZ:123456'):`
+    r"\s*if\snot\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
+)
+
+DOC_TOKENS = {
+    'component': COMPONENT,
+    'importance': IMPORTANCE,
+    'team': TEAM,
+    'blocked_by': BLOCKED_BY,
+    'verifies': VERIFIES,
+    'bz': BZ,
+}
+
+
+def parse(obj):
+    """Parse the docstring, and the source of a module or function
+
+    :return: a dict with a ``doc`` key, ``None`` if ``obj`` has no docstring, else a dict
+        mapping each token of ``DOC_TOKENS`` to its ``findall`` matches. Modules and functions
+        also have a ``source`` key, a dict with the ``is_open`` and ``not_is_open`` workaround
+        matches, the ``:CaseComponent:`` matches of the whole source, and ``uses_is_open``.
+    """
+    doc = inspect.getdoc(obj)
+    metadata = {
+        'doc': None
+        if doc is None
+        else {token: regex.findall(doc) for token, regex in DOC_TOKENS.items()}
+    }
+    if not inspect.isclass(obj):
+        try:
+            source = inspect.getsource(obj)
+        except (OSError, TypeError):
+            source = ''
+        metadata['source'] = {
+            'uses_is_open': 'is_open(' in source,
+            'is_open': IS_OPEN.findall(source),
+            'not_is_open': NOT_IS_OPEN.findall(source),
+            'component': COMPONENT.findall(source),
+        }
+    return metadata
+
+
+class MetadataIndex:
+    """Memoized and persisted results of :func:`parse`
+
+    :param path: the file the index is persisted to, ``None`` to keep it in memory only.
+    """
+
+    def __init__(self, path=INDEX_FILE):
+        self.path = Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self._memo = {}
+        self._files = {}
+        self._checked = {}
+        self._dirty = False
+        if self.path:
+            try:
+                data = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                data = {}
+            if data.get('version') == INDEX_VERSION:
+                self._files = data['files']
+
+    def metadata(self, obj):
+        """Return the parsed metadata of a module, class or function, see :func:`parse`
+
+        :return: the metadata, ``None`` if ``obj`` is None.
+        """
+        if obj is None:
+            return None
+        key = getattr(obj, '__code__', obj)
+        try:
+            return self._memo[key]
+        except KeyError:
+            metadata = self._memo[key] = self._lookup(obj)
+            return metadata
+
+    def doc_tokens(self, obj):
+        """Return the docstring token matches of ``obj``, ``None`` if it has no docstring"""
+        metadata = self.metadata(obj)
+        return metadata and metadata['doc']
+
+    def source(self, obj):
+        """Return the source matches of a module or function"""
+        return self.metadata(obj)['source']
+
+    def _lookup(self, obj):
+        try:
+            filename = inspect.getsourcefile(obj)
+        except TypeError:
+            filename = None
+        if filename is None:
+            self.misses += 1
+            return parse(obj)
+        objects = self._file_objects(filename)
+        name = '' if inspect.ismodule(obj) else obj.__qualname__
+        if name in objects:
+            self.hits += 1
+        else:
+            self.misses += 1
+            objects[name] = parse(obj)
+            self._dirty = True
+        return objects[name]
+
+    def _file_objects(self, filename):
+        """Return the entries of a source file, reset if the file changed since indexed"""
+        if filename not in self._checked:
+            stat = os.stat(filename)
+            signature = [stat.st_mtime_ns, stat.st_size]
+            entry = self._files.get(filename)
+            if entry is None or entry['signature'] != signature:
+                entry = self._files[filename] = {'signature': signature, 'objects': {}}
+                self._dirty = True
+            self._checked[filename] = entry['objects']
+        return self._checked[filename]
+
+    def save(self):
+        """Persist the index, if it changed"""
+        logger.info(f'Metadata index: {self.hits} hits, {self.misses} misses')
+        if not (self.path and self._dirty):
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # workers may save at the same time, write to a private file and move it in place
+        tmp_file = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_file.write_text(json.dumps({'version': INDEX_VERSION, 'files': self._files}))
+        tmp_file.replace(self.path)
+        self._dirty = False
+
+
+_index = None
+
+
+def get_index():
+    """Return the metadata index of this process"""
+    global _index
+    if _index is None:
+        _index = MetadataIndex()
+    return _index
@@ -0,0 +1,121 @@
+"""Inspect many files of a host in one command
+
+The size, checksum, ``file`` description and mime type of files, or the size and checksum of
+URLs downloaded by the host, are read by a Python script run on the host. The script reads and
+hashes the files in parallel threads and prints one JSON line per file, parsed back into Boxes.
+
+Example:
+    >>> inspect(satellite, 'path', ['/etc/hosts', '/etc/missing'])
+    [Box({'path': '/etc/hosts', 'size': 158, 'sum': '...', 'info': 'ASCII text', ...}),
+     Box({'path': '/etc/missing', 'error': 'No such file or directory'})]
+"""
+
+import json
+import shlex
+
+from box import Box
+
+from robottelo.exceptions import FileInspectionError
+
+# files or URLs inspected by one command, the arguments of a command have a limited length
+BATCH_SIZE = 500
+# RHEL 8 has no python3 unless it is installed, but always has platform-python
+PYTHON = '$(command -v python3 || echo /usr/libexec/platform-python)'
+# compatible with Python 3.6, the platform-python of RHEL 8
+SCRIPT = '''
+import hashlib
+import json
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import urlopen
+
+request = json.loads(sys.argv[1])
+
+
+def digest(stream):
+    checksum = hashlib.new(request['algorithm'])
+    size = 0
+    for chunk in iter(lambda: stream.read(1 << 20), b''):
+        checksum.update(chunk)
+        size += len(chunk)
+    return {'size': size, 'sum': checksum.hexdigest()}
+
+
+def inspect_path(path):
+    try:
+        with open(path, 'rb') as stream:
+            return dict(digest(stream), path=path)
+    except OSError as err:
+        return {'path': path, 'error': err.strerror}
+
+
+def inspect_url(url):
+    try:
+        with urlopen(url) as stream:
+            return dict(digest(stream), url=url)
+    except Exception as err:
+        return {'url': url, 'error': str(err)}
+
+
+inspect = inspect_url if request['kind'] == 'url' else inspect_path
+with ThreadPoolExecutor(request['workers']) as executor:
+    results = list(executor.map(inspect, request['items']))
+found = [result for result in results if 'path' in result and 'error' not in result]
+for key, options in (('info', []), ('mime', ['--mime-type'])):
+    if not found:
+        break
+    output = subprocess.run(
+        ['file', '-b'] + options + ['--'] + [result['path'] for result in found],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout.splitlines()
+    for result, line in zip(found, output):
+        result[key] = line
+for result in results:
+    print(json.dumps(result))
+'''
+
+
+def inspection_commands(kind, items, algorithm='sha256', workers=1):
+    """Return the commands inspecting files or URLs on a host, one per batch
+
+    :param str kind: ``path`` to inspect files of the host, ``url`` to inspect URLs the
+        host downloads.
+    :param list items: the paths or the URLs.
+    :param str algorithm: the ``hashlib`` algorithm of the checksums.
+    :param int workers: the number of files or URLs the host reads and hashes in parallel.
+    """
+    return [
+        f'{PYTHON} -c {shlex.quote(SCRIPT)} '
+        + shlex.quote(
+            json.dumps(
+                {
+                    'kind': kind,
+                    'items': items[start : start + BATCH_SIZE],
+                    'algorithm': algorithm,
+                    'workers': workers,
+                }
+            )
+        )
+        for start in range(0, len(items), BATCH_SIZE)
+    ]
+
+
+def inspect(host, kind, items, algorithm='sha256', workers=1):
+    """Inspect files or URLs on a host, see ``inspection_commands``
+
+    :return: a Box per item, in the order of ``items``, with the ``path`` or ``url``, and
+        either the ``size``, ``sum`` and, for files, ``info`` and ``mime`` of the item, or
+        the ``error`` reading it.
+    :raises robottelo.exceptions.FileInspectionError: If the inspection could not be run.
+    """
+    results = []
+    for command in inspection_commands(kind, list(items), algorithm, workers):
+        result = host.execute(command)
+        if result.status != 0:
+            raise FileInspectionError(
+                f'Failed to inspect files on {host.hostname}: {result.stderr}'
+            )
+        results.extend(Box(json.loads(line)) for line in result.stdout.splitlines())
+    return results
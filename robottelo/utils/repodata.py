@@ -0,0 +1,243 @@
+"""Indexes of the repodata of published repositories
+
+The ``primary``, ``updateinfo`` and ``modules`` repodata files of a repository are parsed while
+they are downloaded and decompressed, see ``robottelo.content_info.open_repodata``, into:
+
+- the packages, by NEVRA,
+- the errata, by id, with the NEVRA of their packages,
+- the module streams, by ``name:stream``, with the NEVRA of their artifacts.
+
+The XML files are parsed one package or erratum at a time, but the indexes themselves grow with
+the repository: they are kept in memory for the process and cached in
+``<robottelo.tmp_dir>/repodata/``, by repository URL and repomd revision, so tests comparing the
+content of the same publication download it once. The cache keeps the ``CACHE_MAX_FILES`` most
+recently used indexes, ``clear_cache`` empties it.
+
+Example:
+    >>> repodata = get_repodata(repo.full_path)
+    >>> repodata.package('walrus-0.71-1.noarch')
+    >>> repodata.erratum_packages('RHEA-2012:0055')
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+
+from box import Box
+import yaml
+
+from robottelo import content_info
+from robottelo.config import robottelo_tmp_dir
+from robottelo.content_info import COMMON_NS
+
+CACHE_DIR = robottelo_tmp_dir.joinpath('repodata')
+CACHE_MAX_FILES = 100
+
+# the indexes read in this process, by repository URL and repomd revision
+_indexes = {}
+
+
+def nevra(name, epoch, version, release, arch):
+    """Return the NEVRA of a package, without the epoch when it is 0"""
+    epoch = f'{epoch}:' if epoch and str(epoch) != '0' else ''
+    return f'{name}-{epoch}{version}-{release}.{arch}'
+
+
+def _parse_primary(stream):
+    packages = {}
+    for element in content_info.iter_repodata_elements(stream, f'{COMMON_NS}package'):
+        version = element.find(f'{COMMON_NS}version')
+        package = {
+            'name': element.findtext(f'{COMMON_NS}name'),
+            'epoch': version.get('epoch', '0'),
+            'version': version.get('ver'),
+            'release': version.get('rel'),
+            'arch': element.findtext(f'{COMMON_NS}arch'),
+            'checksum': element.findtext(f'{COMMON_NS}checksum'),
+            'location': element.find(f'{COMMON_NS}location').get('href'),
+        }
+        packages[
+            nevra(
+                package['name'],
+                package['epoch'],
+                package['version'],
+                package['release'],
+                package['arch'],
+            )
+        ] = package
+    return packages
+
+
+def _parse_updateinfo(stream):
+    errata = {}
+    for element in content_info.iter_repodata_elements(stream, 'update'):
+        erratum = {
+            'id': element.findtext('id'),
+            'type': element.get('type'),
+            'severity': element.findtext('severity'),
+            'title': element.findtext('title'),
+            'packages': sorted(
+                {
+                    nevra(
+                        package.get('name'),
+                        package.get('epoch'),
+                        package.get('version'),
+                        package.get('release'),
+                        package.get('arch'),
+                    )
+                    for package in element.iter('package')
+                }
+            ),
+        }
+        errata[erratum['id']] = erratum
+    return errata
+
+
+def _parse_modules(stream):
+    module_streams = {}
+    for document in yaml.safe_load_all(io.TextIOWrapper(stream, encoding='utf-8')):
+        if not document or document.get('document') != 'modulemd':
+            continue
+        data = document['data']
+        name_stream = f'{data["name"]}:{data["stream"]}'
+        module_streams.setdefault(name_stream, []).append(
+            {
+                'name': data['name'],
+                'stream': str(data['stream']),
+                'version': data.get('version'),
+                'context': data.get('context'),
+                'arch': data.get('arch'),
+                # artifacts are name-epoch:version-release.arch
+                'artifacts': sorted(
+                    artifact.replace('-0:', '-', 1)
+                    for artifact in data.get('artifacts', {}).get('rpms', [])
+                ),
+            }
+        )
+    return module_streams
+
+
+class RepoData:
+    """The indexes of the repodata of a published repository
+
+    :param url: URL where the repo or CV is published.
+    :param revision: the repomd revision of the repository.
+    :param packages: the packages, by NEVRA.
+    :param errata: the errata, by id.
+    :param module_streams: the versions of each module stream, by ``name:stream``.
+    """
+
+    def __init__(self, url, revision, packages, errata, module_streams):
+        self.url = url
+        self.revision = revision
+        self.packages = packages
+        self.errata = errata
+        self.module_streams = module_streams
+        self._errata_by_package = None
+
+    def package(self, nevra):
+        """Return the package of a NEVRA, None if the repository does not have it"""
+        package = self.packages.get(nevra)
+        return Box(package) if package else None
+
+    def packages_by_name(self, name):
+        """Return the NEVRA of the packages of a name"""
+        return sorted(key for key, package in self.packages.items() if package['name'] == name)
+
+    def erratum(self, erratum_id):
+        """Return an erratum, None if the repository does not have it"""
+        erratum = self.errata.get(erratum_id)
+        return Box(erratum) if erratum else None
+
+    def erratum_packages(self, erratum_id):
+        """Return the NEVRA of the packages of an erratum"""
+        return list(self.errata[erratum_id]['packages'])
+
+    def package_errata(self, nevra):
+        """Return the ids of the errata of a package"""
+        if self._errata_by_package is None:
+            self._errata_by_package = {}
+            for erratum_id, erratum in self.errata.items():
+                for package in erratum['packages']:
+                    self._errata_by_package.setdefault(package, []).append(erratum_id)
+        return sorted(self._errata_by_package.get(nevra, []))
+
+    def module_stream_artifacts(self, name_stream):
+        """Return the NEVRA of the artifacts of all the versions of a module stream"""
+        return sorted(
+            {
+                artifact
+                for module in self.module_streams.get(name_stream, [])
+                for artifact in module['artifacts']
+            }
+        )
+
+
+def _cache_file(url, revision):
+    digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return CACHE_DIR.joinpath(f'{digest}-{revision}.json')
+
+
+def _prune_cache():
+    """Remove the least recently used cache files beyond ``CACHE_MAX_FILES``"""
+    cache_files = []
+    for cache_file in CACHE_DIR.glob('*.json'):
+        try:
+            cache_files.append((cache_file.stat().st_mtime, cache_file))
+        except FileNotFoundError:
+            continue
+    cache_files.sort(reverse=True)
+    for _, cache_file in cache_files[CACHE_MAX_FILES:]:
+        cache_file.unlink(missing_ok=True)
+
+
+def clear_cache():
+    """Forget the indexes read in this process and remove the cache files"""
+    _indexes.clear()
+    for cache_file in CACHE_DIR.glob('*.json'):
+        cache_file.unlink(missing_ok=True)
+
+
+def get_repodata(url):
+    """Return the indexes of the repodata of a published repository
+
+    :param url: URL where the repo or CV is published
+    :return: a ``RepoData``
+    """
+    if not url.endswith('/'):
+        url += '/'
+    repomd = content_info.get_repomd(url.rstrip('/'))
+    revision = content_info.parse_repomd_revision(repomd)
+    if revision and (url, revision) in _indexes:
+        return _indexes[url, revision]
+    cache_file = _cache_file(url, revision) if revision else None
+    indexes = None
+    if cache_file:
+        # not cached yet, or pruned by another process
+        with contextlib.suppress(FileNotFoundError):
+            indexes = json.loads(cache_file.read_text())
+            # the mtime of a cache file is the last time it was used
+            os.utime(cache_file)
+    if indexes is None:
+        indexes = {}
+        for data_type, parse in (
+            ('primary', _parse_primary),
+            ('updateinfo', _parse_updateinfo),
+            ('modules', _parse_modules),
+        ):
+            with content_info.open_repodata(url, repomd, data_type) as stream:
+                indexes[data_type] = parse(stream) if stream is not None else {}
+        if cache_file:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_file.write_text(json.dumps(indexes))
+            tmp_file.replace(cache_file)
+            _prune_cache()
+    repodata = RepoData(
+        url, revision, indexes['primary'], indexes['updateinfo'], indexes['modules']
+    )
+    if revision:
+        _indexes[url, revision] = repodata
+    return repodata
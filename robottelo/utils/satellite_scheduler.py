@@ -0,0 +1,201 @@
+"""Lease Satellites to xdist workers by load
+
+Used by the ``load-balance`` ``server.xdist_behavior``. Instead of being pinned to
+``server.hostnames[worker_pos]``, each worker leases the least loaded Satellite, renews its lease
+when it starts a new test module and may move to a less loaded Satellite at that time, see
+``pytest_fixtures.core.xdist``.
+
+The leases and the load signals are shared by the workers in
+``<robottelo.tmp_dir>/satellite_leases.json``. The load of a Satellite is estimated from:
+
+- the number of workers holding a lease on it,
+- its number of running Foreman tasks, sampled at most every ``TASK_SAMPLE_INTERVAL`` seconds,
+- the mean duration of its recent tests, relative to the other Satellites.
+"""
+
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import time
+
+from pytest_services.locks import file_lock
+
+from robottelo.config import robottelo_tmp_dir
+from robottelo.hosts import Satellite
+from robottelo.logging import logger
+
+STATE_FILE = robottelo_tmp_dir.joinpath('satellite_leases.json')
+LOCK_TIMEOUT = 60
+# seconds a lease is valid without renewal, the leases of crashed workers expire
+LEASE_TTL = 3600
+TASK_SAMPLE_INTERVAL = 60
+# number of running tasks weighing as much as one worker
+TASKS_PER_WORKER = 10
+# weight of the last module in the mean test duration of a Satellite
+DURATION_SMOOTHING = 0.3
+# minimum load difference for a worker to move to another Satellite
+MOVE_THRESHOLD = 1
+
+
+def count_running_tasks(hostname):
+    """Return the number of running Foreman tasks of a Satellite"""
+    query = {'search': 'state = running', 'per_page': 1}
+    return int(Satellite(hostname).api.ForemanTask().search_json(query=query)['subtotal'])
+
+
+class SatelliteScheduler:
+    """Lease one of several Satellites to an xdist worker
+
+    :param hostnames: the hostnames of the Satellites to choose from.
+    :param worker_id: the id of the xdist worker, e.g. ``gw0``.
+    :param state_file: the file shared by the workers.
+    :param task_counter: a callable returning the number of running tasks of a hostname,
+        ``None`` to ignore the tasks.
+    :param lease_ttl: seconds a lease is valid without renewal.
+    """
+
+    def __init__(
+        self,
+        hostnames,
+        worker_id,
+        state_file=STATE_FILE,
+        task_counter=count_running_tasks,
+        lease_ttl=LEASE_TTL,
+    ):
+        self.hostnames = list(dict.fromkeys(hostnames))
+        self.worker_id = worker_id
+        self.state_file = Path(state_file)
+        self.task_counter = task_counter
+        self.lease_ttl = lease_ttl
+        self.hostname = None
+
+    @contextmanager
+    def _state(self):
+        """Lock the shared state and yield it, it is saved on exit"""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = str(self.state_file.with_suffix('.lock'))
+        with file_lock(lock_file, remove=False, timeout=LOCK_TIMEOUT):
+            try:
+                state = json.loads(self.state_file.read_text())
+            except (OSError, ValueError):
+                state = {}
+            now = time.time()
+            state['leases'] = {
+                worker_id: lease
+                for worker_id, lease in state.get('leases', {}).items()
+                if lease['expires'] > now
+            }
+            state.setdefault('load', {})
+            yield state
+            tmp_file = self.state_file.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_file.write_text(json.dumps(state))
+            tmp_file.replace(self.state_file)
+
+    def _sample_tasks(self):
+        """Refresh the running task counts sampled more than TASK_SAMPLE_INTERVAL ago"""
+        if self.task_counter is None:
+            return
+        with self._state() as state:
+            now = time.time()
+            stale = [
+                hostname
+                for hostname in self.hostnames
+                if now - state['load'].get(hostname, {}).get('sampled', 0) >= TASK_SAMPLE_INTERVAL
+            ]
+            # claim the samples, other workers do not query the same Satellites meanwhile
+            for hostname in stale:
+                state['load'].setdefault(hostname, {})['sampled'] = now
+        counts = {}
+        for hostname in stale:
+            try:
+                counts[hostname] = self.task_counter(hostname)
+            except Exception as err:
+                logger.warning(f'Failed to count the running tasks of {hostname}: {err}')
+        if counts:
+            with self._state() as state:
+                for hostname, count in counts.items():
+                    state['load'].setdefault(hostname, {})['tasks'] = count
+
+    def loads(self, state):
+        """Return the load each Satellite would have with this worker on it
+
+        :param state: the shared state, as yielded by ``_state``.
+        """
+        durations = {
+            hostname: state['load'].get(hostname, {}).get('duration') for hostname in self.hostnames
+        }
+        known = [duration for duration in durations.values() if duration]
+        mean_duration = sum(known) / len(known) if known else None
+        loads = {}
+        for hostname in self.hostnames:
+            workers = sum(
+                1
+                for worker_id, lease in state['leases'].items()
+                if lease['hostname'] == hostname and worker_id != self.worker_id
+            )
+            tasks = state['load'].get(hostname, {}).get('tasks') or 0
+            duration = durations[hostname]
+            slowness = duration / mean_duration if duration and mean_duration else 1
+            loads[hostname] = (workers + 1 + tasks / TASKS_PER_WORKER) * slowness
+        return loads
+
+    def _least_loaded(self, loads):
+        return min(self.hostnames, key=lambda hostname: (loads[hostname], hostname))
+
+    def _lease(self, state):
+        state['leases'][self.worker_id] = {
+            'hostname': self.hostname,
+            'expires': time.time() + self.lease_ttl,
+        }
+
+    def acquire(self):
+        """Lease the least loaded Satellite
+
+        :return: the hostname of the Satellite.
+        """
+        self._sample_tasks()
+        with self._state() as state:
+            loads = self.loads(state)
+            self.hostname = self._least_loaded(loads)
+            self._lease(state)
+        logger.info(f'{self.worker_id}: leased {self.hostname}, Satellite loads: {loads}')
+        return self.hostname
+
+    def renew(self, tests=0, duration=0, may_move=True):
+        """Renew the lease, after running tests on the leased Satellite
+
+        :param tests: the number of tests run since the last renewal.
+        :param duration: the number of seconds these tests took.
+        :param may_move: whether the worker can move to another Satellite.
+        :return: the hostname of the Satellite to use from now on, another one if the worker
+            may move and that Satellite is less loaded by at least ``MOVE_THRESHOLD``.
+        """
+        self._sample_tasks()
+        with self._state() as state:
+            if tests:
+                load = state['load'].setdefault(self.hostname, {})
+                per_test = duration / tests
+                previous = load.get('duration')
+                load['duration'] = (
+                    per_test
+                    if previous is None
+                    else previous + DURATION_SMOOTHING * (per_test - previous)
+                )
+            if may_move:
+                loads = self.loads(state)
+                best = self._least_loaded(loads)
+                if loads[best] + MOVE_THRESHOLD <= loads.get(self.hostname, float('inf')):
+                    logger.info(
+                        f'{self.worker_id}: moving from {self.hostname} to {best}, '
+                        f'Satellite loads: {loads}'
+                    )
+                    self.hostname = best
+            self._lease(state)
+        return self.hostname
+
+    def release(self):
+        """Release the lease"""
+        with self._state() as state:
+            state['leases'].pop(self.worker_id, None)
+        self.hostname = None
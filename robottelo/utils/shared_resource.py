@@ -11,6 +11,11 @@ If the main actor fails to complete the action, and the action is recoverable, a
 will take over as the main watcher and attempt to perform the action. If the action is not
 recoverable, the main watcher will fail and release all other processes.
 
+The file is an append-only log of events, one JSON object per line, and each process replays the
+events appended since its last read. Waiting processes are woken up by inotify as soon as an event
+is appended. Where inotify is not available, they read the file again every ``POLL_INTERVAL``
+seconds.
+
 It is recommended to use this class as a context manager, as it will automatically register and
 report when the process is done.
 
@@ -22,13 +27,75 @@ Example:
     ...     # Do post-upgrade cleanup steps if any
 """
 
+import contextlib
+import ctypes
+import ctypes.util
 import json
+import os
 from pathlib import Path
+import select
+import sys
 import time
 from uuid import uuid4
 
 from broker.helpers import FileLock
 
+# Seconds between two reads of the resource file when it can not be watched. Watched files are
+# also read again after this time, in case a notification was missed.
+POLL_INTERVAL = 1
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_DELETE_SELF = 0x00000400
+_IN_CLOEXEC = 0o2000000
+_IN_NONBLOCK = 0o4000
+
+
+def _load_libc():
+    """Return the C library if it provides inotify, else None"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+_libc = _load_libc()
+
+
+class _FileWatcher:
+    """Wait for the changes of a file, notified by inotify when available"""
+
+    def __init__(self, path):
+        self._fd = None
+        if _libc is None:
+            return
+        fd = _libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return
+        mask = _IN_MODIFY | _IN_ATTRIB | _IN_DELETE_SELF
+        if _libc.inotify_add_watch(fd, os.fsencode(path), mask) < 0:
+            os.close(fd)
+            return
+        self._fd = fd
+
+    def wait(self, timeout=POLL_INTERVAL):
+        """Wait until the file changes, or for at most ``timeout`` seconds"""
+        if self._fd is None:
+            time.sleep(timeout)
+        elif select.select([self._fd], [], [], timeout)[0]:
+            # drop the pending events, the caller reads the file again anyway
+            with contextlib.suppress(BlockingIOError):
+                while os.read(self._fd, 4096):
+                    pass
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
 
 class SharedResource:
     """A class representing a shared resource.
@@ -42,6 +109,9 @@ class SharedResource:
         resource_file (Path): The path to the file representing the shared resource.
         is_main (bool): Whether the current instance is the main watcher or not.
         is_recovering (bool): Whether the current instance is recovering from an error or not.
+        wait_times (list): The number of seconds spent in each wait for the other processes.
+        handover_latencies (list): For each wait that had to wait, the number of seconds between
+            the event that ended it and the moment this process noticed it.
     """
 
     def __init__(self, resource_name, action, *action_args, **action_kwargs):
@@ -61,6 +131,78 @@ class SharedResource:
         self.action_args = action_args
         self.action_kwargs = action_kwargs
         self.is_recovering = False
+        self.wait_times = []
+        self.handover_latencies = []
+        self._offset = 0
+        self._state = {
+            "watchers": [],
+            "statuses": {},
+            "main_watcher": None,
+            "main_status": None,
+            "changed": None,
+        }
+        self._watcher = None
+
+    def _append_event(self, event, value):
+        """Appends an event to the shared resource file.
+
+        Args:
+            event (str): The type of the event, see ``_read_state``.
+            value (str): The value of the event.
+        """
+        line = json.dumps({"time": time.time(), "id": self.id, "event": event, "value": value})
+        # a single write of an append-only file, concurrent events can not interleave
+        fd = os.open(self.resource_file, os.O_WRONLY | os.O_APPEND)
+        try:
+            os.write(fd, f"{line}\n".encode())
+        finally:
+            os.close(fd)
+
+    def _read_state(self):
+        """Reads the events appended since the last read and returns the resulting state.
+
+        Returns:
+            dict: The watchers, the status of each watcher, the main watcher and its status,
+                and the time of the last event.
+        """
+        with self.resource_file.open("rb") as log:
+            log.seek(self._offset)
+            data = log.read()
+        # leave an event being appended for the next read
+        data = data[: data.rfind(b"\n") + 1]
+        self._offset += len(data)
+        for line in data.splitlines():
+            event = json.loads(line)
+            if event["event"] == "watcher":
+                self._state["watchers"].append(event["value"])
+                self._state["statuses"][event["value"]] = "pending"
+            elif event["event"] == "status":
+                self._state["statuses"][event["id"]] = event["value"]
+            else:  # main_watcher and main_status
+                self._state[event["event"]] = event["value"]
+            self._state["changed"] = event["time"]
+        return self._state
+
+    def _wait_until(self, condition):
+        """Waits until the condition is met by the state of the shared resource.
+
+        Args:
+            condition (function): Called with the state, see ``_read_state``.
+
+        Returns:
+            dict: The state meeting the condition.
+        """
+        start = time.monotonic()
+        waited = False
+        while not condition(state := self._read_state()):
+            if self._watcher is None:
+                self._watcher = _FileWatcher(self.resource_file)
+            self._watcher.wait()
+            waited = True
+        self.wait_times.append(time.monotonic() - start)
+        if waited:
+            self.handover_latencies.append(max(0, time.time() - state["changed"]))
+        return state
 
     def _update_status(self, status):
         """Updates the status of the shared resource.
@@ -68,10 +210,7 @@ class SharedResource:
         Args:
             status (str): The new status of the shared resource.
         """
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
-            curr_data["statuses"][self.id] = status
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+        self._append_event("status", status)
 
     def _update_main_status(self, status):
         """Updates the main status of the shared resource.
@@ -79,26 +218,28 @@ class SharedResource:
         Args:
             status (str): The new main status of the shared resource.
         """
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
-            curr_data["main_status"] = status
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+        self._append_event("main_status", status)
+
+    @staticmethod
+    def _all_have_status(state, status):
+        """Checks if all watchers have the specified status, ignoring the failed watchers."""
+        return all(
+            state["statuses"].get(watcher_id) in (status, "error")
+            for watcher_id in state["watchers"]
+        )
 
     def _check_all_status(self, status):
         """Checks if all watchers have the specified status.
 
+        Watchers that failed are ignored, they will not get to the status.
+
         Args:
             status (str): The status to check for.
 
         Returns:
             bool: True if all watchers have the specified status, False otherwise.
         """
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
-            for watcher_id in curr_data["watchers"]:
-                if curr_data["statuses"].get(watcher_id) != status:
-                    return False
-            return True
+        return self._all_have_status(self._read_state(), status)
 
     def _wait_for_status(self, status):
         """Waits until all watchers have the specified status.
@@ -106,30 +247,24 @@ class SharedResource:
         Args:
             status (str): The status to wait for.
         """
-        while not self._check_all_status(status):
-            time.sleep(1)
+        self._wait_until(lambda state: self._all_have_status(state, status))
 
     def _wait_for_main_watcher(self):
         """Waits for the main watcher to finish."""
-        while True:
-            curr_data = json.loads(self.resource_file.read_text())
-            if curr_data["main_status"] != "done":
-                time.sleep(60)
-            elif curr_data["main_status"] == "action_error":
-                self._try_take_over()
-            elif curr_data["main_status"] == "error":
-                raise Exception(f"Error in main watcher: {curr_data['main_watcher']}")
-            else:
-                break
+        state = self._wait_until(
+            lambda state: state["main_status"] in ("done", "action_error", "error")
+        )
+        if state["main_status"] == "action_error":
+            self._try_take_over()
+        elif state["main_status"] == "error":
+            raise Exception(f"Error in main watcher: {state['main_watcher']}")
 
     def _try_take_over(self):
         """Tries to take over as the main watcher."""
         with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
-            if curr_data["main_status"] in ("action_error", "error"):
-                curr_data["main_status"] = "recovering"
-                curr_data["main_watcher"] = self.id
-                self.resource_file.write_text(json.dumps(curr_data, indent=4))
+            if self._read_state()["main_status"] in ("action_error", "error"):
+                self._append_event("main_watcher", self.id)
+                self._update_main_status("recovering")
                 self.is_main = True
                 self.is_recovering = True
         self.wait()
@@ -137,20 +272,16 @@ class SharedResource:
     def register(self):
         """Registers the current process as a watcher."""
         with self.lock_file:
-            if self.resource_file.exists():
-                curr_data = json.loads(self.resource_file.read_text())
-                self.is_main = False
-            else:  # First watcher to register, becomes the main watcher, and creates the file
-                curr_data = {
-                    "watchers": [],
-                    "statuses": {},
-                    "main_watcher": self.id,
-                    "main_status": "waiting",
-                }
+            try:
+                # First watcher to register, becomes the main watcher, and creates the file
+                self.resource_file.touch(exist_ok=False)
                 self.is_main = True
-            curr_data["watchers"].append(self.id)
-            curr_data["statuses"][self.id] = "pending"
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+            except FileExistsError:
+                self.is_main = False
+            if self.is_main:
+                self._append_event("main_watcher", self.id)
+                self._update_main_status("waiting")
+            self._append_event("watcher", self.id)
 
     def ready(self):
         """Marks the current process as ready to perform the action."""
@@ -166,7 +297,8 @@ class SharedResource:
         try:
             self.action(*self.action_args, **self.action_kwargs)
         except Exception as err:
-            self._update_main_status("error")
+            # a recoverable action is retried by an other watcher
+            self._update_main_status("action_error" if self.action_is_recoverable else "error")
             raise err
 
     def wait(self):
@@ -186,15 +318,19 @@ class SharedResource:
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Marks the current process as done and updates the main watcher if needed."""
-        if exc_type is FileNotFoundError:
-            raise exc_value
-        if exc_type is None:
-            self.done()
-            if self.is_main:
-                self._wait_for_status("done")
-                self.resource_file.unlink()
-        else:
-            self._update_status("error")
-            if self.is_main:
-                self._update_main_status("error")
-            raise exc_value
+        try:
+            if exc_type is FileNotFoundError:
+                raise exc_value
+            if exc_type is None:
+                self.done()
+                if self.is_main:
+                    self._wait_for_status("done")
+                    self.resource_file.unlink()
+            else:
+                self._update_status("error")
+                if self.is_main and self._read_state()["main_status"] != "action_error":
+                    self._update_main_status("error")
+                raise exc_value
+        finally:
+            if self._watcher is not None:
+                self._watcher.close()
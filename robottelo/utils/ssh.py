@@ -1,6 +1,220 @@
 """Utility module to handle the shared ssh connection."""
 
+from collections import defaultdict, deque
+import contextlib
+import os
+import threading
+import time
+
 from robottelo.cli import hammer
+from robottelo.logging import logger
+
+
+class SSHConnectionPool:
+    """Process-wide pool of reusable ssh clients
+
+    Clients are keyed by ``(hostname, username, port)``. Each client keeps its ssh2 session
+    open between commands, so repeated commands to the same host only pay for the handshake and
+    authentication once. A client is handed out to a single caller at a time and must be given
+    back with :meth:`release`, or used through :meth:`connection`.
+
+    :param max_per_host: maximum number of sessions (idle and in use) per key. ``0`` disables
+        pooling, every acquired client is then closed on release.
+    :param idle_timeout: seconds after which an idle session is closed and evicted.
+    :param acquire_timeout: seconds to wait for a free session when ``max_per_host`` is reached.
+    """
+
+    def __init__(self, max_per_host=4, idle_timeout=300, acquire_timeout=300):
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self._cond = threading.Condition()
+        self._reset()
+
+    def _reset(self):
+        """Forget every session, used on init and when the pool is inherited by a forked child"""
+        self._pid = os.getpid()
+        # key -> deque of (client, password, last_used)
+        self._idle = defaultdict(deque)
+        # key -> number of clients currently handed out
+        self._in_use = defaultdict(int)
+        # id(client) -> key, for every client handed out by this pool
+        self._owned = {}
+        self.counters = {'hits': 0, 'misses': 0, 'evictions': 0, 'connect_time': 0.0}
+
+    @staticmethod
+    def _key(hostname, username, port):
+        return (hostname, username, int(port or 22))
+
+    @staticmethod
+    def _new_client(hostname, username, password, port):
+        from robottelo.hosts import ContentHost
+
+        return ContentHost(hostname=hostname, username=username, password=password, port=port)
+
+    @staticmethod
+    def _close(client):
+        with contextlib.suppress(Exception):
+            client.close()
+
+    @staticmethod
+    def is_alive(client):
+        """Cheap, local liveness check of a pooled client's ssh session
+
+        No command is run on the remote host. The session is considered dead when it was never
+        opened, its socket was closed, or a keepalive message cannot be sent.
+        """
+        session = getattr(client, '_session', None)
+        if session is None:
+            return False
+        sock = getattr(session, 'sock', None)
+        if sock is not None and sock.fileno() == -1:
+            return False
+        ssh2_session = getattr(session, 'session', None)
+        if ssh2_session is not None and hasattr(ssh2_session, 'keepalive_send'):
+            try:
+                ssh2_session.keepalive_send()
+            except Exception:
+                return False
+        return True
+
+    def _evict_idle(self, now):
+        """Close idle sessions older than ``idle_timeout``, called with the lock held"""
+        for key, idle in list(self._idle.items()):
+            while idle and now - idle[0][2] > self.idle_timeout:
+                client, _, _ = idle.popleft()
+                self._close(client)
+                self.counters['evictions'] += 1
+                logger.debug('Evicted idle ssh session to %s', key[0])
+            if not idle:
+                del self._idle[key]
+
+    def _total(self, key):
+        return self._in_use[key] + len(self._idle.get(key, ()))
+
+    def acquire(self, hostname, username, password=None, port=22):
+        """Hand out a connected client for ``(hostname, username, port)``
+
+        An idle live session is reused when available, otherwise a new one is connected as long
+        as ``max_per_host`` allows it. When the cap is reached, wait for another caller to
+        release a session.
+
+        :raises TimeoutError: if no session was released within ``acquire_timeout`` seconds.
+        """
+        key = self._key(hostname, username, port)
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._cond:
+            if self._pid != os.getpid():
+                self._reset()
+            while True:
+                self._evict_idle(time.monotonic())
+                idle = self._idle.get(key)
+                while idle:
+                    client, client_password, _ = idle.pop()
+                    if client_password == password and self.is_alive(client):
+                        self._in_use[key] += 1
+                        self._owned[id(client)] = key
+                        self.counters['hits'] += 1
+                        return client
+                    self._close(client)
+                    self.counters['evictions'] += 1
+                if not self.max_per_host or self._total(key) < self.max_per_host:
+                    self._in_use[key] += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f'No ssh session to {hostname} released within {self.acquire_timeout}s'
+                    )
+                self._cond.wait(timeout=remaining)
+        # connect outside of the lock, the handshake is what we want to parallelize
+        start = time.monotonic()
+        try:
+            client = self._new_client(hostname, username, password, port)
+            client.connect()
+        except Exception:
+            with self._cond:
+                self._in_use[key] -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.counters['misses'] += 1
+            self.counters['connect_time'] += time.monotonic() - start
+            self._owned[id(client)] = key
+        return client
+
+    def release(self, client, discard=False):
+        """Give a client back to the pool
+
+        Clients not handed out by this pool are ignored.
+
+        :param discard: close the session instead of keeping it, e.g. after a failed command.
+        """
+        with self._cond:
+            key = self._owned.pop(id(client), None)
+            if key is None:
+                return
+            self._in_use[key] -= 1
+            if discard or not self.max_per_host:
+                self._close(client)
+            else:
+                self._idle[key].append((client, client.password, time.monotonic()))
+            self._cond.notify()
+
+    @contextlib.contextmanager
+    def connection(self, hostname, username, password=None, port=22):
+        """Context manager acquiring a client and releasing it, discarding it on error"""
+        client = self.acquire(hostname, username, password=password, port=port)
+        try:
+            yield client
+        except Exception:
+            self.release(client, discard=True)
+            raise
+        self.release(client)
+
+    def close_all(self):
+        """Close every idle session, sessions currently in use are left untouched"""
+        with self._cond:
+            for idle in self._idle.values():
+                for client, _, _ in idle:
+                    self._close(client)
+            self._idle.clear()
+
+    def stats(self):
+        """Return the pool counters along with an estimate of the connection time saved"""
+        with self._cond:
+            stats = dict(self.counters)
+            stats['idle'] = sum(len(idle) for idle in self._idle.values())
+            stats['in_use'] = sum(self._in_use.values())
+        stats['connect_time_saved'] = (
+            stats['hits'] * stats['connect_time'] / stats['misses'] if stats['misses'] else 0.0
+        )
+        return stats
+
+
+def _pool_from_settings():
+    from robottelo.config import settings
+
+    ssh_client = settings.server.ssh_client
+    return SSHConnectionPool(
+        max_per_host=ssh_client.get('pool_size', 4),
+        idle_timeout=ssh_client.get('pool_idle_timeout', 300),
+        acquire_timeout=ssh_client.get('connection_timeout') or 300,
+    )
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide :class:`SSHConnectionPool`, created from settings on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = _pool_from_settings()
+    return _pool
 
 
 def get_client(
@@ -8,21 +222,34 @@ def get_client(
     username=None,
     password=None,
     port=22,
+    pooled=False,
 ):
     """Returns a host object that provides an ssh connection
 
     Processes ssh credentials in the order: password, key_filename, ssh_key
     Config validation enforces one of the three must be set in settings.server
+
+    :param bool pooled: take the client from the shared connection pool. Pooled clients
+        must be handed back with :func:`release_client`.
     """
     from robottelo.config import settings
     from robottelo.hosts import ContentHost
 
-    return ContentHost(
+    kwargs = dict(
         hostname=hostname or settings.server.hostname,
         username=username or settings.server.ssh_username,
         password=password or settings.server.ssh_password,
         port=port or settings.server.ssh_client.port,
     )
+    if pooled:
+        return get_pool().acquire(**kwargs)
+    return ContentHost(**kwargs)
+
+
+def release_client(client, discard=False):
+    """Hand a client obtained with ``get_client(pooled=True)`` back to the pool"""
+    if _pool is not None:
+        _pool.release(client, discard=discard)
 
 
 def command(
@@ -48,8 +275,14 @@ def command(
         username=username,
         password=password,
         port=port,
+        pooled=True,
     )
-    result = client.execute(cmd, timeout=timeout)
+    try:
+        result = client.execute(cmd, timeout=timeout)
+    except Exception:
+        release_client(client, discard=True)
+        raise
+    release_client(client)
 
     if output_format and result.status == 0:
         if output_format == 'csv':
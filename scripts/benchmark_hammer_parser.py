@@ -0,0 +1,93 @@
+"""Micro-benchmark of the hammer output parsers.
+
+Sample hammer outputs from ``tests/robottelo/data/hammer`` are scaled up to the size of a
+``per-page=10000`` listing, then parsed with the current parsers of ``robottelo.cli.hammer``
+and with the previous implementation, which sniffed the whole output and normalized JSON in a
+second pass.
+
+Usage::
+
+    python scripts/benchmark_hammer_parser.py --rows 10000 --repeat 5
+"""
+
+import argparse
+import csv
+import json
+from pathlib import Path
+import timeit
+
+from robottelo.cli import hammer
+
+DATA_DIR = Path(__file__).resolve().parent.parent.joinpath('tests/robottelo/data/hammer')
+
+
+def legacy_parse_csv(output):
+    is_rex = 'Job invocation' in output
+    is_pkg_list = 'Nvra' in output
+    if not hammer.is_csv(output) and not is_rex and not is_pkg_list:
+        return output
+    output = output.splitlines()[0:2] if is_rex else output.splitlines()
+    reader = csv.reader(output)
+    keys = [header.replace(' ', '-').lower() for header in next(reader)]
+    return [dict(zip(keys, values, strict=True)) for values in reader if len(values) > 0]
+
+
+def legacy_normalize_obj(obj):
+    if isinstance(obj, dict):
+        return {k.replace(' ', '-').lower(): legacy_normalize_obj(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [legacy_normalize_obj(v) for v in obj]
+    if isinstance(obj, int) and not isinstance(obj, bool):
+        return str(obj)
+    return obj
+
+
+def legacy_parse_json(stdout):
+    return legacy_normalize_obj(json.loads(stdout))
+
+
+def scale_csv(sample, rows):
+    """Repeat the sample rows until the output has ``rows`` rows"""
+    header, *body = sample.splitlines()
+    return '\n'.join([header] + [body[i % len(body)] for i in range(rows)])
+
+
+def scale_json(sample, rows):
+    """Build a JSON list of ``rows`` copies of the sample object"""
+    return json.dumps([json.loads(sample)] * rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10000, help='rows per parsed output')
+    parser.add_argument('--repeat', type=int, default=5, help='parses per measurement')
+    args = parser.parse_args()
+
+    cases = []
+    for sample in sorted(DATA_DIR.glob('*.csv')):
+        output = scale_csv(sample.read_text(), args.rows)
+        cases.append((sample.name, output, legacy_parse_csv, hammer.parse_csv))
+    for sample in sorted(DATA_DIR.glob('*.json')):
+        output = scale_json(sample.read_text(), args.rows)
+        cases.append((sample.name, output, legacy_parse_json, hammer.parse_json))
+
+    for name, output, legacy, current in cases:
+        assert legacy(output) == current(output), f'{name}: parsers disagree'
+        before = min(
+            timeit.repeat(
+                lambda legacy=legacy, output=output: legacy(output), number=1, repeat=args.repeat
+            )
+        )
+        after = min(
+            timeit.repeat(
+                lambda current=current, output=output: current(output), number=1, repeat=args.repeat
+            )
+        )
+        print(
+            f'{name:<24} {len(output) / 2**20:6.2f} MiB  legacy {before * 1000:8.1f} ms  '
+            f'current {after * 1000:8.1f} ms  x{before / after:.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark the construction of Satellite ``cli`` and ``api`` namespaces.
+
+Measures the time and memory needed per Satellite object to build its namespaces, either
+lazily, only touching the classes a typical test uses, or eagerly, touching every registered
+class the way the namespaces used to be built. No connection to the hosts is made.
+
+Usage::
+
+    python scripts/benchmark_host_namespaces.py --hosts 50
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from robottelo.host_helpers.namespaces import api_registry, cli_registry
+from robottelo.hosts import Satellite
+
+TYPICAL_CLI = ('Org', 'Product', 'Repository', 'ContentView', 'Host')
+TYPICAL_API = ('Organization', 'Product', 'Repository', 'ContentView', 'Host')
+
+
+def build(hosts, eager):
+    """Create ``hosts`` Satellite objects and populate their namespaces"""
+    sats = []
+    for index in range(hosts):
+        sat = Satellite(hostname=f'bench-{index}.example.com')
+        cli_names = cli_registry() if eager else TYPICAL_CLI
+        api_names = api_registry() if eager else TYPICAL_API
+        for name in cli_names:
+            getattr(sat.cli, name)
+        for name in api_names:
+            getattr(sat.api, name)
+        sats.append(sat)
+    return sats
+
+
+def measure(hosts, eager):
+    tracemalloc.start()
+    start = time.perf_counter()
+    sats = build(hosts, eager)
+    elapsed = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sats
+    return elapsed, memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--hosts', type=int, default=50, help='number of Satellite objects')
+    args = parser.parse_args()
+
+    # import the modules once, as the first Satellite of a session would
+    start = time.perf_counter()
+    cli_registry(), api_registry()
+    print(f'registries: {(time.perf_counter() - start) * 1000:.1f} ms (once per process)')
+    for label, eager in (('lazy', False), ('eager', True)):
+        elapsed, memory = measure(args.hosts, eager)
+        print(
+            f'{label:>5}: {elapsed / args.hosts * 1000:.2f} ms/host, '
+            f'{memory / args.hosts / 1024:.1f} KiB/host'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""Benchmark the cloning of manifests.
+
+A manifest template like the fake manifests, with ``--entitlements`` entitlement and
+certificate files, is cloned with the previous implementation, which recompressed the whole
+``consumer_export.zip`` for each clone, with ``ManifestCloner.manifest_clone`` and with a
+``ManifestPool``, whose clones are built ahead in background processes. No connection to the
+manifest server is made, the template and the signing key are generated.
+
+Usage::
+
+    python scripts/benchmark_manifest_clone.py --clones 50 --pool-size 4
+"""
+
+import argparse
+import io
+import json
+import os
+import time
+import uuid
+import zipfile
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from robottelo.utils.manifest import ManifestCloner, ManifestPool
+
+
+def legacy_clone(cloner, name='default'):
+    template_zip = zipfile.ZipFile(io.BytesIO(cloner.template[name]))
+    consumer_export_zip = zipfile.ZipFile(io.BytesIO(template_zip.read('consumer_export.zip')))
+    consumer_export = io.BytesIO()
+    with zipfile.ZipFile(consumer_export, 'w') as new_consumer_export_zip:
+        for member in consumer_export_zip.namelist():
+            if member == 'export/consumer.json':
+                consumer_data = json.loads(consumer_export_zip.read(member).decode('utf-8'))
+                consumer_data['uuid'] = str(uuid.uuid1())
+                new_consumer_export_zip.writestr(member, json.dumps(consumer_data))
+            else:
+                new_consumer_export_zip.writestr(member, consumer_export_zip.read(member))
+    manifest = io.BytesIO()
+    with zipfile.ZipFile(manifest, 'w', zipfile.ZIP_DEFLATED) as manifest_zip:
+        manifest_zip.writestr('consumer_export.zip', consumer_export.getvalue())
+        signature = cloner.private_key.sign(
+            consumer_export.getvalue(), padding.PKCS1v15(), hashes.SHA256()
+        )
+        manifest_zip.writestr('signature', signature)
+    manifest.seek(0)
+    return manifest
+
+
+def make_cloner(entitlements, key_size):
+    """Return a ``ManifestCloner`` of a generated template and signing key"""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    signing_key = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption(),
+    )
+    consumer_export = io.BytesIO()
+    with zipfile.ZipFile(consumer_export, 'w') as consumer_export_zip:
+        consumer = {'uuid': str(uuid.uuid4()), 'contentAccessMode': 'entitlement', 'owner': {}}
+        consumer_export_zip.writestr('export/consumer.json', json.dumps(consumer))
+        for index in range(entitlements):
+            # certificates are base64, which compresses like random text
+            certificate = os.urandom(3072).hex()
+            pool = {'id': index, 'productName': 'Red Hat Satellite', 'quantity': 100}
+            consumer_export_zip.writestr(
+                f'export/entitlements/{index}.json', json.dumps({'pool': pool} | consumer)
+            )
+            consumer_export_zip.writestr(
+                f'export/entitlement_certificates/{index}.pem', certificate
+            )
+    template = io.BytesIO()
+    with zipfile.ZipFile(template, 'w', zipfile.ZIP_DEFLATED) as template_zip:
+        template_zip.writestr('consumer_export.zip', consumer_export.getvalue())
+        template_zip.writestr('signature', b'')
+    return ManifestCloner(
+        template={'default': template.getvalue()},
+        private_key=private_key,
+        signing_key=signing_key,
+    )
+
+
+def measure(clone, clones):
+    start = time.perf_counter()
+    size = sum(len(clone().getvalue()) for _ in range(clones))
+    return clones / (time.perf_counter() - start), size / clones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clones', type=int, default=50, help='clones per measurement')
+    parser.add_argument(
+        '--entitlements', type=int, default=100, help='entitlements of the template'
+    )
+    parser.add_argument('--key-size', type=int, default=4096, help='bits of the signing key')
+    parser.add_argument('--pool-size', type=int, default=4, help='clones kept ready by the pool')
+    parser.add_argument(
+        '--interval', type=float, default=0.2, help='seconds between two requests to the pool'
+    )
+    args = parser.parse_args()
+
+    cloner = make_cloner(args.entitlements, args.key_size)
+    for label, clone in (
+        ('legacy', lambda: legacy_clone(cloner)),
+        ('current', cloner.manifest_clone),
+    ):
+        rate, size = measure(clone, args.clones)
+        print(f'{label:>7}: {rate:7.1f} clones/s, {size / 1024:.0f} KiB per clone')
+
+    # the tests using a manifest also spend time on the Satellite between two of them
+    pool = ManifestPool(cloner, args.pool_size)
+    pool.get()
+    waits = []
+    for _ in range(args.clones):
+        time.sleep(args.interval)
+        start = time.perf_counter()
+        pool.get()
+        waits.append(time.perf_counter() - start)
+    pool.close()
+    print(
+        f'   pool: {len(waits) / sum(waits):7.1f} clones/s handed out, '
+        f'{max(waits) * 1000:.1f} ms waited at most, {pool.misses} built on demand'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -846,12 +846,13 @@ class TestCapsuleContentManagement:
         )
 
         # Check kickstart specific files
-        for file in KICKSTART_CONTENT:
-            sat_file = target_sat.checksum_by_url(f'{target_sat.url}/{url_base}/{file}')
-            caps_file = target_sat.checksum_by_url(
-                f'{module_capsule_configured.url}/{url_base}/{file}'
-            )
-            assert sat_file == caps_file
+        sat_sums = target_sat.checksums_by_url(
+            [f'{target_sat.url}/{url_base}/{file}' for file in KICKSTART_CONTENT]
+        )
+        caps_sums = target_sat.checksums_by_url(
+            [f'{module_capsule_configured.url}/{url_base}/{file}' for file in KICKSTART_CONTENT]
+        )
+        assert sat_sums == caps_sums
 
         # Check packages
         sat_pkg_url = f'{target_sat.url}/{url_base}/Packages/'
@@ -1162,10 +1163,9 @@ class TestCapsuleContentManagement:
         assert FAKE_FILE_NEW_NAME in caps_files
         assert sat_files == caps_files
 
-        for file in sat_files:
-            sat_file = target_sat.checksum_by_url(f'{sat_repo_url}{file}')
-            caps_file = target_sat.checksum_by_url(f'{caps_repo_url}{file}')
-            assert sat_file == caps_file
+        sat_sums = target_sat.checksums_by_url([f'{sat_repo_url}{file}' for file in sat_files])
+        caps_sums = target_sat.checksums_by_url([f'{caps_repo_url}{file}' for file in sat_files])
+        assert sat_sums == caps_sums
 
     @pytest.mark.tier4
     @pytest.mark.skip_if_not_set('capsule')
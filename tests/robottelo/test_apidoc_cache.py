@@ -0,0 +1,75 @@
+"""Tests for module ``robottelo.utils.apidoc_cache``."""
+
+from unittest import mock
+
+import pytest
+
+from robottelo.utils import apidoc_cache
+
+
+@pytest.fixture
+def satellite():
+    sat = mock.Mock(hostname='sat.example.com', url='https://sat.example.com')
+    sat.execute.return_value = mock.Mock(status=0, stdout='0123abcd\n', stderr='')
+    return sat
+
+
+@pytest.fixture
+def server():
+    """Fake the Satellite HTTP endpoints, counting the apidoc downloads"""
+    state = {'version': '6.16.0', 'checksum': 'abc', 'downloads': 0}
+
+    def get(satellite, path):
+        response = mock.Mock()
+        if path == '/api/status':
+            response.json.return_value = {'version': state['version']}
+        elif path == '/apidoc/apipie_checksum':
+            response.json.return_value = {'checksum': state['checksum']}
+        else:
+            state['downloads'] += 1
+            response.content = b'{"docs": {}}'
+        return response
+
+    with mock.patch.object(apidoc_cache, '_get', get):
+        yield state
+
+
+def test_apidoc_fetched_once(tmp_path, satellite, server):
+    cache_dir, key = apidoc_cache.cache_apidoc(satellite, cache_dir=tmp_path)
+    assert cache_dir.joinpath(f'{key}.json').read_bytes() == b'{"docs": {}}'
+    assert apidoc_cache.cache_apidoc(satellite, cache_dir=tmp_path) == (cache_dir, key)
+    assert server['downloads'] == 1
+
+
+@pytest.mark.parametrize('changed', ['version', 'checksum'])
+def test_apidoc_invalidated(tmp_path, satellite, server, changed):
+    _, key = apidoc_cache.cache_apidoc(satellite, cache_dir=tmp_path)
+    server[changed] = 'new'
+    _, new_key = apidoc_cache.cache_apidoc(satellite, cache_dir=tmp_path)
+    assert new_key != key
+    assert server['downloads'] == 2
+
+
+def test_hammer_warmed_once(tmp_path, satellite, server):
+    assert apidoc_cache.warm_hammer_cache(satellite, cache_dir=tmp_path)
+    assert not apidoc_cache.warm_hammer_cache(satellite, cache_dir=tmp_path)
+    hammer_commands = [
+        call for call in satellite.execute.call_args_list if 'hammer' in call.args[0]
+    ]
+    assert len(hammer_commands) == 1
+    server['checksum'] = 'new'
+    assert apidoc_cache.warm_hammer_cache(satellite, cache_dir=tmp_path)
+
+
+def test_hammer_warmed_after_reprovisioning(tmp_path, satellite, server):
+    assert apidoc_cache.warm_hammer_cache(satellite, cache_dir=tmp_path)
+    # the same hostname, installed again
+    satellite.execute.return_value = mock.Mock(status=0, stdout='4567efgh\n', stderr='')
+    assert apidoc_cache.warm_hammer_cache(satellite, cache_dir=tmp_path)
+
+
+def test_hammer_warm_up_failure_not_recorded(tmp_path, satellite, server):
+    satellite.execute.return_value = mock.Mock(status=1, stdout='', stderr='error')
+    assert not apidoc_cache.warm_hammer_cache(satellite, cache_dir=tmp_path)
+    satellite.execute.return_value = mock.Mock(status=0, stdout='0123abcd\n', stderr='')
+    assert apidoc_cache.warm_hammer_cache(satellite, cache_dir=tmp_path)
@@ -1,10 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 import unittest
 from unittest import mock
 
 import pytest
 
-from robottelo.cli.base import Base
+from robottelo.cli.base import Base, info_calls_saved
 from robottelo.exceptions import (
     CLIBaseError,
     CLIDataBaseError,
@@ -204,6 +205,61 @@ class BaseCliTestCase(unittest.TestCase):
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
         info.assert_called_once_with({'id': 'foo', 'organization-id': 'org-id'})
 
+    @mock.patch('robottelo.cli.base.Base.info')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_add_create_without_fetch_after_create(self, construct, execute, info):
+        """Check command create returns the create output when the class
+        doesn't re-read created records, and reads the record once another
+        field is needed
+        """
+        execute.return_value = [{'message': 'Created', 'id': 'foo', 'name': 'bar'}]
+        info.return_value = {'id': 'foo', 'name': 'bar', 'label': 'bar'}
+        Base.command_requires_org = False
+        NoFetch = type('NoFetch', (Base,), {'fetch_after_create': False, 'command_base': 'nofetch'})
+        record = NoFetch.create()
+        assert isinstance(record, dict)
+        assert record['id'] == 'foo'
+        assert record.name == 'bar'
+        assert NoFetch.command_sub == 'create'
+        assert not info.called
+        assert info_calls_saved['nofetch'] == 1
+        assert record['label'] == 'bar'
+        assert record.get('organization-id') is None
+        assert record == info.return_value
+        info.assert_called_once_with({'id': 'foo'})
+        # the info command was not saved after all
+        assert info_calls_saved['nofetch'] == 0
+
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_add_create_without_fetch_after_create_concurrent(self, construct, execute):
+        """Check the saved info commands are counted by concurrent creations"""
+        execute.return_value = [{'id': 'foo', 'name': 'bar'}]
+        Base.command_requires_org = False
+        NoFetch = type(
+            'NoFetch', (Base,), {'fetch_after_create': False, 'command_base': 'nofetch_many'}
+        )
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda _: NoFetch.create(), range(400)))
+        assert info_calls_saved['nofetch_many'] == 400
+
+    @mock.patch('robottelo.cli.base.Base.info')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_add_create_needs_info(self, construct, execute, info):
+        """Check command create re-reads records of classes which need it, even
+        when asked not to
+        """
+        execute.return_value = [{'id': 'foo', 'name': 'bar'}]
+        info.return_value = {'id': 'foo', 'name': 'bar', 'label': 'bar'}
+        Base.command_requires_org = False
+        NeedsInfo = type(
+            'NeedsInfo', (Base,), {'fetch_after_create': False, 'create_needs_info': True}
+        )
+        assert info.return_value == NeedsInfo.create()
+        info.assert_called_once_with({'id': 'foo'})
+
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
     def test_add_create_with_result_dct_id_required_org_error(self, construct, execute):
@@ -285,6 +341,31 @@ class BaseCliTestCase(unittest.TestCase):
         handle_resp.assert_called_once_with(command.return_value, ignore_stderr=None)
         assert response is handle_resp.return_value
 
+    @mock.patch('robottelo.cli.base.Base._handle_response')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.hammer_shell.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_with_hammer_shell(self, settings, shell_command, command, handle_resp):
+        """Check execute streams the command to a persistent hammer worker"""
+        settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'password'
+        shell_cls = type('ShellBase', (Base,), {'use_hammer_shell': True})
+        response = shell_cls.execute('some_cmd', hostname='sat.example.com', output_format='csv')
+        shell_command.assert_called_once_with(
+            '-v -u admin -p password --output=csv some_cmd',
+            hostname='sat.example.com',
+            user='admin',
+            password='password',
+            env={'LANG': 'en_US'},
+            output_format='csv',
+            timeout=None,
+        )
+        assert not command.called
+        handle_resp.assert_called_once_with(shell_command.return_value, ignore_stderr=None)
+        assert response is handle_resp.return_value
+
     @mock.patch('robottelo.cli.base.Base.list')
     def test_exists_without_option_and_empty_return(self, lst_method):
         """Check exists method without options and empty return"""
@@ -387,6 +468,37 @@ class BaseCliTestCase(unittest.TestCase):
             options={'organization-id': 1},
         )
 
+    @mock.patch('robottelo.cli.base.Base.execute')
+    def test_iter_list_fetches_pages(self, execute):
+        """Check iter_list fetches pages until a short page is returned"""
+        execute.side_effect = [[{'id': '1'}, {'id': '2'}], [{'id': '3'}]]
+        records = list(Base.iter_list(options={'organization-id': 1, 'per-page': 5}, page_size=2))
+        assert records == [{'id': '1'}, {'id': '2'}, {'id': '3'}]
+        commands = [call.args[0].split() for call in execute.call_args_list]
+        assert '--page="1"' in commands[0]
+        assert '--page="2"' in commands[1]
+        assert all('--per-page="2"' in command for command in commands)
+        assert all('--organization-id="1"' in command for command in commands)
+
+    @mock.patch('robottelo.cli.base.Base.execute')
+    def test_iter_list_stops_early(self, execute):
+        """Check iter_list does not fetch pages the consumer does not need"""
+        execute.return_value = [{'id': '1'}, {'id': '2'}]
+        records = Base.iter_list(page_size=2)
+        assert next(records) == {'id': '1'}
+        records.close()
+        assert execute.call_count == 1
+
+    @mock.patch('robottelo.cli.base.Base.execute')
+    def test_iter_list_with_prefetch(self, execute):
+        """Check iter_list yields records in page order when prefetching"""
+        pages = {1: [{'id': '1'}, {'id': '2'}], 2: [{'id': '3'}, {'id': '4'}], 3: []}
+        execute.side_effect = lambda command, **_: pages.get(
+            int(command.split('--page="')[1].split('"')[0]), []
+        )
+        records = list(Base.iter_list(page_size=2, prefetch=2))
+        assert records == [{'id': '1'}, {'id': '2'}, {'id': '3'}, {'id': '4'}]
+
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
     def test_puppet_classes(self, construct, execute):
@@ -0,0 +1,39 @@
+"""Tests for module ``robottelo.utils.concurrency``."""
+
+import threading
+
+import pytest
+
+from robottelo.exceptions import BulkOperationError
+from robottelo.utils.concurrency import run_concurrently
+
+
+def test_results_in_request_order():
+    started = threading.Barrier(3)
+
+    def call(value):
+        # all the calls run at the same time, and finish in reverse order
+        started.wait(timeout=5)
+        threading.Event().wait(0.01 * (3 - value))
+        return value
+
+    calls = [lambda value=value: call(value) for value in range(3)]
+    assert run_concurrently(calls, max_workers=3) == ([0, 1, 2], {})
+
+
+def test_errors_reported_per_item():
+    def fail():
+        raise ValueError('boom')
+
+    calls = [lambda: 'ok', fail, lambda: 'ok']
+    with pytest.raises(BulkOperationError) as context:
+        run_concurrently(calls, max_workers=2)
+    assert context.value.results == ['ok', None, 'ok']
+    assert list(context.value.errors) == [1]
+    results, errors = run_concurrently(calls, max_workers=2, raise_on_error=False)
+    assert results == ['ok', None, 'ok']
+    assert isinstance(errors[1], ValueError)
+
+
+def test_no_calls():
+    assert run_concurrently([]) == ([], {})
@@ -0,0 +1,76 @@
+"""Tests for module ``robottelo.content_info``."""
+
+import functools
+import gzip
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from unittest import mock
+
+import pytest
+
+from robottelo import content_info
+
+PACKAGES = ['Packages/a/abc-1.0-1.noarch.rpm', 'Packages/b/bcd-2.0-1.noarch.rpm']
+PRIMARY = '''<?xml version="1.0" encoding="UTF-8"?>
+<metadata xmlns="http://linux.duke.edu/metadata/common" packages="2">
+{}
+</metadata>
+'''
+PACKAGE = '<package type="rpm"><name>{0}</name><location href="{1}"/></package>'
+REPOMD = '''<?xml version="1.0" encoding="UTF-8"?>
+<repomd xmlns="http://linux.duke.edu/metadata/repo">
+  <revision>{}</revision>
+  <data type="primary"><location href="repodata/primary.xml.gz"/></data>
+</repomd>
+'''
+
+
+def publish(path, revision='1'):
+    for package in PACKAGES:
+        path.joinpath(package).parent.mkdir(parents=True, exist_ok=True)
+        path.joinpath(package).write_text('')
+    path.joinpath('repodata').mkdir(exist_ok=True)
+    path.joinpath('repodata', 'repomd.xml').write_text(REPOMD.format(revision))
+    packages = ''.join(PACKAGE.format(package.split('/')[-1], package) for package in PACKAGES)
+    path.joinpath('repodata', 'primary.xml.gz').write_bytes(
+        gzip.compress(PRIMARY.format(packages).encode())
+    )
+
+
+@pytest.fixture
+def repo_url(tmp_path):
+    publish(tmp_path)
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(tmp_path))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True
+    )
+    thread.start()
+    content_info._files_cache.clear()
+    with mock.patch.object(SimpleHTTPRequestHandler, 'log_message'):
+        yield f'http://127.0.0.1:{server.server_port}/'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize('from_repodata', [False, True])
+def test_get_repo_files_urls_by_url(repo_url, from_repodata):
+    urls = content_info.get_repo_files_urls_by_url(repo_url, from_repodata=from_repodata)
+    assert urls == [f'{repo_url}{package}' for package in PACKAGES]
+
+
+def test_get_repo_files_by_url_cached_by_revision(repo_url, tmp_path):
+    assert content_info.get_repo_files_by_url(repo_url) == [
+        'abc-1.0-1.noarch.rpm',
+        'bcd-2.0-1.noarch.rpm',
+    ]
+    tmp_path.joinpath('Packages', 'a', 'abd-1.0-1.noarch.rpm').write_text('')
+    # same revision, the files are not listed again
+    assert len(content_info.get_repo_files_by_url(repo_url)) == 2
+    publish(tmp_path, revision='2')
+    assert len(content_info.get_repo_files_by_url(repo_url)) == 3
+
+
+def test_get_repo_files_by_url_not_accessible(repo_url):
+    with pytest.raises(content_info.requests.HTTPError):
+        content_info.get_repo_files_by_url(f'{repo_url}missing/')
@@ -0,0 +1,107 @@
+"""Tests for module ``pytest_fixtures.core.contenthosts``."""
+
+from unittest import mock
+
+import pytest
+
+from pytest_fixtures.core import contenthosts
+from robottelo.hosts import ContentHostError
+
+KEY = ('rhel', '9', 'vm')
+
+
+@pytest.fixture(autouse=True)
+def settings():
+    with (
+        mock.patch.object(contenthosts, 'settings') as settings,
+        mock.patch.dict(contenthosts.contenthost_pools, clear=True),
+        mock.patch.dict(contenthosts.contenthost_reuses, clear=True),
+    ):
+        settings.performance.contenthost_max_reuses = 2
+        settings.performance.contenthost_pool_size = 0
+        yield settings
+
+
+def make_request(marked=True, passed=True, scope='function'):
+    request = mock.Mock(scope=scope)
+    marker = mock.Mock() if marked else None
+    request.node.get_closest_marker.side_effect = lambda name: (
+        marker if name == 'reuse_contenthost' else None
+    )
+    request.node.report_setup.passed = True
+    request.node.report_call.passed = passed
+    return request
+
+
+@pytest.mark.parametrize(
+    ('request_kwargs', 'reusable'),
+    [
+        ({}, True),
+        ({'marked': False}, False),
+        ({'passed': False}, False),
+        ({'scope': 'module'}, False),
+    ],
+)
+def test_reusable(request_kwargs, reusable):
+    assert contenthosts._reusable(make_request(**request_kwargs)) is reusable
+
+
+def test_reusable_disabled(settings):
+    settings.performance.contenthost_max_reuses = 0
+    assert not contenthosts._reusable(make_request())
+
+
+def test_recycle():
+    host, pool = mock.Mock(hostname='host'), mock.Mock()
+    contenthosts.contenthost_reuses['host'] = {'uses': 2, 'state': {'packages': []}}
+    assert contenthosts._recycle(host, pool)
+    host.reset.assert_called_once_with({'packages': []})
+    pool.put.assert_called_once_with(host)
+
+
+def test_recycle_max_reuses():
+    host, pool = mock.Mock(hostname='host'), mock.Mock()
+    contenthosts.contenthost_reuses['host'] = {'uses': 3, 'state': {}}
+    assert not contenthosts._recycle(host, pool)
+    assert not host.reset.called
+    assert not pool.put.called
+
+
+def test_recycle_reset_failed():
+    host, pool = mock.Mock(hostname='host'), mock.Mock()
+    host.reset.side_effect = ContentHostError('packages differ')
+    contenthosts.contenthost_reuses['host'] = {'uses': 1, 'state': {}}
+    assert not contenthosts._recycle(host, pool)
+    assert not pool.put.called
+
+
+def test_recycle_unknown_host():
+    host, pool = mock.Mock(hostname='host'), mock.Mock()
+    assert not contenthosts._recycle(host, pool)
+    assert not host.reset.called
+
+
+@pytest.mark.parametrize('marked', [True, False])
+def test_contenthost(marked):
+    host = mock.Mock(hostname='host')
+    pool = contenthosts.contenthost_pools[KEY] = mock.Mock(get=mock.Mock(return_value=host))
+    request = make_request(marked=marked)
+    with (
+        mock.patch.object(contenthosts, '_fixture_host', return_value=(KEY, {})),
+        mock.patch.object(contenthosts, 'Broker') as broker,
+        contenthosts._contenthost(request) as fixture_host,
+    ):
+        assert fixture_host is host
+    host.teardown.assert_called_once_with()
+    if marked:
+        # the state is saved before the first test and the host is given back to the pool
+        host.reset.assert_called_once_with(host.save_system_state.return_value)
+        pool.put.assert_called_once_with(host)
+        assert not broker.called
+        assert contenthosts.contenthost_reuses['host']['uses'] == 1
+    else:
+        assert not host.save_system_state.called
+        assert not pool.put.called
+        broker.assert_called_once_with(hosts=[host])
+        broker.return_value.checkin.assert_called_once_with()
+        assert 'host' not in contenthosts.contenthost_reuses
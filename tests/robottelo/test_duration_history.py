@@ -0,0 +1,63 @@
+"""Tests for module ``robottelo.utils.duration_history``."""
+
+import pytest
+
+from robottelo.utils.duration_history import (
+    DEFAULT_DURATION,
+    DurationHistory,
+    lpt_makespan,
+    shared_scope,
+    work_unit,
+)
+
+NODEID = 'tests/foreman/api/test_repository.py::TestRepository::test_positive_sync[yum]'
+
+
+@pytest.fixture
+def history(tmp_path):
+    return DurationHistory(tmp_path.joinpath('test_durations.db'))
+
+
+@pytest.mark.parametrize(
+    ('scope', 'unit'),
+    [
+        (None, NODEID),
+        ('class', 'tests/foreman/api/test_repository.py::TestRepository'),
+        ('module', 'tests/foreman/api/test_repository.py'),
+        ('package', 'tests/foreman/api'),
+    ],
+)
+def test_work_unit(scope, unit):
+    assert work_unit(NODEID, scope) == unit
+
+
+def test_shared_scope():
+    assert shared_scope(['function', 'session', 'class', 'module']) == 'module'
+    assert shared_scope(['function', 'session']) is None
+
+
+def test_lpt_makespan():
+    assert lpt_makespan([3, 3, 2, 2, 2], 2) == 7
+    assert lpt_makespan([], 4) == 0
+
+
+def test_predict(history):
+    history.record({'test_a.py::test_1': 10, 'test_a.py::test_2': 30})
+    history.record({'test_a.py::test_1': 20})
+    assert history.predict(['test_a.py::test_1', 'test_a.py::test_3', 'test_b.py::test_1']) == {
+        # the recorded duration moves towards the last one
+        'test_a.py::test_1': 15,
+        # the mean of the tests of the module in its last run
+        'test_a.py::test_3': 20,
+        'test_b.py::test_1': DEFAULT_DURATION,
+    }
+
+
+def test_units(history):
+    history.record({'test_a.py::test_1': 10})
+    history.save_units({'test_a.py::test_1': 'test_a.py', 'test_a.py::test_2': 'test_a.py::test_2'})
+    assert history.units(['test_a.py::test_1', 'test_a.py::test_2', 'test_b.py::test_1']) == {
+        'test_a.py::test_1': 'test_a.py',
+        'test_a.py::test_2': 'test_a.py::test_2',
+    }
+    assert history.predict(['test_a.py::test_1'])['test_a.py::test_1'] == 10
@@ -14,10 +14,13 @@ from robottelo.utils.decorators.func_shared.shared import (
     _NAMESPACE_SCOPE_KEY_TYPE,
     SharedFunctionException,
     _set_configured,
+    clear_memo,
     enable_shared_function,
+    lock_stats,
     set_default_scope,
     shared,
 )
+from robottelo.utils.decorators.func_shared.sqlite_storage import SQLiteStorageHandler
 
 DEFAULT_POOL_SIZE = 8
 SIMPLE_TIMEOUT_VALUE = 3
@@ -135,6 +138,12 @@ def basic_shared_counter(index=0, increment_by=1):
     return index + increment_by
 
 
+@shared
+def simple_shared_counter_fast_path(index=0):
+    """used to count the lock acquisitions"""
+    return {'index': index + 1}
+
+
 @shared(function_kw=['prefix', 'suffix'])
 def basic_shared_counter_string(prefix='', suffix='', counter=0, increment_by=1):
     """basic function that increment a counter and return a string with
@@ -554,3 +563,73 @@ class TestFuncShared:
                 suffix=suffix, prefix=prefix, counter=counter_value
             )
             assert inc_string == inc_string_2
+
+    def test_ready_value_read_without_lock(self):
+        """Once the result is ready, calls read it without taking the lock, from the memo of
+        the process or from storage
+        """
+        counter_value = gen_integer(min_value=2, max_value=10000)
+        results = [simple_shared_counter_fast_path(index=counter_value) for _ in range(3)]
+        clear_memo()
+        results.append(simple_shared_counter_fast_path(index=counter_value))
+        assert all(result == {'index': counter_value + 1} for result in results)
+        stats = next(
+            value
+            for key, value in lock_stats().items()
+            if key.endswith('.simple_shared_counter_fast_path')
+        )
+        assert stats['lock_waits'] == 1
+        assert stats['fast_reads'] == 3
+
+
+def _hold_lock(path, key, acquired, release):
+    with SQLiteStorageHandler(path=path).lock(key):
+        acquired.set()
+        release.wait()
+
+
+class TestSQLiteStorageHandler:
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return str(tmp_path.joinpath('shared.db'))
+
+    def test_get_set(self, db_path):
+        storage = SQLiteStorageHandler(path=db_path)
+        assert storage.get('key') is None
+        storage.set('key', {'state': 'READY', 'result': [1, 2]})
+        assert SQLiteStorageHandler(path=db_path).get('key') == {
+            'state': 'READY',
+            'result': [1, 2],
+        }
+
+    def test_lock(self, db_path):
+        storage = SQLiteStorageHandler(path=db_path, lock_timeout=0.5)
+        acquired, release = multiprocessing.Event(), multiprocessing.Event()
+        process = multiprocessing.Process(
+            target=_hold_lock, args=(db_path, 'key', acquired, release)
+        )
+        process.start()
+        try:
+            assert acquired.wait(10)
+            with pytest.raises(TimeoutError), storage.lock('key'):
+                pass
+            # other keys have their own lock
+            with storage.lock('other_key'):
+                pass
+        finally:
+            release.set()
+            process.join()
+        with storage.lock('key'):
+            pass
+
+    def test_lock_of_dead_process_taken_over(self, db_path):
+        storage = SQLiteStorageHandler(path=db_path, lock_timeout=0.5)
+        process = multiprocessing.Process(target=os.getpid)
+        process.start()
+        process.join()
+        with storage.connect() as connection:
+            connection.execute(
+                'INSERT INTO locks (key, pid) VALUES (?, ?)', ('key.lock', process.pid)
+            )
+        with storage.lock('key'):
+            pass
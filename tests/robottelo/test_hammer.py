@@ -23,6 +23,34 @@ class TestParseCSV:
             {'header': 'unicode', 'header-2': 'chårs'},
         ]
 
+    def test_iter_csv_is_lazy(self):
+        rows = hammer.iter_csv('ID,Name\n1,first\n2,second')
+        assert next(rows) == {'id': '1', 'name': 'first'}
+        assert list(rows) == [{'id': '2', 'name': 'second'}]
+
+    def test_parse_csv_quoted_multiline_value(self):
+        output = 'ID,Description\n1,"multi\nline, value"\n2,single'
+        assert hammer.parse_csv(output) == [
+            {'id': '1', 'description': 'multi\nline, value'},
+            {'id': '2', 'description': 'single'},
+        ]
+
+    def test_parse_csv_job_invocation(self):
+        """Only the first row of a job invocation output is CSV, task progress follows"""
+        output = 'Message,Id\nJob invocation 12 created,12\n[....] [100%]\n1 task(s), 1 success'
+        assert hammer.parse_csv(output) == [{'message': 'Job invocation 12 created', 'id': '12'}]
+
+    def test_parse_csv_single_column(self):
+        assert hammer.parse_csv('Nvra\nbear-4.1-1.noarch') == [{'nvra': 'bear-4.1-1.noarch'}]
+        assert hammer.parse_csv('Message\nOrganization created.') == [
+            {'message': 'Organization created.'}
+        ]
+
+    def test_parse_csv_not_csv(self):
+        output = 'Name\nfoo\nbar'
+        assert hammer.parse_csv(output) == output
+        assert hammer.iter_csv(output) is None
+
 
 class TestParseJSON:
     """Tests for parsing JSON hammer output"""
@@ -109,6 +137,15 @@ class TestParseJSON:
 
         assert hammer.parse_json(json_output) == hammer.parse_csv(csv_ouput_lines)[0]
 
+    def test_parse_json_normalizes_nested_values(self):
+        output = '{"Host Name": "h", "Ports": [80, 443], "Enabled": true, "Load": 1.5}'
+        assert hammer.parse_json(output) == {
+            'host-name': 'h',
+            'ports': ['80', '443'],
+            'enabled': True,
+            'load': 1.5,
+        }
+
 
 class TestParseHelp:
     """Tests for parsing hammer help output"""
@@ -0,0 +1,98 @@
+"""Tests for module ``robottelo.cli.hammer_shell``."""
+
+import json
+import shutil
+import subprocess
+import time
+from unittest import mock
+
+import pytest
+
+from robottelo.cli.hammer_shell import WORKER_SCRIPT, HammerShell, HammerShellError
+
+# a hammer_cli library running the commands of the tests: ``adapter`` prints the output
+# adapter of the context, ``connection`` the id of the API connection
+HAMMER_CLI = '''
+module HammerCLI
+  module Settings
+    def self.load_from_defaults; end
+  end
+
+  module Modules
+    def self.load_all; end
+  end
+
+  def self.context
+    @context ||= {defaults: {}}
+  end
+
+  class MainCommand
+    def self.run(name, args, context)
+      context[:adapter] = args[args.index('--output') + 1].to_sym if args.include?('--output')
+      context[:api_connection] ||= Object.new
+      puts({adapter: context[:adapter], connection: context[:api_connection].object_id}.to_json)
+      0
+    end
+  end
+end
+'''
+
+
+class Timeout(Exception):
+    """The exception of ssh2 when the session timeout expires"""
+
+
+def make_shell(read):
+    shell = HammerShell('sat.example.com')
+    shell._client = mock.Mock()
+    shell._channel = mock.Mock(read=mock.Mock(side_effect=read))
+    return shell
+
+
+def test_read_response_timeout():
+    session_timeout = []
+
+    def read():
+        # libssh2 blocks until the session timeout expires
+        session_timeout.append(shell._client.session.session.set_timeout.call_args.args[0])
+        time.sleep(session_timeout[-1] / 1000)
+        raise Timeout
+
+    shell = make_shell(read)
+    start = time.monotonic()
+    with pytest.raises(HammerShellError, match='timed out'):
+        shell._read_response(timeout=0.2)
+    assert time.monotonic() - start < 1
+    assert 0 < session_timeout[0] <= 201
+    # the session timeout does not apply to the next commands
+    shell._client.session.session.set_timeout.assert_called_with(0)
+
+
+def test_read_response_without_timeout():
+    shell = make_shell([(2, b'{"'), (0, b''), (13, b'ready": true}\n')])
+    shell._channel.eof.return_value = False
+    assert shell._read_response(timeout=None) == {'ready': True}
+    shell._client.session.session.set_timeout.assert_called_with(0)
+
+
+@pytest.mark.skipif(shutil.which('ruby') is None, reason='ruby is not installed')
+def test_worker_resets_context(tmp_path):
+    tmp_path.joinpath('hammer_cli.rb').write_text(HAMMER_CLI)
+    tmp_path.joinpath('worker.rb').write_text(WORKER_SCRIPT)
+    requests = ''.join(
+        json.dumps({'args': args}) + '\n'
+        for args in ('--output json organization list', 'organization list')
+    )
+    output = subprocess.run(
+        ['ruby', '-I', str(tmp_path), str(tmp_path.joinpath('worker.rb'))],
+        input=requests,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+    assert json.loads(output[0]) == {'ready': True}
+    first, second = (json.loads(json.loads(line)['stdout']) for line in output[1:])
+    assert first['adapter'] == 'json'
+    # the options of a command do not apply to the next one, the API connection is kept
+    assert second['adapter'] is None
+    assert second['connection'] == first['connection']
@@ -0,0 +1,79 @@
+"""Tests for module ``robottelo.utils.host_facts``."""
+
+import json
+import time
+from unittest import mock
+
+import pytest
+
+from robottelo.exceptions import HostFactError
+from robottelo.utils import host_facts
+
+
+@pytest.fixture
+def facts_file(tmp_path):
+    path = tmp_path.joinpath('host_facts.json')
+    with (
+        mock.patch.object(host_facts, 'FACTS_FILE', path),
+        mock.patch.object(host_facts, 'settings') as settings,
+    ):
+        settings.performance.host_facts_ttl = 60
+        host_facts.clear()
+        yield path
+        host_facts.clear()
+
+
+def test_get_probes_once(facts_file):
+    probe = mock.Mock(return_value='6.16.0')
+    assert host_facts.get('sat.example.com', 'version', probe) == '6.16.0'
+    assert host_facts.get('sat.example.com', 'version', probe) == '6.16.0'
+    assert probe.call_count == 1
+    assert json.loads(facts_file.read_text())['sat.example.com']['version']['value'] == '6.16.0'
+
+
+def test_get_shared_between_processes(facts_file):
+    """A fact persisted by another worker is not probed again, unless expired"""
+    facts_file.write_text(
+        json.dumps(
+            {
+                'sat.example.com': {
+                    'version': {'value': '6.16.0', 'fetched': time.time()},
+                    'rhel_version': {'value': '8.10', 'fetched': time.time() - 120},
+                }
+            }
+        )
+    )
+    probe = mock.Mock(return_value='9.5')
+    assert host_facts.get('sat.example.com', 'version', probe) == '6.16.0'
+    assert host_facts.get('sat.example.com', 'rhel_version', probe) == '9.5'
+    assert probe.call_count == 1
+
+
+def test_get_failure_cached(facts_file):
+    probe = mock.Mock(side_effect=TimeoutError('unreachable'))
+    for _ in range(2):
+        with pytest.raises(HostFactError, match='unreachable'):
+            host_facts.get('sat.example.com', 'version', probe, errors=(TimeoutError,))
+    assert probe.call_count == 1
+    # another worker does not retry a recent failure either
+    host_facts.clear()
+    with pytest.raises(HostFactError, match='unreachable'):
+        host_facts.get('sat.example.com', 'version', probe, errors=(TimeoutError,))
+    assert probe.call_count == 1
+
+
+def test_get_unexpected_failure(facts_file):
+    probe = mock.Mock(side_effect=[ValueError('bug'), '6.16.0'])
+    with pytest.raises(ValueError, match='bug'):
+        host_facts.get('sat.example.com', 'version', probe, errors=(TimeoutError,))
+    # the failure is not cached
+    assert host_facts.get('sat.example.com', 'version', probe, errors=(TimeoutError,)) == '6.16.0'
+
+
+def test_get_without_ttl(facts_file):
+    host_facts.settings.performance.host_facts_ttl = 0
+    probe = mock.Mock(return_value='6.16.0')
+    assert host_facts.get('sat.example.com', 'version', probe) == '6.16.0'
+    assert host_facts.get('sat.example.com', 'version', probe) == '6.16.0'
+    assert probe.call_count == 1
+    assert not facts_file.exists()
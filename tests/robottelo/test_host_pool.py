@@ -0,0 +1,84 @@
+"""Tests for module ``robottelo.utils.host_pool``."""
+
+from itertools import count
+import threading
+from unittest import mock
+
+from robottelo.utils.host_pool import HostPool
+
+
+def make_checkout():
+    numbers = count()
+    return mock.Mock(side_effect=lambda: mock.Mock(hostname=f'host{next(numbers)}'))
+
+
+def test_checks_out_ahead():
+    checkout = make_checkout()
+    pool = HostPool(checkout, mock.Mock(), demand=3, size=2)
+    hosts = [pool.get().hostname for _ in range(3)]
+    pool.close()
+    assert sorted(hosts) == ['host0', 'host1', 'host2']
+    # never more hosts than expected
+    assert checkout.call_count == 3
+
+
+def test_get_beyond_demand():
+    checkout = make_checkout()
+    pool = HostPool(checkout, mock.Mock(), demand=1, size=2)
+    pool.get()
+    pool.get()
+    pool.close()
+    assert checkout.call_count == 2
+
+
+def test_failed_checkout_is_retried():
+    host = mock.Mock(hostname='host')
+    checkout = mock.Mock(side_effect=[Exception('no capacity'), host])
+    pool = HostPool(checkout, mock.Mock(), demand=1, size=1)
+    assert pool.get() is host
+    pool.close()
+
+
+def test_close_checks_in_unused_hosts():
+    started = threading.Event()
+    release = threading.Event()
+    hosts = iter([mock.Mock(hostname='host0'), mock.Mock(hostname='host1')])
+
+    def checkout():
+        started.set()
+        release.wait(5)
+        return next(hosts)
+
+    checkin = mock.Mock()
+    pool = HostPool(checkout, checkin, demand=4, size=1)
+    started.wait(5)
+    release.set()
+    pool.close()
+    # the checkout in progress is completed and checked in, the next one is not started
+    checkin.assert_called_once()
+    assert checkin.call_args.args[0].hostname == 'host0'
+
+
+def test_stats():
+    checkout = make_checkout()
+    pool = HostPool(checkout, mock.Mock(), demand=1, size=1)
+    pool.get()
+    pool.get()
+    pool.close()
+    assert len(pool.wait_times) == 2
+    assert pool.misses == 1
+    assert pool.stats().startswith('2 hosts requested, 1 checked out on demand')
+
+
+def test_put_serves_next_request():
+    checkout = make_checkout()
+    checkin = mock.Mock()
+    pool = HostPool(checkout, checkin, demand=0, size=0)
+    host = pool.get()
+    pool.put(host)
+    assert pool.get() is host
+    pool.put(host)
+    pool.close()
+    assert checkout.call_count == 1
+    assert pool.reuses == 1
+    checkin.assert_called_once_with(host)
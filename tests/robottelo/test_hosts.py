@@ -0,0 +1,123 @@
+"""Tests for module ``robottelo.hosts``."""
+
+import hashlib
+import shlex
+from unittest import mock
+
+import pytest
+
+from robottelo.hosts import SYSTEM_STATE_BACKUP, ContentHost, ContentHostError
+
+
+class FakeContentHost(ContentHost):
+    """Run the commands of ``system_state``, ``save_system_state`` and ``reset`` on a model of a
+    host made of its packages, enabled services and files
+    """
+
+    def __init__(self, rhel_version):
+        super().__init__(hostname='host.example.com')
+        self.rhel_version = rhel_version
+        self.packages = {'bash': '0:5.1.8-9.el9.x86_64', 'openssh': '0:8.7p1-38.el9.x86_64'}
+        self.services = {'sshd'}
+        self.files = {'/etc/yum.repos.d/base.repo': '[base]', '/root/.ssh/authorized_keys': ''}
+        self.registered = False
+        self.backups = {}
+        self.commands = []
+
+    def execute(self, command):
+        self.commands.append(command)
+        result = mock.Mock(status=0, stdout='', stderr='')
+        args = shlex.split(command)
+        if command.startswith('cat /etc/os-release'):
+            result.stdout = (
+                f'ID="rhel"\nNAME="Red Hat Enterprise Linux"\nVERSION_ID="{self.rhel_version}"\n'
+            )
+        elif command.startswith('rpm -qa --qf'):
+            result.stdout = ''.join(f'{name}-{evra}\n' for name, evra in self.packages.items())
+        elif command.startswith('rpm -qa |grep'):
+            result.status = 1
+        elif command.startswith('find'):
+            result.stdout = ''.join(
+                f'{hashlib.sha256(content.encode()).hexdigest()}  {path}\n'
+                for path, content in self.files.items()
+            )
+        elif command.startswith('systemctl list-unit-files'):
+            result.stdout = ''.join(
+                f'{service}.service enabled disabled\n' for service in self.services
+            )
+        elif command.startswith('chkconfig --list'):
+            result.stdout = ''.join(f'{service}\t0:off\t3:on\n' for service in self.services)
+        elif command.startswith('tar -C / -cpf'):
+            self.backups = dict(self.files)
+        elif command.startswith('tar -C / -xpf'):
+            for path in args[5:]:
+                self.files[f'/{path}'] = self.backups[f'/{path}']
+        elif args[:2] == ['rm', '-f']:
+            for path in args[2:]:
+                self.files.pop(path, None)
+        elif args[1:3] == ['remove', '-y']:
+            for name in args[3:]:
+                self.packages.pop(name)
+        elif args[:3] == ['systemctl', 'disable', '--now']:
+            self.services.difference_update(name.removesuffix('.service') for name in args[3:])
+        elif args[0] == 'chkconfig':
+            for off in command.split('; '):
+                self.services.discard(off.split()[1])
+        elif command == 'subscription-manager identity':
+            result.status = 0 if self.registered else 1
+        return result
+
+
+@pytest.mark.parametrize('rhel_version', ['7.9', '9.4'])
+def test_reset(rhel_version):
+    host = FakeContentHost(rhel_version)
+    state = host.save_system_state()
+    assert state['packages'] == ['bash-0:5.1.8-9.el9.x86_64', 'openssh-0:8.7p1-38.el9.x86_64']
+    # a test adds a package, a repository, a module stream, a service and a REX key
+    host.packages['walrus'] = '0:5.21-1.noarch'
+    host.files['/etc/yum.repos.d/custom.repo'] = '[custom]'
+    host.files['/etc/dnf/modules.d/walrus.module'] = '[walrus]\nstate=enabled'
+    host.files['/etc/yum.repos.d/base.repo'] = '[base]\nenabled=0'
+    host.files['/root/.ssh/authorized_keys'] = 'ssh-rsa AAAA foreman-proxy'
+    host.services.add('walrusd')
+    host.reset(state)
+    assert host.system_state() == state
+    package_manager = 'yum' if rhel_version == '7.9' else 'dnf'
+    assert f'{package_manager} remove -y walrus' in host.commands
+    assert f'{package_manager} clean all' in host.commands
+
+
+def test_reset_chkconfig():
+    host = FakeContentHost('6.10')
+    state = host.save_system_state()
+    host.services.add('walrusd')
+    host.reset(state)
+    assert host.services == {'sshd'}
+    assert 'chkconfig walrusd off' in host.commands
+
+
+def test_reset_updated_package():
+    host = FakeContentHost('9.4')
+    state = host.save_system_state()
+    host.packages['openssh'] = '0:9.0p1-1.el9.x86_64'
+    with pytest.raises(ContentHostError, match='packages differ'):
+        host.reset(state)
+    # the updated package is not removed
+    assert 'openssh' in host.packages
+
+
+def test_reset_still_registered():
+    host = FakeContentHost('9.4')
+    state = host.save_system_state()
+    host.registered = True
+    with pytest.raises(ContentHostError, match='still registered'):
+        host.reset(state)
+
+
+def test_save_system_state_backs_up_reset_paths():
+    host = FakeContentHost('9.4')
+    host.save_system_state()
+    command = next(command for command in host.commands if command.startswith('tar'))
+    assert SYSTEM_STATE_BACKUP in command
+    assert 'etc/yum.repos.d' in command
+    assert 'root/.ssh' in command
@@ -0,0 +1,99 @@
+"""Tests for module ``robottelo.utils.io``."""
+
+import hashlib
+import io
+import json
+import tarfile
+from unittest import mock
+
+import pytest
+
+from robottelo.utils import io as report_io
+
+SLICES = {
+    'slice_1': [{'fqdn': f'host{index}.example.com', 'tags': [index]} for index in range(3)],
+    'slice_2': [{'fqdn': 'host3.example.com', 'tags': []}],
+}
+
+
+def make_report(path, slices=SLICES, corrupt_slice=False):
+    metadata = {
+        'source': 'Satellite',
+        'report_slices': {name: {'number_hosts': len(hosts)} for name, hosts in slices.items()},
+    }
+    files = {'metadata.json': json.dumps(metadata)}
+    for name, hosts in slices.items():
+        files[f'{name}.json'] = json.dumps({'report_slice_id': name, 'hosts': hosts}, indent=1)
+    if corrupt_slice:
+        files['slice_2.json'] = files['slice_2.json'][:-10]
+    with tarfile.open(path, 'w:xz') as tarobj:
+        for name, content in files.items():
+            info = tarfile.TarInfo(f'report/{name}')
+            info.size = len(content.encode())
+            tarobj.addfile(info, io.BytesIO(content.encode()))
+    return path
+
+
+@pytest.fixture
+def report_path(tmp_path):
+    return make_report(tmp_path.joinpath('report.tar.xz'))
+
+
+# slices read in chunks of a few bytes, their values span several chunks
+@pytest.mark.parametrize('chunk_size', [7, 1 << 20])
+def test_get_local_file_data(report_path, chunk_size):
+    with mock.patch.object(report_io, 'CHUNK_SIZE', chunk_size):
+        data = report_io.get_local_file_data(report_path)
+    assert data == {
+        'size': report_path.stat().st_size,
+        'checksum': hashlib.sha256(report_path.read_bytes()).hexdigest(),
+        'extractable': True,
+        'json_files_parsable': True,
+        'metadata_counts': {'slice_1.json': 3, 'slice_2.json': 1},
+        'slices_counts': {'slice_1.json': 3, 'slice_2.json': 1},
+    }
+
+
+def test_get_local_file_data_not_parsable(tmp_path):
+    data = report_io.get_local_file_data(
+        make_report(tmp_path.joinpath('report.tar.xz'), corrupt_slice=True)
+    )
+    assert data['extractable']
+    assert not data['json_files_parsable']
+
+
+def test_get_local_file_data_not_extractable(tmp_path):
+    path = tmp_path.joinpath('report.tar.xz')
+    path.write_bytes(b'not a tar file')
+    data = report_io.get_local_file_data(path)
+    assert not data['extractable']
+    assert data['checksum'] == hashlib.sha256(b'not a tar file').hexdigest()
+
+
+def test_get_report_data(report_path):
+    data = report_io.get_report_data(report_path)
+    assert data['report_slice_id'] == 'slice_2'
+    assert data['hosts'] == SLICES['slice_2']
+    assert report_io.get_report_metadata(report_path)['source'] == 'Satellite'
+
+
+def test_get_report_data_corrupt(tmp_path):
+    report_path = make_report(tmp_path.joinpath('report.tar.xz'), corrupt_slice=True)
+    with pytest.raises(json.JSONDecodeError):
+        report_io.get_report_data(report_path)
+    # the metadata is still readable
+    assert report_io.get_report_metadata(report_path)['source'] == 'Satellite'
+
+
+@pytest.mark.parametrize('function', ['get_report_data', 'get_report_metadata'])
+def test_get_report_data_not_extractable(tmp_path, function):
+    path = tmp_path.joinpath('report.tar.xz')
+    path.write_bytes(b'not a tar file')
+    with pytest.raises(tarfile.TarError):
+        getattr(report_io, function)(path)
+
+
+def test_inspect_report(report_path):
+    report = report_io.inspect_report(report_path, keep_hosts=False)
+    assert report['slices']['slice_1.json'] == {'report_slice_id': 'slice_1'}
+    assert report['slices_counts']['slice_1.json'] == 3
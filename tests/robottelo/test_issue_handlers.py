@@ -8,7 +8,7 @@ import pytest
 
 from pytest_plugins.issue_handlers import DEFAULT_BZ_CACHE_FILE
 from robottelo.constants import CLOSED_STATUSES, OPEN_STATUSES, WONTFIX_RESOLUTIONS
-from robottelo.utils.issue_handlers import add_workaround, is_open, should_deselect
+from robottelo.utils.issue_handlers import add_workaround, is_open, jira, should_deselect
 
 
 class TestBugzillaIssueHandler:
@@ -399,6 +399,56 @@ class TestBugzillaIssueHandler:
         assert os.path.exists(DEFAULT_BZ_CACHE_FILE)
 
 
+class TestJiraCache:
+    @pytest.fixture(autouse=True)
+    def jira_api(self, mocker, tmp_path):
+        """Fake the Jira search API and use an empty cache file"""
+        mocker.patch.object(jira, 'JIRA_CACHE_FILE', tmp_path.joinpath('jira_cache.json'))
+        mocker.patch.object(jira, 'CACHED_RESPONSES', defaultdict(dict))
+        mocker.patch.object(jira, 'JIRA_CHUNK_SIZE', 2)
+        settings = mocker.patch.object(jira, 'settings')
+        settings.jira.cache_ttl = 3600
+
+        def search(jql):
+            keys = jql.split('(')[1].split(')')[0].split(', ')
+            if 'updated' in jql:
+                keys = [key for key in keys if key in self.updated]
+            return [{'key': key, 'status': 'New'} for key in keys]
+
+        self.updated = set()
+        return mocker.patch.object(jira, '_search_jira', side_effect=search)
+
+    def test_fetched_in_chunks(self, jira_api):
+        data = jira.get_data_jira(['SAT-1', 'SAT-2', 'SAT-3'])
+        assert [issue['key'] for issue in data] == ['SAT-1', 'SAT-2', 'SAT-3']
+        assert jira_api.call_count == 2
+
+    def test_cached_on_disk(self, jira_api):
+        jira.get_data_jira(['SAT-1', 'SAT-2'])
+        jira.CACHED_RESPONSES.clear()
+        assert [issue['key'] for issue in jira.get_data_jira(['SAT-2', 'SAT-1'])] == [
+            'SAT-1',
+            'SAT-2',
+        ]
+        assert jira_api.call_count == 1
+
+    def test_stale_refreshed_if_updated(self, jira_api, mocker):
+        jira.get_data_jira(['SAT-1', 'SAT-2'])
+        jira.CACHED_RESPONSES.clear()
+        mocker.patch.object(jira.time, 'time', return_value=jira.time.time() + 7200)
+        self.updated = {'SAT-2'}
+        jira.get_data_jira(['SAT-1', 'SAT-2'])
+        jql = jira_api.call_args.args[0]
+        assert 'updated >= -125m' in jql
+        cache = jira._load_jira_cache()
+        assert cache['SAT-1']['fetched'] == cache['SAT-2']['fetched']
+
+    def test_prefetch(self, jira_api):
+        jira.prefetch_jira(['SAT-1', 'SAT-2', 'BZ:123'])
+        assert jira.get_single_jira('SAT-1')['key'] == 'SAT-1'
+        assert jira_api.call_count == 1
+
+
 def test_add_workaround():
     """Assert helper function adds current items to given data"""
     data = defaultdict(lambda: {"data": {}, "used_in": []})
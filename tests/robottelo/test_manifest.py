@@ -0,0 +1,94 @@
+"""Tests for module ``robottelo.utils.manifest``."""
+
+from concurrent.futures import wait
+import io
+import json
+import zipfile
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+import pytest
+
+from robottelo.utils.manifest import ManifestCloner, ManifestPool
+
+CONSUMER = {'uuid': 'template', 'contentAccessMode': 'entitlement', 'owner': {'key': 'owner'}}
+MEMBERS = {
+    'export/meta.json': '{"version": "4.3.1"}',
+    'export/entitlements/1.json': '{"id": "1", "pool": {"productName": "Satellite"}}',
+}
+
+
+def make_template():
+    consumer_export = io.BytesIO()
+    with zipfile.ZipFile(consumer_export, 'w') as consumer_export_zip:
+        consumer_export_zip.writestr('export/consumer.json', json.dumps(CONSUMER))
+        for name, content in MEMBERS.items():
+            consumer_export_zip.writestr(name, content)
+    template = io.BytesIO()
+    with zipfile.ZipFile(template, 'w', zipfile.ZIP_DEFLATED) as template_zip:
+        template_zip.writestr('consumer_export.zip', consumer_export.getvalue())
+        template_zip.writestr('signature', b'')
+    return template.getvalue()
+
+
+@pytest.fixture(scope='module')
+def cloner():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    signing_key = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption(),
+    )
+    return ManifestCloner(
+        template={'default': make_template()}, private_key=private_key, signing_key=signing_key
+    )
+
+
+def read_clone(cloner, content):
+    manifest_zip = zipfile.ZipFile(content)
+    consumer_export = manifest_zip.read('consumer_export.zip')
+    cloner.private_key.public_key().verify(
+        manifest_zip.read('signature'), consumer_export, padding.PKCS1v15(), hashes.SHA256()
+    )
+    consumer_export_zip = zipfile.ZipFile(io.BytesIO(consumer_export))
+    members = {
+        name: consumer_export_zip.read(name).decode() for name in consumer_export_zip.namelist()
+    }
+    return json.loads(members.pop('export/consumer.json')), members
+
+
+@pytest.mark.parametrize('org_environment_access', [False, True])
+def test_manifest_clone(cloner, org_environment_access):
+    consumers = []
+    for _ in range(2):
+        consumer, members = read_clone(
+            cloner, cloner.manifest_clone(org_environment_access=org_environment_access)
+        )
+        assert members == MEMBERS
+        consumers.append(consumer)
+    assert consumers[0]['uuid'] != consumers[1]['uuid']
+    if org_environment_access:
+        assert consumers[0]['contentAccessMode'] == 'org_environment'
+        assert consumers[0]['owner']['contentAccessModeList'] == 'entitlement,org_environment'
+    else:
+        assert consumers[0]['contentAccessMode'] == 'entitlement'
+    # the template is not modified
+    assert cloner._clone_base('default')[1] == CONSUMER
+
+
+def test_manifest_pool(cloner):
+    pool = ManifestPool(cloner, size=2)
+    uuids = set()
+    try:
+        for _ in range(4):
+            # let the pool build its clones
+            wait(pool._ready.get((False, 'default'), []))
+            consumer, members = read_clone(cloner, pool.get())
+            assert members == MEMBERS
+            uuids.add(consumer['uuid'])
+    finally:
+        pool.close()
+    assert len(uuids) == 4
+    # the first clone fills the pool, the next ones are built ahead
+    assert pool.misses == 1
+    assert pool.hits == 3
@@ -0,0 +1,103 @@
+"""Tests for module ``robottelo.utils.metadata_index``."""
+
+import importlib.util
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+from robottelo.utils import metadata_index
+from robottelo.utils.metadata_index import MetadataIndex
+
+TEST_MODULE = '''"""Test module
+
+:CaseComponent: Repositories
+
+:Team: Phoenix-content
+"""
+from robottelo.utils.issue_handlers import is_open
+
+
+class TestRepository:
+    """Repository tests
+
+    :CaseImportance: High
+    """
+
+    def test_sync(self):
+        """Sync a repository
+
+        :BlockedBy: SAT-1, SAT-2
+
+        :BZ: 123456
+        """
+        if not is_open('BZ:123'):
+            pass
+
+
+def test_plain():
+    pass
+'''
+
+
+@pytest.fixture
+def test_module(tmp_path):
+    path = tmp_path.joinpath('test_indexed.py')
+    path.write_text(TEST_MODULE)
+    spec = importlib.util.spec_from_file_location('test_indexed', path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['test_indexed'] = module
+    spec.loader.exec_module(module)
+    yield module
+    sys.modules.pop('test_indexed')
+
+
+def test_metadata(test_module):
+    index = MetadataIndex(path=None)
+    assert index.doc_tokens(test_module)['component'] == ['Repositories']
+    assert index.doc_tokens(test_module)['team'] == ['Phoenix-content']
+    assert index.doc_tokens(test_module.TestRepository)['importance'] == ['High']
+    function = test_module.TestRepository.test_sync
+    assert index.doc_tokens(function)['blocked_by'] == ['SAT-1, SAT-2']
+    assert index.doc_tokens(function)['bz'] == ['123456']
+    assert index.source(function)['uses_is_open']
+    assert index.source(function)['not_is_open'] == [('BZ', '123')]
+    assert index.source(test_module)['component'] == ['Repositories']
+    assert index.doc_tokens(test_module.test_plain) is None
+    assert index.doc_tokens(None) is None
+
+
+def test_parsed_once(test_module):
+    index = MetadataIndex(path=None)
+    with mock.patch.object(metadata_index, 'parse', wraps=metadata_index.parse) as parse:
+        for _ in range(3):
+            index.metadata(test_module.TestRepository.test_sync)
+            index.metadata(test_module.TestRepository)
+    assert parse.call_count == 2
+
+
+def test_persisted(tmp_path, test_module):
+    index_file = tmp_path.joinpath('index.json')
+    index = MetadataIndex(path=index_file)
+    expected = index.metadata(test_module.TestRepository.test_sync)
+    index.save()
+    with mock.patch.object(metadata_index, 'parse') as parse:
+        index = MetadataIndex(path=index_file)
+        assert index.doc_tokens(test_module.TestRepository.test_sync) == expected['doc']
+    assert not parse.called
+    assert index.hits == 1
+
+
+def test_invalidated_on_change(tmp_path, test_module):
+    index_file = tmp_path.joinpath('index.json')
+    index = MetadataIndex(path=index_file)
+    index.metadata(test_module)
+    index.save()
+    module_file = tmp_path.joinpath('test_indexed.py')
+    module_file.write_text(TEST_MODULE.replace('Repositories', 'ContentViews'))
+    os.utime(module_file, ns=(0, 0))
+    index = MetadataIndex(path=index_file)
+    with mock.patch.object(metadata_index, 'parse', return_value={'doc': None}) as parse:
+        index.metadata(test_module)
+    assert parse.called
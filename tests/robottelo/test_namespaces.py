@@ -0,0 +1,68 @@
+"""Tests for module ``robottelo.host_helpers.namespaces``."""
+
+from unittest import mock
+
+import pytest
+
+from robottelo.cli.base import Base
+from robottelo.host_helpers.cli_factory import CLIFactory
+from robottelo.host_helpers.namespaces import LazyNamespace, cli_registry
+
+
+class ActivationKey(Base):
+    command_base = 'activation-key'
+
+
+class Org(Base):
+    command_base = 'organization'
+
+
+def make_namespace():
+    registry = mock.Mock(return_value={'ActivationKey': ActivationKey, 'Org': Org})
+    wrap = mock.Mock(side_effect=lambda name, cls: type(name, (cls,), {'hostname': 'sat'}))
+    return LazyNamespace(registry, wrap), wrap
+
+
+def test_lazy_creation():
+    namespace, wrap = make_namespace()
+    assert not wrap.called
+    org = namespace.Org
+    assert issubclass(org, Org)
+    assert org.hostname == 'sat'
+    # the wrapper is created once, the other classes are not created
+    assert namespace.Org is org
+    wrap.assert_called_once_with('Org', Org)
+
+
+def test_dir():
+    namespace, wrap = make_namespace()
+    assert {'ActivationKey', 'Org'} <= set(dir(namespace))
+    assert not wrap.called
+
+
+@pytest.mark.parametrize('name', ['Unknown', '_private'])
+def test_unknown_name(name):
+    namespace, wrap = make_namespace()
+    with pytest.raises(AttributeError):
+        getattr(namespace, name)
+    assert not hasattr(namespace, name)
+    assert not wrap.called
+
+
+def test_cli_registry():
+    registry = cli_registry()
+    assert registry['Org'].command_base == 'organization'
+    assert all(issubclass(cls, Base) for cls in registry.values())
+    assert 'Org' not in cli_registry('sm_')
+
+
+@pytest.mark.parametrize(
+    ('entity_name', 'cls'),
+    [('activation_key', ActivationKey), ('org', Org), ('ActivationKey', ActivationKey)],
+)
+def test_find_entity_class(entity_name, cls):
+    namespace, _ = make_namespace()
+    factory = CLIFactory.__new__(CLIFactory)
+    factory._satellite = mock.Mock(cli=namespace)
+    assert issubclass(factory._find_entity_class(entity_name), cls)
+    assert factory._find_entity_class('unknown') is None
@@ -0,0 +1,76 @@
+"""Tests for module ``robottelo.utils.remote_inspection``."""
+
+import hashlib
+import subprocess
+from unittest import mock
+
+import pytest
+
+from robottelo.exceptions import FileInspectionError
+from robottelo.host_helpers.contenthost_mixins import HostInfo
+from robottelo.host_helpers.satellite_mixins import ContentInfo
+from robottelo.utils import remote_inspection
+
+
+class LocalHost:
+    """Run the commands of a host locally"""
+
+    hostname = 'localhost'
+
+    def execute(self, command):
+        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+        return mock.Mock(status=result.returncode, stdout=result.stdout, stderr=result.stderr)
+
+
+def test_inspect_files(tmp_path):
+    paths = []
+    for index in range(5):
+        path = tmp_path.joinpath(f'file{index}.txt')
+        path.write_text(f'content {index}\n')
+        paths.append(str(path))
+    missing = str(tmp_path.joinpath('missing'))
+    with mock.patch.object(remote_inspection, 'BATCH_SIZE', 2):
+        results = remote_inspection.inspect(LocalHost(), 'path', [*paths, missing], workers=3)
+    assert [result.path for result in results] == [*paths, missing]
+    for index, result in enumerate(results[:-1]):
+        assert result.size == len(f'content {index}\n')
+        assert result.sum == hashlib.sha256(f'content {index}\n'.encode()).hexdigest()
+        assert result.info == 'ASCII text'
+        assert result.mime == 'text/plain'
+    assert results[-1].error == 'No such file or directory'
+
+
+def test_inspect_urls(tmp_path):
+    path = tmp_path.joinpath('file.txt')
+    path.write_text('content')
+    results = remote_inspection.inspect(
+        LocalHost(), 'url', [path.as_uri(), tmp_path.joinpath('missing').as_uri()], 'md5'
+    )
+    assert results[0].size == len('content')
+    assert results[0].sum == hashlib.md5(b'content').hexdigest()
+    assert 'error' in results[1]
+
+
+def test_inspect_fails():
+    with (
+        mock.patch.object(remote_inspection, 'PYTHON', 'false'),
+        pytest.raises(FileInspectionError),
+    ):
+        remote_inspection.inspect(LocalHost(), 'path', ['/etc/hosts'])
+
+
+def test_checksums_by_url(tmp_path):
+    class Host(LocalHost, HostInfo, ContentInfo):
+        pass
+
+    urls = []
+    for index in range(3):
+        path = tmp_path.joinpath(f'file{index}.rpm')
+        path.write_text(f'content {index}')
+        urls.append(path.as_uri())
+    assert Host().checksums_by_url(urls) == [
+        hashlib.md5(f'content {index}'.encode()).hexdigest() for index in range(3)
+    ]
+    missing = tmp_path.joinpath('missing.rpm').as_uri()
+    with pytest.raises(AssertionError, match='missing.rpm'):
+        Host().checksums_by_url([*urls, missing])
@@ -0,0 +1,171 @@
+"""Tests for module ``robottelo.utils.repodata``."""
+
+import functools
+import gzip
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import io
+import lzma
+import threading
+from unittest import mock
+from xml.etree import ElementTree
+
+import pytest
+
+from robottelo import content_info
+from robottelo.utils import repodata
+
+REPOMD = '''<?xml version="1.0" encoding="UTF-8"?>
+<repomd xmlns="http://linux.duke.edu/metadata/repo">
+  <revision>{}</revision>
+  <data type="primary"><location href="repodata/primary.xml.gz"/></data>
+  <data type="updateinfo"><location href="repodata/updateinfo.xml.xz"/></data>
+  <data type="modules"><location href="repodata/modules.yaml.gz"/></data>
+</repomd>
+'''
+PRIMARY = '''<?xml version="1.0" encoding="UTF-8"?>
+<metadata xmlns="http://linux.duke.edu/metadata/common" packages="2">
+<package type="rpm">
+  <name>walrus</name><arch>noarch</arch>
+  <version epoch="0" ver="0.71" rel="1"/>
+  <checksum type="sha256" pkgid="YES">abc</checksum>
+  <location href="Packages/w/walrus-0.71-1.noarch.rpm"/>
+</package>
+<package type="rpm">
+  <name>walrus</name><arch>noarch</arch>
+  <version epoch="1" ver="5.21" rel="1"/>
+  <checksum type="sha256" pkgid="YES">def</checksum>
+  <location href="Packages/w/walrus-5.21-1.noarch.rpm"/>
+</package>
+</metadata>
+'''
+UPDATEINFO = '''<?xml version="1.0" encoding="UTF-8"?>
+<updates>
+<update from="errata@redhat.com" status="stable" type="enhancement" version="1">
+  <id>RHEA-2012:0055</id>
+  <title>Walrus update</title>
+  <severity>None</severity>
+  <pkglist><collection short="">
+    <package arch="noarch" epoch="1" name="walrus" release="1" version="5.21">
+      <filename>walrus-5.21-1.noarch.rpm</filename>
+    </package>
+  </collection></pkglist>
+</update>
+</updates>
+'''
+MODULES = '''---
+document: modulemd
+version: 2
+data:
+  name: walrus
+  stream: "5.21"
+  version: 20180707144203
+  context: c0ffee42
+  arch: noarch
+  artifacts:
+    rpms:
+    - walrus-1:5.21-1.noarch
+...
+---
+document: modulemd-defaults
+version: 1
+data:
+  module: walrus
+  stream: "5.21"
+...
+'''
+
+
+def publish(path, revision='1'):
+    path.joinpath('repodata').mkdir(exist_ok=True)
+    path.joinpath('repodata', 'repomd.xml').write_text(REPOMD.format(revision))
+    path.joinpath('repodata', 'primary.xml.gz').write_bytes(gzip.compress(PRIMARY.encode()))
+    path.joinpath('repodata', 'updateinfo.xml.xz').write_bytes(lzma.compress(UPDATEINFO.encode()))
+    path.joinpath('repodata', 'modules.yaml.gz').write_bytes(gzip.compress(MODULES.encode()))
+
+
+@pytest.fixture
+def repo_url(tmp_path):
+    publish(tmp_path)
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(tmp_path))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True
+    )
+    thread.start()
+    repodata._indexes.clear()
+    with (
+        mock.patch.object(SimpleHTTPRequestHandler, 'log_message'),
+        mock.patch.object(repodata, 'CACHE_DIR', tmp_path.joinpath('cache')),
+    ):
+        yield f'http://127.0.0.1:{server.server_port}/'
+    server.shutdown()
+    server.server_close()
+
+
+def test_nevra():
+    assert repodata.nevra('walrus', '0', '0.71', '1', 'noarch') == 'walrus-0.71-1.noarch'
+    assert repodata.nevra('walrus', '1', '5.21', '1', 'noarch') == 'walrus-1:5.21-1.noarch'
+
+
+def test_get_repodata(repo_url):
+    data = repodata.get_repodata(repo_url)
+    assert data.revision == '1'
+    assert data.packages_by_name('walrus') == ['walrus-0.71-1.noarch', 'walrus-1:5.21-1.noarch']
+    assert data.package('walrus-0.71-1.noarch').location == 'Packages/w/walrus-0.71-1.noarch.rpm'
+    assert data.package('walrus-0.72-1.noarch') is None
+    assert data.erratum('RHEA-2012:0055').type == 'enhancement'
+    assert data.erratum_packages('RHEA-2012:0055') == ['walrus-1:5.21-1.noarch']
+    assert data.package_errata('walrus-1:5.21-1.noarch') == ['RHEA-2012:0055']
+    assert data.package_errata('walrus-0.71-1.noarch') == []
+    assert list(data.module_streams) == ['walrus:5.21']
+    assert data.module_stream_artifacts('walrus:5.21') == ['walrus-1:5.21-1.noarch']
+
+
+def test_get_repodata_cached_by_revision(repo_url, tmp_path):
+    data = repodata.get_repodata(repo_url)
+    assert repodata.get_repodata(repo_url) is data
+    repodata._indexes.clear()
+    tmp_path.joinpath('repodata', 'primary.xml.gz').unlink()
+    # read from the cache file, the repodata files are not downloaded again
+    assert repodata.get_repodata(repo_url).packages == data.packages
+    publish(tmp_path, revision='2')
+    assert repodata.get_repodata(repo_url).revision == '2'
+    assert len(list(tmp_path.joinpath('cache').iterdir())) == 2
+
+
+def test_iter_repodata_elements_drops_parsed_elements():
+    package = '<package><name>walrus{}</name></package>'
+    stream = io.BytesIO(
+        f'<metadata>{"".join(map(package.format, range(2000)))}</metadata>'.encode()
+    )
+    roots = []
+    iterparse = ElementTree.iterparse
+
+    def tracking_iterparse(*args, **kwargs):
+        for event, element in iterparse(*args, **kwargs):
+            if not roots:
+                roots.append(element)
+            yield event, element
+
+    with mock.patch.object(content_info.ElementTree, 'iterparse', tracking_iterparse):
+        sizes = [len(roots[0]) for _ in content_info.iter_repodata_elements(stream, 'package')]
+    assert len(sizes) == 2000
+    # only the packages of the last chunk read are in the tree
+    assert max(sizes) < 500
+    assert not len(roots[0])
+
+
+def test_cache_pruned(repo_url, tmp_path):
+    cache_dir = tmp_path.joinpath('cache')
+    with mock.patch.object(repodata, 'CACHE_MAX_FILES', 2):
+        for revision in '123':
+            publish(tmp_path, revision=revision)
+            repodata.get_repodata(repo_url)
+    # the least recently used indexes are removed
+    assert sorted(path.name.rsplit('-', 1)[1] for path in cache_dir.iterdir()) == [
+        '2.json',
+        '3.json',
+    ]
+    repodata.clear_cache()
+    assert not list(cache_dir.iterdir())
+    assert not repodata._indexes
@@ -0,0 +1,121 @@
+"""Tests for module ``robottelo.host_helpers.repository_mixins``."""
+
+import itertools
+import threading
+from unittest import mock
+
+import pytest
+
+from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
+
+
+def make_satellite():
+    satellite = mock.Mock(hostname='sat.example.com')
+    ids = itertools.count(1)
+    satellite.cli_factory.make_product_wait.return_value = {'id': 1, 'name': 'product'}
+    satellite.cli_factory.make_repository.side_effect = lambda options: {
+        'id': next(ids),
+        'url': options['url'],
+    }
+    satellite.cli_factory.make_content_view.return_value = {'id': 2}
+    satellite.cli_factory.make_activation_key.return_value = {'id': 3, 'name': 'key'}
+    satellite.cli.LifecycleEnvironment.info.return_value = {'id': 4, 'name': 'Library'}
+    satellite.cli.ContentView.info.return_value = {'id': 2, 'versions': [{'id': 5}]}
+    satellite.cli.Org.info.return_value = {'id': 6, 'label': 'org'}
+    satellite.api.Repository.side_effect = lambda id: mock.Mock(
+        sync=mock.Mock(return_value={'id': f'task-{id}'})
+    )
+    satellite.is_sca_mode_enabled.return_value = True
+    return satellite
+
+
+@pytest.fixture
+def helpers():
+    satellite = make_satellite()
+    return mock.Mock(satellite=satellite, **dict(initiate_repo_helpers(satellite)))
+
+
+def make_collection(helpers):
+    return helpers.RepositoryCollection(
+        repositories=[
+            helpers.YumRepository(url='http://repo.example.com/1'),
+            helpers.YumRepository(url='http://repo.example.com/2'),
+        ]
+    )
+
+
+def called(satellite, name):
+    return [call for call in satellite.mock_calls if call[0] == name]
+
+
+def test_setup_content_pipelined(helpers):
+    satellite = helpers.satellite
+    data = make_collection(helpers).setup_content(6, 4, pipelined=True)
+    assert data['activation_key']['name'] == 'key'
+    assert not called(satellite, 'cli.Repository.synchronize')
+    # the syncs are waited for together, right before the content view is published
+    wait = called(satellite, 'task_watcher.wait')
+    assert wait == [mock.call.task_watcher.wait([{'id': 'task-1'}, {'id': 'task-2'}], timeout=4800)]
+    names = [call[0] for call in satellite.mock_calls]
+    assert names.index('task_watcher.wait') + 1 == names.index('cli.ContentView.publish')
+
+
+def test_setup_content_not_pipelined(helpers):
+    satellite = helpers.satellite
+    make_collection(helpers).setup_content(6, 4, pipelined=False)
+    assert len(called(satellite, 'cli.Repository.synchronize')) == 2
+    assert not called(satellite, 'task_watcher.wait')
+
+
+def test_setup_content_shared_runs(helpers):
+    satellite = helpers.satellite
+    runs = helpers.ContentSetupRuns()
+    first, second = make_collection(helpers), make_collection(helpers)
+    data = first.setup_content(6, 4, pipelined=True, shared_runs=runs)
+    assert second.setup_content(6, 4, pipelined=True, shared_runs=runs) == data
+    assert second.repos_info == first.repos_info
+    assert [repo.repo_info for repo in second] == [repo.repo_info for repo in first]
+    assert len(called(satellite, 'cli_factory.make_content_view')) == 1
+    # other arguments, other runs or no runs do a setup of their own
+    make_collection(helpers).setup_content(7, 4, pipelined=True, shared_runs=runs)
+    make_collection(helpers).setup_content(
+        6, 4, pipelined=True, shared_runs=helpers.ContentSetupRuns()
+    )
+    make_collection(helpers).setup_content(6, 4, pipelined=True)
+    assert len(called(satellite, 'cli_factory.make_content_view')) == 4
+
+
+def test_setup_content_shared_runs_concurrent(helpers):
+    satellite = helpers.satellite
+    runs = helpers.ContentSetupRuns()
+    publishing, publish = threading.Event(), threading.Event()
+
+    def wait(*args, **kwargs):
+        publishing.set()
+        assert publish.wait(timeout=5)
+
+    satellite.task_watcher.wait.side_effect = wait
+    first = make_collection(helpers)
+    thread = threading.Thread(
+        target=first.setup_content, args=(6, 4), kwargs={'pipelined': True, 'shared_runs': runs}
+    )
+    thread.start()
+    assert publishing.wait(timeout=5)
+    threading.Timer(0.1, publish.set).start()
+    # waits for the run in progress
+    second = make_collection(helpers)
+    second.setup_content(6, 4, pipelined=True, shared_runs=runs)
+    thread.join(timeout=5)
+    assert second.setup_content_data is first.setup_content_data
+    assert len(called(satellite, 'cli_factory.make_content_view')) == 1
+
+
+def test_setup_content_shared_runs_failed(helpers):
+    satellite = helpers.satellite
+    runs = helpers.ContentSetupRuns()
+    satellite.cli.ContentView.publish.side_effect = [RuntimeError('publish failed'), None]
+    with pytest.raises(RuntimeError):
+        make_collection(helpers).setup_content(6, 4, pipelined=True, shared_runs=runs)
+    # a failed run is not shared, the next collection does it again
+    make_collection(helpers).setup_content(6, 4, pipelined=True, shared_runs=runs)
+    assert len(called(satellite, 'cli_factory.make_content_view')) == 2
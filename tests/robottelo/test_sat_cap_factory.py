@@ -0,0 +1,74 @@
+"""Tests for module ``pytest_fixtures.core.sat_cap_factory``."""
+
+from unittest import mock
+
+import pytest
+
+from pytest_fixtures.core import sat_cap_factory
+
+
+def default_capsule(capsule_factory):
+    cap = capsule_factory()
+    yield cap
+
+
+def retried_capsule(capsule_factory):
+    return capsule_factory(retry_limit=1, delay=60)
+
+
+def custom_capsule(capsule_factory):
+    cap = capsule_factory()
+    return cap, capsule_factory(workflow='deploy-custom')
+
+
+@pytest.mark.parametrize(
+    ('func', 'expected'),
+    [
+        (default_capsule, True),
+        (retried_capsule, True),
+        (custom_capsule, False),
+        (sat_cap_factory.large_capsule_host, False),
+        (sat_cap_factory.capsule_host, True),
+        (None, True),
+    ],
+)
+def test_uses_factory_pool(func, expected):
+    func = getattr(func, '__wrapped__', func)
+    assert sat_cap_factory._uses_factory_pool(func, 'capsule_factory') is expected
+
+
+def make_item(nodeid, function=default_capsule, fixtures=()):
+    item = mock.Mock(nodeid=nodeid, function=function)
+    item.get_closest_marker.return_value = mock.Mock()
+    argnames = ['capsule_factory'] if function else []
+    item._fixtureinfo.argnames = argnames
+    item._fixtureinfo.name2fixturedefs = {
+        name: [mock.Mock(argnames=['capsule_factory'], scope=scope, func=func)]
+        for name, scope, func in fixtures
+    }
+    item.fixturenames = argnames + [name for name, _, _ in fixtures] + ['capsule_factory']
+    return item
+
+
+@pytest.mark.parametrize('workers', [None, '2'])
+def test_factory_demand(monkeypatch, workers):
+    if workers:
+        monkeypatch.setenv('PYTEST_XDIST_WORKER_COUNT', workers)
+    else:
+        monkeypatch.delenv('PYTEST_XDIST_WORKER_COUNT', raising=False)
+    module_fixture = ('module_capsule', 'module', default_capsule)
+    request = mock.Mock()
+    request.config.option.markexpr = ''
+    request.session.items = [
+        make_item('tests/test_a.py::test_1'),
+        make_item('tests/test_a.py::test_2', function=custom_capsule),
+        make_item('tests/test_b.py::test_1', function=None, fixtures=[module_fixture]),
+        make_item('tests/test_b.py::test_2', function=None, fixtures=[module_fixture]),
+        make_item(
+            'tests/test_c.py::test_1',
+            function=None,
+            fixtures=[('large_capsule', 'function', custom_capsule)],
+        ),
+    ]
+    # test_a.py::test_1 and the module fixture of test_b.py
+    assert sat_cap_factory._factory_demand(request, 'capsule_factory') == (1 if workers else 2)
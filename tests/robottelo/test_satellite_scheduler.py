@@ -0,0 +1,77 @@
+"""Tests for module ``robottelo.utils.satellite_scheduler``."""
+
+import json
+import time
+
+import pytest
+
+from robottelo.utils.satellite_scheduler import SatelliteScheduler
+
+HOSTNAMES = ['sat1.example.com', 'sat2.example.com', 'sat3.example.com']
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    return tmp_path.joinpath('satellite_leases.json')
+
+
+def scheduler(state_file, worker_id, task_counter=None):
+    return SatelliteScheduler(
+        HOSTNAMES, worker_id, state_file=state_file, task_counter=task_counter
+    )
+
+
+def test_acquire_spreads_workers(state_file):
+    hostnames = [scheduler(state_file, f'gw{index}').acquire() for index in range(6)]
+    assert sorted(hostnames) == sorted(HOSTNAMES * 2)
+
+
+def test_acquire_ignores_expired_leases(state_file):
+    state_file.write_text(
+        json.dumps(
+            {
+                'leases': {
+                    'gw9': {'hostname': 'sat1.example.com', 'expires': time.time() - 1},
+                    'gw8': {'hostname': 'sat2.example.com', 'expires': time.time() + 60},
+                },
+                'load': {},
+            }
+        )
+    )
+    assert scheduler(state_file, 'gw0').acquire() == 'sat1.example.com'
+    assert 'gw9' not in json.loads(state_file.read_text())['leases']
+
+
+def test_acquire_avoids_busy_satellite(state_file):
+    tasks = {'sat1.example.com': 50, 'sat2.example.com': 0, 'sat3.example.com': 20}
+    worker = scheduler(state_file, 'gw0', task_counter=tasks.get)
+    assert worker.acquire() == 'sat2.example.com'
+
+
+def test_renew_moves_away_from_slow_satellite(state_file):
+    workers = [scheduler(state_file, f'gw{index}') for index in range(3)]
+    for worker in workers:
+        worker.acquire()
+    slow = workers[0]
+    slow_hostname = slow.hostname
+    # the other Satellites run their tests faster
+    for worker in workers[1:]:
+        worker.renew(tests=10, duration=10)
+    assert slow.renew(tests=10, duration=100) != slow_hostname
+
+
+def test_renew_stays_when_pinned(state_file):
+    workers = [scheduler(state_file, f'gw{index}') for index in range(3)]
+    for worker in workers:
+        worker.acquire()
+    for worker in workers[1:]:
+        worker.renew(tests=10, duration=10)
+    hostname = workers[0].hostname
+    assert workers[0].renew(tests=10, duration=100, may_move=False) == hostname
+
+
+def test_release(state_file):
+    worker = scheduler(state_file, 'gw0')
+    worker.acquire()
+    worker.release()
+    assert json.loads(state_file.read_text())['leases'] == {}
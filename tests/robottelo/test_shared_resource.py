@@ -4,6 +4,9 @@ import random
 from threading import Thread
 import time
 
+import pytest
+
+from robottelo.utils import shared_resource
 from robottelo.utils.shared_resource import SharedResource
 
 
@@ -59,3 +62,59 @@ def test_shared_resource_multithreading():
     t2.join()
 
     assert not Path("/tmp/test_resource_th.shared").exists()
+
+
+@pytest.mark.skipif(shared_resource._libc is None, reason="inotify is not available")
+def test_shared_resource_wakes_up_waiters():
+    """Waiting watchers resume as soon as the main watcher is done, without polling delay."""
+    resources = []
+
+    def run(delay):
+        time.sleep(delay)
+        with SharedResource("test_resource_wakeup", upgrade_action) as resource:
+            resources.append(resource)
+            resource.ready()
+
+    threads = [Thread(target=run, args=(delay,)) for delay in (0, 0.5, 0.5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    waiters = [resource for resource in resources if not resource.is_main]
+    assert len(waiters) == 2
+    for resource in waiters:
+        assert resource.handover_latencies
+        assert max(resource.handover_latencies) < shared_resource.POLL_INTERVAL / 2
+    assert not Path("/tmp/test_resource_wakeup.shared").exists()
+
+
+def test_shared_resource_take_over():
+    """An other watcher performs a recoverable action that failed."""
+    calls = []
+    errors = []
+
+    def flaky_action():
+        calls.append(time.time())
+        if len(calls) == 1:
+            raise RuntimeError("action failed")
+
+    def run(delay):
+        time.sleep(delay)
+        try:
+            with SharedResource(
+                "test_resource_recover", flaky_action, action_is_recoverable=True
+            ) as resource:
+                resource.ready()
+        except RuntimeError as err:
+            errors.append(err)
+
+    threads = [Thread(target=run, args=(delay,)) for delay in (0, 0.5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 2
+    assert len(errors) == 1
+    assert not Path("/tmp/test_resource_recover.shared").exists()
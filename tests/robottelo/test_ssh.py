@@ -1,8 +1,12 @@
 """Tests for module ``robottelo.utils.ssh``."""
 
+import time
 from unittest import mock
 
+import pytest
+
 from robottelo import ssh
+from robottelo.utils import ssh as utils_ssh
 
 
 class MockChannel:
@@ -102,3 +106,79 @@ class TestSSH:
 
         ret = ssh.command('ls -la')
         assert ret[1].cmd == 'ls -la'
+
+
+class PoolClient:
+    """A fake pooled client, counting connections and closes."""
+
+    def __init__(self, hostname, username, password, port):
+        self.hostname = hostname
+        self.username = username
+        self.password = password
+        self.port = port
+        self._session = None
+        self.closed = False
+
+    def connect(self):
+        self._session = mock.Mock(sock=None, session=None)
+
+    def close(self):
+        self.closed = True
+        self._session = None
+
+
+class TestSSHConnectionPool:
+    """Tests for ``robottelo.utils.ssh.SSHConnectionPool``."""
+
+    @pytest.fixture
+    def pool(self):
+        pool = utils_ssh.SSHConnectionPool(max_per_host=2, idle_timeout=60, acquire_timeout=0)
+        with mock.patch.object(utils_ssh.SSHConnectionPool, '_new_client', PoolClient):
+            yield pool
+
+    def test_reuse_session(self, pool):
+        client = pool.acquire('example.com', 'root', 'pass')
+        pool.release(client)
+        assert pool.acquire('example.com', 'root', 'pass') is client
+        stats = pool.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+
+    def test_keyed_by_host_user_port(self, pool):
+        client = pool.acquire('example.com', 'root', 'pass')
+        pool.release(client)
+        assert pool.acquire('example.com', 'root', 'pass', port=2222) is not client
+        assert pool.acquire('other.example.com', 'root', 'pass') is not client
+        assert pool.acquire('example.com', 'admin', 'pass') is not client
+
+    def test_dead_session_replaced(self, pool):
+        client = pool.acquire('example.com', 'root', 'pass')
+        pool.release(client)
+        client.close()
+        assert pool.acquire('example.com', 'root', 'pass') is not client
+        assert pool.stats()['evictions'] == 1
+
+    def test_discarded_session_closed(self, pool):
+        client = pool.acquire('example.com', 'root', 'pass')
+        pool.release(client, discard=True)
+        assert client.closed
+        assert pool.acquire('example.com', 'root', 'pass') is not client
+
+    def test_sessions_capped_per_host(self, pool):
+        pool.acquire('example.com', 'root', 'pass')
+        pool.acquire('example.com', 'root', 'pass')
+        with pytest.raises(TimeoutError):
+            pool.acquire('example.com', 'root', 'pass')
+        # other hosts are not affected by the cap
+        pool.acquire('other.example.com', 'root', 'pass')
+
+    def test_idle_session_evicted(self, pool):
+        client = pool.acquire('example.com', 'root', 'pass')
+        pool.release(client)
+        with mock.patch('robottelo.utils.ssh.time.monotonic', return_value=time.monotonic() + 61):
+            assert pool.acquire('example.com', 'root', 'pass') is not client
+        assert client.closed
+
+    def test_foreign_client_ignored(self, pool):
+        pool.release(MockSSHClient())
+        assert pool.stats()['in_use'] == 0
@@ -0,0 +1,94 @@
+"""Tests for module ``robottelo.host_helpers.task_watcher``."""
+
+import threading
+import time
+from unittest import mock
+
+from nailgun.entity_mixins import TaskFailedError, TaskTimedOutError
+import pytest
+
+from robottelo.host_helpers.task_watcher import TaskWatcher
+
+
+class FakeTasks:
+    """Fake the tasks API of a Satellite, recording the searched ids"""
+
+    def __init__(self):
+        self.tasks = {}
+        self.searches = []
+        self.lock = threading.Lock()
+
+    def add(self, task_id, state='running', result='pending'):
+        self.tasks[task_id] = {'id': task_id, 'state': state, 'result': result}
+
+    def finish(self, task_id, result='success'):
+        with self.lock:
+            self.tasks[task_id].update(state='stopped', result=result)
+
+    def search_json(self, query):
+        ids = query['search'].split('(')[1].rstrip(')').split(',')
+        with self.lock:
+            self.searches.append(ids)
+            return {'results': [dict(self.tasks[task_id]) for task_id in ids]}
+
+
+@pytest.fixture
+def fake_tasks():
+    return FakeTasks()
+
+
+@pytest.fixture
+def watcher(fake_tasks):
+    satellite = mock.Mock(hostname='sat.example.com')
+    satellite.api.ForemanTask.return_value = fake_tasks
+    return TaskWatcher(satellite, min_interval=0.01, max_interval=0.05)
+
+
+def test_tasks_searched_together(watcher, fake_tasks):
+    for task_id in ('a', 'b', 'c'):
+        fake_tasks.add(task_id)
+    threading.Timer(0.1, lambda: [fake_tasks.finish(task_id) for task_id in 'abc']).start()
+    results = watcher.wait(['a', {'id': 'b'}, mock.Mock(id='c')], timeout=5)
+    assert [task['id'] for task in results] == ['a', 'b', 'c']
+    # once all of them are watched, every search covers the three tasks
+    assert sorted(fake_tasks.searches[-1]) == ['a', 'b', 'c']
+    assert watcher.searches == len(fake_tasks.searches)
+
+
+def test_waiters_share_futures(watcher, fake_tasks):
+    fake_tasks.add('a')
+    assert watcher.watch('a') is watcher.watch('a')
+    fake_tasks.finish('a')
+    assert watcher.watch('a').result(timeout=5)['result'] == 'success'
+
+
+def test_failed_task(watcher, fake_tasks):
+    fake_tasks.add('a', state='stopped', result='error')
+    with pytest.raises(TaskFailedError):
+        watcher.wait(['a'], timeout=5)
+    assert watcher.wait(['a'], timeout=5, must_succeed=False)[0]['result'] == 'error'
+
+
+def test_timeout(watcher, fake_tasks):
+    fake_tasks.add('a')
+    with pytest.raises(TaskTimedOutError):
+        watcher.wait(['a'], timeout=0.1)
+    # the timed out task is not polled anymore
+    assert not watcher._futures
+    searches = len(fake_tasks.searches)
+    time.sleep(0.2)
+    assert len(fake_tasks.searches) == searches
+
+
+def test_timeout_other_waiter(watcher, fake_tasks):
+    fake_tasks.add('a')
+    waiter = threading.Thread(target=watcher.wait, args=(['a'],), kwargs={'timeout': 5})
+    waiter.start()
+    with pytest.raises(TaskTimedOutError):
+        watcher.wait(['a'], timeout=0.1)
+    # the task is still watched for the other waiter
+    assert 'a' in watcher._futures
+    fake_tasks.finish('a')
+    waiter.join(timeout=5)
+    assert not waiter.is_alive()
+    assert not watcher._futures